@@ -111,6 +111,16 @@ def test_categorical_dtype() -> None:
     assert metrics["n"] == 4
 
 
+def test_log_arrow_table() -> None:
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"col1": [1, 2, None], "col2": ["a", "b", "b"]})
+
+    view = why.log(table).view()
+    assert view.get_column("col1").get_metric("counts").to_summary_dict()["null"] == 1
+    assert view.get_column("col1").get_metric("ints").to_summary_dict() == {"max": 2, "min": 1}
+    assert view.get_column("col2").get_metric("cardinality").estimate == pytest.approx(2, 0.1)
+
+
 def test_roundtrip_resultset(tmp_path: Any) -> None:
     d = {"col1": [1, 2], "col2": [3.0, 4.0], "col3": ["a", "b"]}
     df = pd.DataFrame(data=d)
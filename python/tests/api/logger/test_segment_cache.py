@@ -0,0 +1,138 @@
+import os
+from datetime import datetime, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+import whylogs as why
+from whylogs.api.logger.segment_cache import SegmentCache
+from whylogs.api.logger.segment_processing import segment_processing
+from whylogs.core.dataset_profile import DatasetProfile
+from whylogs.core.model_performance_metrics import ModelPerformanceMetrics
+from whylogs.core.schema import DatasetSchema
+from whylogs.core.segment import Segment
+from whylogs.core.segmentation_partition import segment_on_column
+from whylogs.core.view.dataset_profile_view import DatasetProfileView
+
+
+def _segment_counts(results: Any) -> dict:
+    counts = dict()
+    for segment in results.segments():
+        profile = results.profile(segment)
+        view = profile.view() if hasattr(profile, "view") else profile
+        counts[segment.key] = view.get_column("col2").get_metric("counts").n.value
+    return counts
+
+
+def _log_batches(cache: SegmentCache, schema: DatasetSchema) -> None:
+    for batch in range(4):
+        df = pd.DataFrame({"col1": [(batch + i) % 5 for i in range(20)], "col2": list(range(20))})
+        segment_processing(schema, df, segment_cache=cache)
+
+
+def test_segment_cache_spills_least_recently_used(tmp_path: Any) -> None:
+    schema = DatasetSchema(segments=segment_on_column("col1"))
+    cache = SegmentCache(schema, max_segments=2, spill_dir=str(tmp_path))
+    _log_batches(cache, schema)
+
+    assert len(cache.get_segments()) == 2
+    assert cache.spilled_segments == 5
+    spill_folders = os.listdir(tmp_path)
+    assert len(spill_folders) == 1
+    assert os.listdir(os.path.join(tmp_path, spill_folders[0]))
+
+    unbounded = SegmentCache(schema)
+    _log_batches(unbounded, schema)
+
+    timestamp = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    results = cache.flush(timestamp)
+    assert _segment_counts(results) == _segment_counts(unbounded.flush(timestamp))
+    assert sum(_segment_counts(results).values()) == 80
+    for segment in results.segments():
+        assert results.profile(segment).dataset_timestamp == timestamp
+
+    # spilled profiles are removed once merged back and the cache starts over
+    assert os.listdir(tmp_path) == []
+    assert cache.spilled_segments == 0
+    assert not cache.get_segments()
+
+
+def test_segment_cache_flush_returns_views_for_spilled_segments() -> None:
+    schema = DatasetSchema(segments=segment_on_column("col1"))
+    cache = SegmentCache(schema, max_segments=1)
+    for key in ["a", "b"]:
+        segment_processing(schema, row={"col1": key, "col2": 1}, segment_cache=cache)
+    assert cache.spilled_segments == 1
+
+    results = cache.flush(None)
+    profiles = {segment.key: results.profile(segment) for segment in results.segments()}
+    assert isinstance(profiles[("a",)], DatasetProfileView)
+    assert isinstance(profiles[("b",)], DatasetProfile)
+    for segment in results.segments():
+        assert results.view(segment).get_column("col2").get_metric("counts").n.value == 1
+
+    # only the segment that stayed in memory can keep tracking
+    profiles[("b",)].track({"col1": "b", "col2": 2})
+    assert not hasattr(profiles[("a",)], "track")
+
+
+def test_segment_cache_keeps_recently_used_segment() -> None:
+    schema = DatasetSchema(segments=segment_on_column("col1"))
+    cache = SegmentCache(schema, max_segments=2)
+    for key in ["a", "b", "a", "c"]:
+        segment_processing(schema, row={"col1": key, "col2": 1}, segment_cache=cache)
+
+    assert sorted(segment.key for segment in cache.get_segments()) == [("a",), ("c",)]
+    assert cache.spilled_segments == 1
+    cache.flush(None)
+
+
+def test_segment_cache_spilled_segments_keep_dataset_metrics() -> None:
+    schema = DatasetSchema(segments=segment_on_column("col1"))
+    cache = SegmentCache(schema, max_segments=1)
+    for key in ["a", "b"]:
+        profile = cache.get_or_create_matching_profile(Segment((key,), schema.segments["col1"].id))
+        profile.track({"col1": key, "col2": 1})
+        profile.add_model_performance_metrics(ModelPerformanceMetrics())
+    assert cache.spilled_segments == 1
+
+    results = cache.flush(None)
+    timestamp = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    results.set_dataset_timestamp(timestamp)
+    for segment in results.segments():
+        profile = results.profile(segment)
+        assert profile.dataset_timestamp == timestamp
+        view = profile.view() if hasattr(profile, "view") else profile
+        assert isinstance(view.model_performance_metrics, ModelPerformanceMetrics)
+
+
+def test_segment_cache_rejects_empty_budget() -> None:
+    with pytest.raises(ValueError):
+        SegmentCache(DatasetSchema(segments=segment_on_column("col1")), max_segments=0)
+
+
+def test_rolling_logger_with_bounded_segment_cache(tmp_path: Any) -> None:
+    rolling_callback = MagicMock()
+    schema = DatasetSchema(segments=segment_on_column("col1"))
+    rolling_logger = why.logger(
+        schema=schema,
+        mode="rolling",
+        interval=60,
+        when="S",
+        callback=rolling_callback,
+        max_cached_segments=3,
+        spill_dir=str(tmp_path),
+    )
+    for i in range(50):
+        rolling_logger.log({"col1": i % 10, "col2": i})
+    rolling_logger.close()
+
+    assert rolling_callback.call_count == 10
+    total = sum(
+        call.args[1].profile_view.get_column("col2").get_metric("counts").n.value
+        for call in rolling_callback.call_args_list
+    )
+    assert total == 50
+    assert os.listdir(tmp_path) == []
@@ -378,3 +378,72 @@ def test_segment_merge_different_columns() -> None:
             assert segmented_view._columns["A"] is not None
             assert segmented_view._columns["B"] is not None
         assert segmented_view._columns["A"]._metrics["cardinality"].estimate == pytest.approx(1.0)
+
+
+def test_segments_match_groupby_profiles() -> None:
+    input_rows = 200
+    df = pd.DataFrame(
+        {
+            "key1": [i % 4 if i % 17 else None for i in range(input_rows)],
+            "key2": [f"x{i % 3}" for i in range(input_rows)],
+            "ints": list(range(input_rows)),
+            "floats": [i * 1.5 if i % 5 else float("nan") for i in range(input_rows)],
+            "mixed": [str(i) if i % 3 else (i if i % 2 else None) for i in range(input_rows)],
+            "flags": [i % 3 == 0 for i in range(input_rows)],
+        }
+    )
+    partition = SegmentationPartition(name="key1,key2", mapper=ColumnMapperFunction(col_names=["key1", "key2"]))
+    schema = DatasetSchema(segments={partition.name: partition})
+    results: SegmentedResultSet = why.log(df, schema=schema)
+
+    grouped = df.groupby(["key1", "key2"])
+    # rows with a null key aren't in any segment, pandas lists their group but can't get it
+    groups = [group for group in grouped.groups.keys() if not pd.isnull(group[0])]
+    assert [segment.key for segment in results.segments()] == [tuple(str(k) for k in group) for group in groups]
+    for segment, group in zip(results.segments(), groups):
+        expected = why.log(grouped.get_group(group)).view()
+        view = results.profile(segment).view()
+        for name in df.columns:
+            summary = view.get_column(name).to_summary_dict()
+            expected_summary = expected.get_column(name).to_summary_dict()
+            for key, value in expected_summary.items():
+                if key.startswith(("counts/", "types/", "cardinality/", "frequent_items/")) or key in [
+                    "distribution/n",
+                    "distribution/max",
+                    "distribution/min",
+                ]:
+                    assert repr(summary[key]) == repr(value), f"{segment.key} {name} {key}"
+                elif key in ["distribution/mean", "distribution/stddev"]:
+                    assert summary[key] == pytest.approx(value), f"{segment.key} {name} {key}"
+
+
+def test_many_partitions_match_single_partitions() -> None:
+    input_rows = 120
+    df = pd.DataFrame({f"key{k}": [(i * (k + 1)) % (k + 2) for i in range(input_rows)] for k in range(12)})
+    df["value"] = [i * 0.5 for i in range(input_rows)]
+    # a non unique index, the filters still have to select the right rows
+    df.index = [i % 7 for i in range(input_rows)]
+    partitions = {}
+    for k in range(12):
+        partitions.update(segment_on_column(f"key{k}"))
+    partitions["key0"].filter = SegmentFilter(filter_function=lambda df: df.value > 20)
+    partitions["key1"].filter = SegmentFilter(query_string="value < 10")
+
+    results: SegmentedResultSet = why.log(df, schema=DatasetSchema(segments=partitions))
+
+    assert len(results.partitions) == 12
+    for name, partition in partitions.items():
+        single: SegmentedResultSet = why.log(df, schema=DatasetSchema(segments={name: partition}))
+        segments = results.segments_in_partition(partition)
+        assert [segment.key for segment in segments] == [segment.key for segment in single.segments()]
+        for segment in segments:
+            view = results.profile(segment).view().get_column("value")
+            expected = single.profile(segment).view().get_column("value")
+            assert view.get_metric("counts").n.value == expected.get_metric("counts").n.value
+            assert view.get_metric("distribution").mean.value == expected.get_metric("distribution").mean.value
+    for name, expected_count in [("key0", 79), ("key1", 20), ("key2", input_rows)]:
+        counts = [
+            results.profile(segment).view().get_column("value").get_metric("counts").n.value
+            for segment in results.segments_in_partition(partitions[name])
+        ]
+        assert sum(counts) == expected_count
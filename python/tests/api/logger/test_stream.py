@@ -0,0 +1,134 @@
+import threading
+import time
+from typing import Any, Iterator
+
+import pandas as pd
+import pytest
+
+import whylogs as why
+from whylogs.api.logger.stream import _ReadAhead
+from whylogs.core.schema import DatasetSchema
+from whylogs.core.segmentation_partition import segment_on_column
+
+
+def _data(num_rows: int = 1000) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ints": list(range(num_rows)),
+            "floats": [i / 10 for i in range(num_rows)],
+            "strings": [f"s{i % 7}" for i in range(num_rows)],
+        }
+    )
+
+
+def _column_counts(results: Any) -> dict:
+    view = results.view()
+    return {
+        name: (column.get_metric("counts").n.value, column.get_metric("cardinality").estimate)
+        for name, column in view.get_columns().items()
+    }
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_log_stream_chunks_match_single_log(read_ahead: int) -> None:
+    df = _data()
+    chunks = (df.iloc[start : start + 128] for start in range(0, len(df), 128))
+
+    results = why.log_stream(chunks, read_ahead=read_ahead)
+
+    assert _column_counts(results) == _column_counts(why.log(df))
+    assert results.view().get_column("ints").get_metric("distribution").max == 999
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_log_stream_files(tmp_path: Any, file_format: str) -> None:
+    df = _data()
+    path = str(tmp_path / f"data.{file_format}")
+    expected = why.log(df)
+    if file_format == "csv":
+        df.to_csv(path, index=False)
+    else:
+        pa = pytest.importorskip("pyarrow")
+        df.to_parquet(path, row_group_size=300)
+        # Parquet is tracked as Arrow, compare with a profile of the same Arrow data
+        expected = why.log(pa.Table.from_pandas(df))
+
+    results = why.log_stream(path, chunksize=100)
+
+    assert _column_counts(results) == _column_counts(expected)
+
+
+def test_log_stream_file_format_and_reader_arguments(tmp_path: Any) -> None:
+    path = str(tmp_path / "data.txt.gz")
+    _data().to_csv(path, index=False, sep=";")
+
+    results = why.log_stream(path, chunksize=100, file_format="csv", sep=";", usecols=["ints"])
+
+    assert list(results.view().get_columns()) == ["ints"]
+    assert results.view().get_column("ints").get_metric("counts").n.value == 1000
+
+    with pytest.raises(ValueError):
+        why.log_stream(str(tmp_path / "data.json"))
+    with pytest.raises(ValueError):
+        why.log_stream([_data()], sep=";")
+    with pytest.raises(ValueError):
+        why.log_stream([_data()], chunksize=0)
+
+
+def test_log_stream_segments() -> None:
+    df = _data()
+    schema = DatasetSchema(segments=segment_on_column("strings"))
+    chunks = [df.iloc[start : start + 100] for start in range(0, len(df), 100)]
+
+    results = why.log_stream(chunks, schema=schema, max_cached_segments=3)
+
+    assert len(results.segments()) == 7
+    total = 0
+    for segment in results.segments():
+        profile = results.profile(segment)
+        view = profile.view() if hasattr(profile, "view") else profile
+        total += view.get_column("ints").get_metric("counts").n.value
+    assert total == 1000
+
+
+def test_read_ahead_is_bounded() -> None:
+    produced = []
+
+    def chunks() -> Iterator[int]:
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    for chunk in _ReadAhead(chunks(), 2):
+        time.sleep(0.05)
+        # the queue holds 2 chunks and the reader thread may hold one more waiting for space
+        assert len(produced) <= chunk + 1 + 3
+        consumed.append(chunk)
+    assert consumed == list(range(10))
+
+
+def test_log_stream_reader_errors_are_raised() -> None:
+    def chunks() -> Iterator[pd.DataFrame]:
+        yield _data(10)
+        raise IOError("broken file")
+
+    with pytest.raises(IOError, match="broken file"):
+        why.log_stream(chunks(), read_ahead=1)
+
+    assert not any(thread.name == "whylogs-read-ahead" for thread in threading.enumerate())
+
+
+def test_log_stream_stops_reading_when_profiling_fails() -> None:
+    produced = []
+
+    def chunks() -> Iterator[Any]:
+        for i in range(100):
+            produced.append(i)
+            yield "not a chunk" if i == 1 else _data(10)
+
+    with pytest.raises(Exception):
+        why.log_stream(chunks(), read_ahead=2)
+
+    assert len(produced) < 100
+    assert not any(thread.name == "whylogs-read-ahead" for thread in threading.enumerate())
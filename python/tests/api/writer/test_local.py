@@ -2,10 +2,15 @@ import os
 import shutil
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 
+import whylogs as why
 from whylogs import DatasetProfileView
 from whylogs.api.writer.local import LocalWriter
+from whylogs.core.schema import DatasetSchema
+from whylogs.core.segmentation_partition import segment_on_column
+from whylogs.core.view.segmented_dataset_profile_view import SegmentContainerReader
 
 
 class TestLocalWriter(object):
@@ -40,3 +45,15 @@ class TestLocalWriter(object):
     def test_should_write_html_report_locally(self, html_report):
         html_report.writer("local").write()
         assert os.path.isfile(os.path.join(os.getcwd(), "html_reports/ProfileReport.html"))
+
+
+def test_segments_written_to_one_container(tmp_path) -> None:
+    df = pd.DataFrame({"x": [i % 3 for i in range(30)], "value": range(30)})
+    results = why.log(df, schema=DatasetSchema(segments=segment_on_column("x")))
+    results.writer("local").option(base_dir=str(tmp_path), segment_container=True).write()
+
+    files = os.listdir(tmp_path)
+    assert len(files) == 1
+    with SegmentContainerReader(os.path.join(tmp_path, files[0])) as reader:
+        assert set(reader.segments) == set(results.segments())
+        assert sum(view.get_column("value").get_metric("counts").n.value for _, view in reader) == 30
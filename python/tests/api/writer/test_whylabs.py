@@ -2,6 +2,11 @@ import datetime
 import logging
 import os
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Tuple, Type
 from unittest.mock import MagicMock
 
 import pytest
@@ -9,13 +14,63 @@ import responses
 from responses import PUT
 
 import whylogs as why
+from whylogs.api.logger.result_set import ResultSetWriter
 from whylogs.api.writer import Writers
-from whylogs.api.writer.whylabs import WhyLabsWriter
+from whylogs.api.writer.whylabs import WhyLabsWriter, _CachedRemoteFlag
+from whylogs.core import DatasetProfileView, DatasetSchema
 from whylogs.core.feature_weights import FeatureWeights
+from whylogs.core.segmentation_partition import segment_on_column
 
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def _upload_server(statuses: List[int], delay_seconds: float = 0) -> Iterator[Tuple[int, Dict[str, bytes]]]:
+    """
+    A local stand-in for the upload URLs. PUT requests are answered with the next status of statuses, then
+    with 200, and the bodies of the successful uploads are collected by path. Each response is delayed by
+    delay_seconds to simulate the latency of a remote store.
+    """
+    uploads: Dict[str, bytes] = dict()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_PUT(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay_seconds)
+            with lock:
+                status = statuses.pop(0) if statuses else 200
+                if status == 200:
+                    uploads[self.path] = body
+            self.send_response(status)
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    with _local_server(Handler) as port:
+        yield port, uploads
+
+
+@contextmanager
+def _local_server(handler: Type[BaseHTTPRequestHandler]) -> Iterator[int]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _local_writer(port: int, **options) -> WhyLabsWriter:
+    writer = WhyLabsWriter().option(api_key="0123456789.any", retry_backoff_seconds=0, **options)
+    writer._get_upload_url = lambda dataset_timestamp: f"http://127.0.0.1:{port}/{dataset_timestamp}"
+    return writer
+
+
 class TestWhylabsWriter(object):
     @classmethod
     def setup_class(cls):
@@ -158,3 +213,183 @@ class TestWhylabsWriter(object):
                 results.writer("whylabs").option(api_key="bad_key_format").write(dataset_id="dataset_id", dest="tmp")
             )
             assert response[0] is True
+
+    @pytest.fixture(autouse=True)
+    def config_flag(self, monkeypatch) -> MagicMock:
+        flag = MagicMock()
+        flag.get.return_value = False
+        monkeypatch.setattr("whylogs.api.writer.whylabs._CONDITION_COUNT_UNCOMPOUND", flag)
+        return flag
+
+    def test_config_is_checked_on_first_write(self, results, config_flag) -> None:
+        with _upload_server([]) as (port, _):
+            writer = _local_writer(port)
+            config_flag.refresh_if_expired.assert_not_called()
+            assert writer.write(file=results.view())[0]
+        config_flag.refresh_if_expired.assert_called()
+
+    def test_write_uploads_in_memory(self, results) -> None:
+        view = results.view()
+        with _upload_server([]) as (port, uploads):
+            writer = _local_writer(port)
+            assert writer.write(file=view)[0]
+
+        assert len(uploads) == 1
+        uploaded = DatasetProfileView.deserialize(next(iter(uploads.values())))
+        assert uploaded.get_column("legs").to_protobuf() == view.get_column("legs").to_protobuf()
+        assert writer.upload_stats.uploads == 1
+        assert writer.upload_stats.bytes_uploaded == len(view.serialize())
+
+    def test_write_batch_uploads_concurrently(self, pandas_dataframe) -> None:
+        views = []
+        for day in range(6):
+            profile = why.log(pandas_dataframe).profile()
+            profile.set_dataset_timestamp(datetime.datetime(2023, 1, day + 1, tzinfo=datetime.timezone.utc))
+            views.append(profile.view())
+
+        with _upload_server([]) as (port, uploads):
+            writer = _local_writer(port, upload_workers=3)
+            responses = writer.write_batch(views)
+
+        assert all(response[0] for response in responses)
+        assert len(uploads) == 6
+        assert writer.upload_stats.uploads == 6
+        assert writer.upload_stats.failures == 0
+        assert writer.upload_stats.throughput > 0
+        assert writer.upload_stats.latency_percentile(95) >= writer.upload_stats.latency_percentile(50) > 0
+
+    def test_write_batch_reports_failed_profiles(self, pandas_dataframe) -> None:
+        views = []
+        for day in range(4):
+            profile = why.log(pandas_dataframe).profile()
+            profile.set_dataset_timestamp(datetime.datetime(2023, 1, day + 1, tzinfo=datetime.timezone.utc))
+            views.append(profile.view())
+        failing_timestamp = int(views[1].dataset_timestamp.timestamp() * 1000)
+
+        with _upload_server([]) as (port, uploads):
+            writer = _local_writer(port, upload_workers=2)
+
+            def get_upload_url(dataset_timestamp: int) -> str:
+                if dataset_timestamp == failing_timestamp:
+                    raise ValueError("forbidden")
+                return f"http://127.0.0.1:{port}/{dataset_timestamp}"
+
+            writer._get_upload_url = get_upload_url
+            responses = writer.write_batch(views)
+
+        assert [response[0] for response in responses] == [True, False, True, True]
+        assert responses[1][1] == "forbidden"
+        assert len(uploads) == 3
+        assert writer.upload_stats.uploads == 3
+        assert writer.upload_stats.failures == 1
+
+    def test_upload_latency_includes_upload_url_request(self, pandas_dataframe) -> None:
+        views = [why.log(pandas_dataframe).view() for _ in range(2)]
+        with _upload_server([]) as (port, _):
+            writer = _local_writer(port, upload_workers=2)
+
+            def get_upload_url(dataset_timestamp: int) -> str:
+                time.sleep(0.2)
+                return f"http://127.0.0.1:{port}/{dataset_timestamp}"
+
+            writer._get_upload_url = get_upload_url
+            writer.write(file=views[0])
+            writer.write_batch(views)
+
+        assert len(writer.upload_stats.latencies) == 3
+        assert min(writer.upload_stats.latencies) >= 0.2
+
+    def test_write_batch_uploads_segments(self, pandas_dataframe) -> None:
+        schema = DatasetSchema(segments=segment_on_column("animal"))
+        results = why.log(pandas_dataframe, schema=schema)
+
+        with _upload_server([]) as (port, uploads):
+            writer = _local_writer(port, upload_workers=2)
+            writer._get_upload_url = MagicMock(side_effect=[f"http://127.0.0.1:{port}/segment-{i}" for i in range(3)])
+            ResultSetWriter(results, writer).write()
+
+        assert len(uploads) == 3
+
+    def test_upload_retries_transient_errors(self, results) -> None:
+        with _upload_server([503, 429]) as (port, uploads):
+            writer = _local_writer(port, max_retries=2)
+            assert writer.write(file=results.view())[0]
+        assert len(uploads) == 1
+        assert writer.upload_stats.retries == 2
+
+        with _upload_server([503, 503, 503]) as (port, uploads):
+            writer = _local_writer(port, max_retries=1)
+            success, _ = writer.write(file=results.view())
+        assert not success
+        assert not uploads
+        assert writer.upload_stats.retries == 1
+        assert writer.upload_stats.failures == 1
+
+    def test_upload_does_not_retry_client_errors(self, results) -> None:
+        with _upload_server([403]) as (port, uploads):
+            writer = _local_writer(port)
+            success, _ = writer.write(file=results.view())
+        assert not success
+        assert writer.upload_stats.retries == 0
+
+
+@contextmanager
+def _config_server(status: int, delay_seconds: float = 0) -> Iterator[Tuple[str, List[str]]]:
+    """A local stand-in for the remote config file, answering HEAD requests with status."""
+    requests_received: List[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self) -> None:
+            requests_received.append(self.path)
+            time.sleep(delay_seconds)
+            self.send_response(status)
+            self.end_headers()
+
+        def log_message(self, *args) -> None:
+            pass
+
+    with _local_server(Handler) as port:
+        yield f"http://127.0.0.1:{port}/config_file", requests_received
+
+
+@pytest.mark.parametrize("status,expected", [(200, True), (403, False)])
+def test_remote_flag_is_cached(status: int, expected: bool) -> None:
+    with _config_server(status) as (url, requests_received):
+        flag = _CachedRemoteFlag(url, ttl_seconds=600, timeout_seconds=5)
+        assert flag.get() is expected
+        assert flag.get() is expected
+    assert requests_received == ["/config_file"]
+
+
+def test_remote_flag_refreshes_expired_value_in_background() -> None:
+    with _config_server(200) as (url, requests_received):
+        flag = _CachedRemoteFlag(url, ttl_seconds=0, timeout_seconds=5)
+        assert flag.get() is True
+        # the expired value is returned while it is checked again
+        assert flag.get() is True
+        refresh_thread = flag._refresh_thread
+        if refresh_thread is not None:
+            refresh_thread.join()
+    assert len(requests_received) == 2
+
+
+def test_remote_flag_does_not_block_on_slow_endpoint() -> None:
+    with _config_server(200, delay_seconds=2) as (url, _):
+        flag = _CachedRemoteFlag(url, ttl_seconds=600, timeout_seconds=0.1)
+        start = time.perf_counter()
+        assert flag.get() is False
+        assert time.perf_counter() - start < 1
+
+
+def test_remote_flag_unreachable_endpoint() -> None:
+    with _config_server(200) as (url, _):
+        pass
+    assert _CachedRemoteFlag(url, ttl_seconds=600, timeout_seconds=1).get() is False
+
+
+def test_remote_flag_reads_settings_from_environment(monkeypatch) -> None:
+    monkeypatch.setenv("WHYLABS_CONFIG_REFRESH_SECONDS", "not a number")
+    monkeypatch.setenv("WHYLABS_CONFIG_TIMEOUT_SECONDS", "0.5")
+    flag = _CachedRemoteFlag("http://127.0.0.1:1/config_file")
+    assert flag._ttl_seconds == 600
+    assert flag._timeout_seconds == 0.5
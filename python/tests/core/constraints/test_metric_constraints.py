@@ -1,7 +1,12 @@
 from logging import getLogger
 from typing import List
 
+import pytest
+
+import whylogs as why
+from whylogs.core.configs import SummaryConfig
 from whylogs.core.constraints import (
+    Constraints,
     ConstraintsBuilder,
     DatasetConstraint,
     MetricConstraint,
@@ -16,6 +21,9 @@ from whylogs.core.metrics import DistributionMetric
 from whylogs.core.metrics.metrics import Metric, MetricConfig
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.relations import Not, Require
+from whylogs.core.schema import DatasetSchema
+from whylogs.core.segmentation_partition import segment_on_column
+from whylogs.core.summary_cache import metric_summary, summary_cache
 
 TEST_LOGGER = getLogger(__name__)
 
@@ -255,3 +263,121 @@ def test_constraints_report(pandas_constraint_dataframe) -> None:
     assert report[0].summary["min"] == 0
     for x, y in zip(constraints.report(), constraints.generate_constraints_report()):
         assert (x[0], x[1], x[2]) == (y[0], y[1], y[2])
+
+
+def test_constraints_compute_each_summary_once(profile_view, monkeypatch) -> None:
+    summaries: List[str] = []
+    to_summary_dict = DistributionMetric.to_summary_dict
+
+    def counting_to_summary_dict(self, cfg=None):
+        summaries.append(self.namespace)
+        return to_summary_dict(self, cfg)
+
+    monkeypatch.setattr(DistributionMetric, "to_summary_dict", counting_to_summary_dict)
+    builder = ConstraintsBuilder(dataset_profile_view=profile_view)
+    for column_name in ["weight", "legs"]:
+        for number in range(10):
+            builder.add_constraint(greater_than_number(column_name=column_name, number=number))
+            builder.add_constraint(
+                MetricConstraint(
+                    name=f"{column_name} max below {number}",
+                    condition=Require("max").less_than(number),
+                    metric_selector=MetricsSelector(column_name=column_name, metric_name="distribution"),
+                )
+            )
+    builder.add_constraint(
+        DatasetConstraint(
+            name="same_mean", condition=PrefixCondition("== :legs:distribution/mean :legs:distribution/mean")
+        )
+    )
+    constraints = builder.build()
+
+    summaries.clear()
+    report = constraints.generate_constraints_report(with_summary=True)
+    assert len(report) == 41
+    assert report[-1] == ("same_mean", 1, 0, report[-1].summary)
+    # one summary per column instead of one per constraint
+    assert summaries == ["distribution", "distribution"]
+
+    summaries.clear()
+    assert not constraints.validate()
+    assert len(summaries) <= 2
+
+
+def _legs_constraints(view) -> Constraints:
+    builder = ConstraintsBuilder(dataset_profile_view=view)
+    for column_name in ["legs", "weight"]:
+        builder.add_constraint(
+            MetricConstraint(
+                name="min_above_1",
+                condition=Require("min").greater_than(1),
+                metric_selector=MetricsSelector(column_name=column_name, metric_name="distribution"),
+            )
+        )
+    builder.add_constraint(
+        DatasetConstraint(name="legs_counted", condition=PrefixCondition("== :legs:distribution/n :legs:counts/n"))
+    )
+    builder.add_constraint(DatasetConstraint(name="few_legs", condition=PrefixCondition("< :legs:distribution/max 5")))
+    return builder.build()
+
+
+def test_constraints_plan_report(pandas_constraint_dataframe) -> None:
+    schema = DatasetSchema(segments=segment_on_column("animal"))
+    results = why.log(pandas_constraint_dataframe, schema=schema)
+    segments = results.segments()
+    plan = _legs_constraints(results.view(segments[0])).compile()
+
+    assert plan.labels == [
+        "legs/min_above_1",
+        "weight/min_above_1",
+        "legs_counted",
+        "few_legs",
+    ]
+    report = plan.report(results)
+    assert list(report.index) == [segment.key[0] for segment in segments]
+    assert report.loc["cat"].tolist() == [True, True, True, True]
+    assert report.loc["snake"].tolist() == [False, True, True, True]
+    assert report.loc["mosquito"].tolist() == [True, False, True, False]
+
+    views = {segment.key[0]: results.view(segment) for segment in segments}
+    report = plan.report(views, max_workers=4)
+    for animal, view in views.items():
+        assert report.loc[animal].all() == _legs_constraints(view).validate()
+    assert report.equals(plan.report(views))
+
+
+def test_constraints_plan_missing_metrics(profile_view) -> None:
+    builder = ConstraintsBuilder(dataset_profile_view=profile_view)
+    builder.add_constraint(DatasetConstraint(name="missing", condition=PrefixCondition("== :nope:counts/n 0")))
+    builder.add_constraint(
+        DatasetConstraint(
+            name="optional", condition=PrefixCondition("== :nope:counts/n 0"), require_column_existence=False
+        )
+    )
+    plan = builder.build().compile()
+
+    report = plan.report([profile_view, profile_view])
+    assert report.shape == (2, 2)
+    assert not report["missing"].any()
+    assert report["optional"].all()
+
+    with pytest.raises(ValueError):
+        ConstraintsBuilder(profile_view).add_constraint(
+            DatasetConstraint(name="bad", condition=PrefixCondition("== :legs:counts/n ?"))
+        ).build().compile()
+
+
+def test_metric_summary_uses_default_config_with_or_without_cache(profile_view, monkeypatch) -> None:
+    configs = []
+    to_summary_dict = DistributionMetric.to_summary_dict
+
+    def recording_to_summary_dict(self, cfg=None):
+        configs.append(cfg)
+        return to_summary_dict(self, cfg)
+
+    monkeypatch.setattr(DistributionMetric, "to_summary_dict", recording_to_summary_dict)
+    metric = profile_view.get_column("legs").get_metric("distribution")
+    uncached = metric_summary(metric)
+    with summary_cache():
+        assert metric_summary(metric) == uncached
+    assert [type(cfg) for cfg in configs] == [SummaryConfig, SummaryConfig]
@@ -14,6 +14,7 @@ from whylogs.core.metrics.condition_count_metric import (
     ConditionCountMetric,
 )
 from whylogs.core.metrics.condition_count_metric import Relation as Rel
+from whylogs.core.metrics.condition_count_metric import and_relations
 from whylogs.core.metrics.condition_count_metric import relation as rel
 from whylogs.core.metrics.metric_components import IntegralComponent
 from whylogs.core.metrics.metrics import OperationResult
@@ -513,3 +514,66 @@ def test_metric_getter_deserialization(col_name: str, expression: str) -> None:
     predicate = parse_predicate(expression, profile=prof, metric=metric)
     assert predicate(metric)
     assert predicate.serialize() == expression
+
+
+def _mixed_column() -> PreprocessedColumn:
+    data = ["abc", "abc123", "42", "", 41, 42, 42.0, 42.1, 43, -1, None, float("nan"), [1, 2], {"a": 1}, b"bytes"]
+    return PreprocessedColumn.apply(pd.Series(data, dtype=object))
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        X.matches("[a-zA-Z]+"),
+        X.fullmatch("[0-9]+"),
+        X.equals("42"),
+        X.equals(42),
+        X.not_equal(42.0),
+        X.less_than(42),
+        X.greater_or_equals("abc"),
+        X.greater_than(40).and_(X.less_than(44)),
+        X.less_than(0).or_(X.matches("abc")),
+        X.matches("abc").or_(X.less_than(0)),
+        Not(X.less_than(42)),
+        X.is_(lambda x: x % 2 == 0),
+        X.greater_than(40).and_(X.is_(lambda x: x % 2 == 0)),
+        rel(Rel.match, "[0-9]+"),
+    ],
+)
+def test_vectorized_update_matches_elementwise(predicate: Predicate) -> None:
+    failures: Dict[str, List[Any]] = {"vectorized": [], "elementwise": []}
+    metrics = dict()
+    for mode in failures:
+        condition = Condition(predicate, actions=[lambda _, __, x, mode=mode: failures[mode].append(x)])
+        metrics[mode] = ConditionCountMetric({"cond": condition}, IntegralComponent(0))
+    metrics["vectorized"].columnar_update(_mixed_column())
+    metrics["elementwise"]._update_elementwise(_mixed_column())
+
+    assert metrics["vectorized"].to_summary_dict() == metrics["elementwise"].to_summary_dict()
+    # repr() since the tensor in the data doesn't compare to a bool
+    assert [repr(x) for x in failures["vectorized"]] == [repr(x) for x in failures["elementwise"]]
+
+
+def test_callable_condition() -> None:
+    conditions = {
+        "short": Condition(lambda x: len(x) < 4),
+        "legacy_and": Condition(and_relations(rel(Rel.greater, 40), lambda x: x < 43)),
+    }
+    metric = ConditionCountMetric(conditions, IntegralComponent(0))
+    metric.columnar_update(PreprocessedColumn.apply(["abc", "abcd", 41, 42, 43]))
+    summary = metric.to_summary_dict(None)
+
+    assert summary["total"] == 5
+    assert summary["short"] == 1  # len() of the integers raises, which isn't a match
+    assert summary["legacy_and"] == 2
+
+
+def test_throw_only_for_conditions_that_ask_for_it() -> None:
+    conditions = {
+        "alpha": Condition(X.matches("[a-zA-Z]+"), throw_on_failure=True),
+        "digit": Condition(X.matches("[0-9]+")),
+    }
+    metric = ConditionCountMetric(conditions, IntegralComponent(0))
+    assert metric.columnar_update(PreprocessedColumn.apply(["abc", "kwatz"])) == OperationResult.ok(2)
+    with pytest.raises(ValueError, match="alpha"):
+        metric.columnar_update(PreprocessedColumn.apply(["123"]))
@@ -4,6 +4,8 @@ from logging import getLogger
 import pytest
 import whylogs_sketching as ds  # type: ignore
 
+from whylogs.core.metrics.aggregators import AggregatorRegistry
+from whylogs.core.metrics.deserializers import DeserializerRegistry, deserializer
 from whylogs.core.metrics.metric_components import (
     CustomComponent,
     FractionalComponent,
@@ -12,8 +14,12 @@ from whylogs.core.metrics.metric_components import (
     IntegralComponent,
     KllComponent,
     MaxIntegralComponent,
+    MetricComponent,
     MinIntegralComponent,
+    Registries,
 )
+from whylogs.core.metrics.serializers import SerializerRegistry, serializer
+from whylogs.core.proto import MetricComponentMessage
 
 TEST_LOGGER = getLogger(__name__)
 _TEST_COMPONENT_TYPES = [
@@ -62,3 +68,69 @@ def test_custom_metric_components() -> None:
     custom_metric_component = TestCustomComponent(12)
     TEST_LOGGER.info(f"metric component is: {custom_metric_component}")
     assert custom_metric_component.value == 12
+
+
+def test_merge_into_updates_sketch_in_place() -> None:
+    target_sketch = ds.kll_doubles_sketch(k=256)
+    target_sketch.update(1.0)
+    source_sketch = ds.kll_doubles_sketch(k=256)
+    source_sketch.update(2.0)
+    target = KllComponent(target_sketch)
+    source = KllComponent(source_sketch)
+
+    assert source.merge_into(target) is target
+    assert target.value is target_sketch
+    assert target.value.get_n() == 2
+    assert source.value.get_n() == 1
+
+    fs = FrequentStringsComponent(ds.frequent_strings_sketch(lg_max_k=10))
+    other_fs = FrequentStringsComponent(ds.frequent_strings_sketch(lg_max_k=10))
+    other_fs.value.update("a", 3)
+    fs_sketch = fs.value
+    fs += other_fs
+    assert fs.value is fs_sketch
+    assert fs.value.get_estimate("a") == 3
+
+
+def test_merge_into_numeric_components() -> None:
+    first = MinIntegralComponent(2)
+    MinIntegralComponent(1).merge_into(first)
+    assert first.value == 1
+
+    total = IntegralComponent(2)
+    total += IntegralComponent(3)
+    assert total.value == 5
+
+
+def test_deserialized_components_share_their_class() -> None:
+    first = MetricComponent.from_protobuf(IntegralComponent(1).to_protobuf())
+    second = MetricComponent.from_protobuf(IntegralComponent(2).to_protobuf())
+    kll = MetricComponent.from_protobuf(KllComponent(ds.kll_doubles_sketch(k=128)).to_protobuf())
+
+    assert type(first) is type(second)
+    assert type(kll) is not type(first)
+    assert (first.value, second.value) == (1, 2)
+    assert (first + second).value == 3
+    assert deepcopy(first).value == 1
+
+
+def test_deserialization_uses_functions_registered_later() -> None:
+    registries = Registries(
+        aggregatorRegistry=AggregatorRegistry(),
+        serializerRegistry=SerializerRegistry(),
+        deserializerRegistry=DeserializerRegistry(),
+    )
+    msg = IntegralComponent(21).to_protobuf()
+    msg.type_id = 150
+    # nothing is registered for the ID yet, the int functions are used
+    assert MetricComponent.from_protobuf(msg, registries).value == 21
+
+    @serializer(type_id=150, registry=registries.serializerRegistry)
+    def _serialize(value: int) -> MetricComponentMessage:
+        return MetricComponentMessage(n=value)
+
+    @deserializer(type_id=150, registry=registries.deserializerRegistry)
+    def _deserialize(msg: MetricComponentMessage) -> int:
+        return msg.n * 2
+
+    assert MetricComponent.from_protobuf(msg, registries).value == 42
@@ -8,6 +8,8 @@ from whylogs.core.metrics.maths import VarianceM2Result, parallel_variance_m2
 from whylogs.core.metrics.metrics import (
     CardinalityMetric,
     DistributionMetric,
+    FrequentItemsMetric,
+    IntsMetric,
     MetricConfig,
 )
 from whylogs.core.preprocessing import PreprocessedColumn
@@ -202,6 +204,7 @@ def test_cardinality_metric_row_booleans() -> None:
     assert cardinality.estimate == pytest.approx(1, 0.1)
     # track a bool value of false in the same column and check that cardinality increased to near 2.
     profile.track(row={column_name: False})
+    cardinality = profile.view().get_column(column_name).get_metric("cardinality")
     assert cardinality.estimate == pytest.approx(2, 0.1)
 
 
@@ -223,3 +226,20 @@ def test_cardinality_metric_booleans_all_false() -> None:
     col_prof = why.log(df).view().get_column("b")
     cardinality: CardinalityMetric = col_prof.get_metric("cardinality")
     assert cardinality.estimate == pytest.approx(1, 0.1)
+
+
+@pytest.mark.parametrize("metric_class", [DistributionMetric, CardinalityMetric, FrequentItemsMetric, IntsMetric])
+def test_merge_into_matches_merge(metric_class) -> None:
+    target = metric_class.zero(MetricConfig())
+    source = metric_class.zero(MetricConfig())
+    target.columnar_update(PreprocessedColumn.apply(np.array([1, 2, 3, 4])))
+    source.columnar_update(PreprocessedColumn.apply(np.array([3, 10, 11])))
+    expected = target.merge(source).to_summary_dict()
+
+    assert source.merge_into(target) is target
+    summary = target.to_summary_dict()
+    if metric_class is FrequentItemsMetric:
+        # items with the same estimate may come in a different order
+        summary = {k: sorted(v, key=lambda item: item.value) for k, v in summary.items()}
+        expected = {k: sorted(v, key=lambda item: item.value) for k, v in expected.items()}
+    assert summary == expected
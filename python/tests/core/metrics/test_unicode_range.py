@@ -185,3 +185,45 @@ def test_correct_in_column_view() -> None:
     assert summary["unicode_range/string_length:ints/min"] == 1
     assert summary["unicode_range/alpha:distribution/mean"] == 1
     assert summary["unicode_range/alpha:ints/min"] == 1
+
+
+def test_unicode_range_metric_merge_into() -> None:
+    metric1 = UnicodeRangeMetric({"digits": (48, 57), "alpha": (97, 122)})
+    metric2 = UnicodeRangeMetric({"digits": (48, 57), "alpha": (97, 122)})
+    metric1.columnar_update(PreprocessedColumn.apply(["1", "12", "123"]))
+    metric2.columnar_update(PreprocessedColumn.apply(["1234a", "abc", "abc123"]))
+    expected = (metric1 + metric2).to_summary_dict()
+
+    target_kll = metric1.submetrics["digits"]["distribution"].kll.value
+    metric1 += metric2
+
+    assert metric1.submetrics["digits"]["distribution"].kll.value is target_kll
+    assert _NaNfully_equal(metric1.to_summary_dict(), expected)
+    assert metric2.submetrics["digits"]["distribution"].kll.value.get_n() == 3
+
+
+@pytest.mark.parametrize("lower_case,normalize", [(True, True), (False, False)])
+def test_unicode_range_metric_matches_python_loop(lower_case: bool, normalize: bool) -> None:
+    # overlapping ranges, a range holding the NUL character, astral and lone surrogate code points
+    ranges = {
+        "ascii": (0, 127),
+        "digits": (48, 57),
+        "nul": (0, 0),
+        "greek": (0x370, 0x3FF),
+        "emoji": (0x1F600, 0x1F64F),
+    }
+    strings = ["", "abc123", "\x00x", "ΣΑΣ ΟΔΟΣ", "Ünïcödé", "😀 ok 😎", "\ud800lone", "🀄" * 3, "日本語"]
+    metrics = [UnicodeRangeMetric(dict(ranges), lower_case=lower_case, normalize=normalize) for _ in range(2)]
+    metrics[0].columnar_update(PreprocessedColumn.apply(strings))
+    metrics[1]._columnar_update_python(PreprocessedColumn.apply(strings))
+
+    assert metrics[0].to_summary_dict() == metrics[1].to_summary_dict()
+
+
+def test_unicode_range_metric_batches(monkeypatch) -> None:
+    monkeypatch.setattr("whylogs.core.metrics.unicode_range._BATCH_CODE_POINTS", 4)
+    metric = UnicodeRangeMetric({"digits": (48, 57)})
+    strings = ["1", "1234567", "12a", "", "abcd", "123"]
+    counts = metric._range_counts(strings)
+    assert counts[list(metric.range_definitions).index("digits")].tolist() == [1, 7, 2, 0, 0, 3]
+    assert counts[list(metric.range_definitions).index("UNKNOWN")].tolist() == [0, 0, 1, 0, 4, 0]
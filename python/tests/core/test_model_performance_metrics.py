@@ -6,6 +6,7 @@ import pytest
 from whylogs import log_classification_metrics, log_regression_metrics
 from whylogs.core.model_performance_metrics import ModelPerformanceMetrics
 from whylogs.core.model_performance_metrics.confusion_matrix import ConfusionMatrix
+from whylogs.core.model_performance_metrics.regression_metrics import RegressionMetrics
 from whylogs.core.proto.v0 import ModelProfileMessage
 from whylogs.core.schema import DatasetSchema
 from whylogs.core.segment import Segment
@@ -273,3 +274,48 @@ def test_profile_top_level_api_segmented_performance():
     assert metrics1.confusion_matrix.labels == ["x0", "x1"]
     assert metrics1.confusion_matrix.confusion_matrix.get((0, 0)).n == 1
     assert metrics1.confusion_matrix.confusion_matrix.get((1, 0)).n == 1
+
+
+@pytest.mark.parametrize(
+    "labels,predictions,targets",
+    [
+        ([0, 1], [0, 1, 1, 0, 0, 1, 1], [1, 0, 1, 1, 0, 1, 1]),
+        (["cat", "dog", "pig"], ["cat", "dog", "dog", "pig", "cat"], ["cat", "pig", "dog", "pig", "dog"]),
+        ([False, True], [True, False, True], [True, True, False]),
+        ([0.5, 1, 2.5], [0.5, 1.0, 2.5, 1], [1, 1, 0.5, 2.5]),
+    ],
+)
+def test_confusion_matrix_add_matches_batches(labels, predictions, targets):
+    scores = [0.1 * i for i in range(len(targets))]
+    vectorized = ConfusionMatrix(labels=labels)
+    vectorized.add(predictions=predictions, targets=targets, scores=scores)
+    batched = ConfusionMatrix(labels=labels)
+    batched._add_batches(predictions, targets, scores)
+
+    assert vectorized.confusion_matrix.keys() == batched.confusion_matrix.keys()
+    for key, dist in vectorized.confusion_matrix.items():
+        assert dist.n == batched.confusion_matrix[key].n
+        assert dist.mean.value == pytest.approx(batched.confusion_matrix[key].mean.value)
+        assert dist.m2.value == pytest.approx(batched.confusion_matrix[key].m2.value)
+
+
+def test_confusion_matrix_add_unknown_label():
+    confusion_matrix = ConfusionMatrix(labels=["1", "a"])
+    with pytest.raises(ValueError):
+        confusion_matrix.add(predictions=["a", 1], targets=["a", "a"], scores=None)
+    with pytest.raises(ValueError):
+        confusion_matrix.add(predictions=["a", "b"], targets=["a", "a"], scores=None)
+
+
+def test_regression_metrics_add():
+    predictions = [21.6, 201.0, 37.0, 5.34]
+    targets = [20, 200, 56.3, 1]
+    regression_metrics = RegressionMetrics()
+    regression_metrics.add(predictions, targets)
+    regression_metrics.add(predictions[:2], targets[:2])
+
+    diffs = [p - t for p, t in zip(predictions + predictions[:2], targets + targets[:2])]
+    assert regression_metrics.count == 6
+    assert regression_metrics.sum_diff == pytest.approx(sum(diffs))
+    assert regression_metrics.sum_abs_diff == pytest.approx(sum(abs(d) for d in diffs))
+    assert regression_metrics.sum2_diff == pytest.approx(sum(d * d for d in diffs))
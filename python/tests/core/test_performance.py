@@ -1,10 +1,16 @@
 import cProfile
+import gc
+import os
 import pstats
 import random
+import time
+import tracemalloc
 from dataclasses import dataclass, field
+from decimal import Decimal
+from functools import reduce
 from io import StringIO
 from logging import getLogger
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 import numpy as np
 import pandas as pd
@@ -12,15 +18,31 @@ import pytest
 import whylogs_sketching as ds  # type: ignore
 
 import whylogs
-from whylogs.core import ColumnProfile, ColumnSchema
+from whylogs.api.logger.segment_cache import SegmentCache
+from whylogs.api.logger.segment_processing import segment_processing
+from whylogs.core import ColumnProfile, ColumnSchema, DatasetProfileView, DatasetSchema
 from whylogs.core.dataset_profile import DatasetProfile
+from whylogs.core.metrics.condition_count_metric import (
+    Condition,
+    ConditionCountConfig,
+    ConditionCountMetric,
+)
 from whylogs.core.metrics.metrics import MetricConfig
+from whylogs.core.metrics.unicode_range import UnicodeRangeMetric
+from whylogs.core.preprocessing import PreprocessedColumn
+from whylogs.core.relations import Predicate
 from whylogs.core.resolvers import (
     HistogramCountingTrackingResolver,
     LimitedTrackingResolver,
     Resolver,
     StandardResolver,
 )
+from whylogs.core.segmentation_partition import (
+    ColumnMapperFunction,
+    SegmentationPartition,
+    segment_on_column,
+)
+from whylogs.core.view import merge_views
 
 TEST_LOGGER = getLogger(__name__)
 
@@ -211,3 +233,694 @@ def test_rolling_logger_latency_benchmark(mode) -> None:
     stats = pstats.Stats(profiler, stream=string_output_stream).sort_stats("cumulative")
     stats.print_stats(20)
     TEST_LOGGER.info(f"stats for rolling latency [{mode}]based benchmark are\n{string_output_stream.getvalue()}")
+
+
+def _apply_based_split(series: pd.Series) -> Dict[str, int]:
+    # the per-mask Series.apply() type split PreprocessedColumn._pandas_split used before single pass classification
+    pdc = pd.api.types
+    non_null_series = series[series.notnull()]
+    float_mask = non_null_series.apply(lambda x: pdc.is_float(x) or isinstance(x, Decimal))
+    bool_mask = non_null_series.apply(lambda x: pdc.is_bool(x))
+    bool_mask_where_true = non_null_series.apply(lambda x: pdc.is_bool(x) and x)
+    int_mask = non_null_series.apply(lambda x: pdc.is_number(x) and pdc.is_integer(x) and not pdc.is_bool(x))
+    str_mask = non_null_series.apply(lambda x: isinstance(x, str))
+    tensor_mask = non_null_series.apply(
+        lambda x: isinstance(x, (list, np.ndarray)) and PreprocessedColumn._is_tensorable(x)
+    )
+    floats = non_null_series[float_mask].astype(float)
+    floats.apply(lambda x: np.isinf(x))
+    return {
+        "ints": int(int_mask.sum()),
+        "floats": int(float_mask.sum()),
+        "strings": int(str_mask.sum()),
+        "tensors": int(tensor_mask.sum()),
+        "bools": int(bool_mask.sum()),
+        "bools_where_true": int(bool_mask_where_true.sum()),
+    }
+
+
+def _single_pass_split(series: pd.Series) -> Dict[str, int]:
+    column = PreprocessedColumn.apply(series)
+    return {
+        "ints": len(column.numpy.ints),
+        "floats": len(column.numpy.floats),
+        "strings": len(column.pandas.strings),
+        "tensors": len(column.pandas.tensors),
+        "bools": column.bool_count,
+        "bools_where_true": column.bool_count_where_true,
+    }
+
+
+def _rows_per_second(split: Callable[[pd.Series], Dict[str, int]], series: pd.Series) -> float:
+    start = time.perf_counter()
+    split(series)
+    return len(series) / (time.perf_counter() - start)
+
+
+_OBJECT_COLUMNS = {
+    "strings": lambda n: pd.Series([f"s{i % 1000}" for i in range(n)], dtype="object"),
+    "ints": lambda n: pd.Series(list(range(n)), dtype="object"),
+    "mixed": lambda n: pd.Series(
+        [[i, "s", float(i), i % 2 == 0, None, Decimal(i)][i % 6] for i in range(n)], dtype="object"
+    ),
+}
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("column_kind", list(_OBJECT_COLUMNS.keys()))
+def test_object_column_split_benchmark(column_kind: str) -> None:
+    num_rows = 1000000
+    series = _OBJECT_COLUMNS[column_kind](num_rows)
+    assert _single_pass_split(series) == _apply_based_split(series)
+
+    before = _rows_per_second(_apply_based_split, series)
+    after = _rows_per_second(_single_pass_split, series)
+    TEST_LOGGER.info(
+        f"object column [{column_kind}] split of {num_rows} rows: Series.apply masks {before:,.0f} rows/sec, "
+        f"single pass {after:,.0f} rows/sec ({after / before:.1f}x)"
+    )
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("num_columns", [10, 100, 400])
+def test_track_dataset_workers_benchmark(num_columns: int) -> None:
+    num_rows = 100000
+    full_df = pd.DataFrame(np.random.random(size=(num_rows, num_columns)), columns=[str(i) for i in range(num_columns)])
+    serial_seconds = None
+    for max_workers in [1, 2, 4, 8]:
+        dataset_profile = DatasetProfile(DatasetSchema(max_workers=max_workers))
+        start = time.perf_counter()
+        dataset_profile.track(full_df)
+        seconds = time.perf_counter() - start
+        serial_seconds = serial_seconds or seconds
+        TEST_LOGGER.info(
+            f"dataset_profile.track on ({num_rows},{num_columns}) with max_workers={max_workers}: "
+            f"{seconds:.2f}s ({serial_seconds / seconds:.1f}x)"
+        )
+        assert dataset_profile.view().get_column("0").get_metric("counts").n.value == num_rows
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("cache_size", [8, 128, 1024])
+def test_track_row_buffer_benchmark(cache_size: int) -> None:
+    num_rows = 4096
+    rows = [_gen_test_row_message(i) for i in range(num_rows)]
+    df = pd.DataFrame(rows)
+
+    start = time.perf_counter()
+    DatasetProfile().track(df)
+    df_seconds = time.perf_counter() - start
+
+    dataset_profile = DatasetProfile(DatasetSchema(cache_size=cache_size))
+    start = time.perf_counter()
+    for row in rows:
+        dataset_profile.track(row=row)
+    view = dataset_profile.view()
+    row_seconds = time.perf_counter() - start
+    TEST_LOGGER.info(
+        f"track {num_rows} rows with cache_size={cache_size}: {num_rows / row_seconds:.0f} rows/s, "
+        f"DataFrame: {num_rows / df_seconds:.0f} rows/s"
+    )
+    assert view.get_column("optional_features").get_metric("counts").n.value == num_rows
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("num_columns", [10, 100, 1000, 10000])
+def test_serialize_benchmark(num_columns: int) -> None:
+    full_df = pd.DataFrame(np.random.random(size=(100, num_columns)), columns=[str(i) for i in range(num_columns)])
+    view = whylogs.log(full_df).view()
+    iterations = max(1, 1000 // num_columns)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        data = view.serialize()
+    seconds = (time.perf_counter() - start) / iterations
+    TEST_LOGGER.info(f"serialize() of {num_columns} columns: {seconds * 1000:.1f}ms ({len(data)} bytes)")
+
+
+@pytest.mark.load
+def test_read_selected_columns_benchmark(tmp_path: str) -> None:
+    num_columns = 2000
+    full_df = pd.DataFrame(np.random.random(size=(100, num_columns)), columns=[str(i) for i in range(num_columns)])
+    path = os.path.join(tmp_path, "profile.bin")
+    whylogs.log(full_df).view().write(path)
+
+    start = time.perf_counter()
+    DatasetProfileView.read(path)
+    full_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    view = DatasetProfileView.read(path, columns=["1", "100", "1000"])
+    selected_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lazy_view = DatasetProfileView.read(path, lazy=True)
+    open_seconds = time.perf_counter() - start
+    lazy_view.get_column("1000")
+    lazy_seconds = time.perf_counter() - start
+
+    TEST_LOGGER.info(
+        f"read {num_columns} columns: {full_seconds * 1000:.1f}ms, 3 columns: {selected_seconds * 1000:.1f}ms, "
+        f"lazy open: {open_seconds * 1000:.1f}ms, lazy open and 1 column: {lazy_seconds * 1000:.1f}ms"
+    )
+    assert view.get_column("100").get_metric("counts").n.value == 100
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("num_columns", [100, 1000])
+def test_read_benchmark(tmp_path: str, num_columns: int) -> None:
+    df = pd.DataFrame(np.random.random(size=(100, num_columns)), columns=[str(i) for i in range(num_columns)])
+    df["text"] = [f"s{i}" for i in range(100)]
+    path = os.path.join(tmp_path, "profile.bin")
+    whylogs.log(df).view().write(path)
+
+    iterations = max(1, 1000 // num_columns)
+    DatasetProfileView.read(path)
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    start = time.perf_counter()
+    for _ in range(iterations):
+        view = DatasetProfileView.read(path)
+    seconds = (time.perf_counter() - start) / iterations
+    gc.collect()
+    TEST_LOGGER.info(
+        f"read {num_columns + 1} columns: {seconds * 1000:.1f}ms, "
+        f"{len(gc.get_objects()) - objects_before} objects left after {iterations} reads"
+    )
+    assert view.get_column("text").get_metric("counts").n.value == 100
+
+
+@pytest.mark.load
+@pytest.mark.parametrize("workers", [None, 2, 4])
+def test_merge_views_benchmark(tmp_path: str, workers: Optional[int]) -> None:
+    num_profiles = 120
+    num_columns = 50
+    paths = []
+    for i in range(num_profiles):
+        df = pd.DataFrame(np.random.random(size=(100, num_columns)), columns=[str(c) for c in range(num_columns)])
+        path = os.path.join(tmp_path, f"profile_{i}.bin")
+        whylogs.log(df).view().write(path)
+        paths.append(path)
+
+    start = time.perf_counter()
+    reduced = reduce(lambda x, y: x.merge(y), (DatasetProfileView.read(path) for path in paths))
+    reduce_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = merge_views(paths, workers=workers)
+    seconds = time.perf_counter() - start
+    TEST_LOGGER.info(
+        f"merge {num_profiles} profiles of {num_columns} columns with workers={workers}: {seconds:.2f}s, "
+        f"left-fold reduce: {reduce_seconds:.2f}s"
+    )
+    assert merged.get_column("0").get_metric("counts").n.value == reduced.get_column("0").get_metric("counts").n.value
+
+
+@pytest.mark.load
+def test_merge_into_benchmark() -> None:
+    num_profiles = 200
+    num_columns = 20
+    views = []
+    for _ in range(num_profiles):
+        df = pd.DataFrame(np.random.random(size=(100, num_columns)), columns=[str(c) for c in range(num_columns)])
+        views.append(whylogs.log(df).view())
+
+    def accumulate_merge() -> DatasetProfileView:
+        return reduce(lambda x, y: x.merge(y), views)
+
+    def accumulate_merge_into() -> DatasetProfileView:
+        target = DatasetProfileView.zero()
+        for view in views:
+            target += view
+        return target
+
+    for name, accumulate in [("merge", accumulate_merge), ("merge_into", accumulate_merge_into)]:
+        # gen 0 collections are triggered by allocations of Python objects, so they measure allocation churn
+        collections = gc.get_stats()[0]["collections"]
+        start = time.perf_counter()
+        result = accumulate()
+        seconds = time.perf_counter() - start
+        collections = gc.get_stats()[0]["collections"] - collections
+
+        tracemalloc.start()
+        accumulate()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        TEST_LOGGER.info(
+            f"{name} of {num_profiles} profiles with {num_columns} columns: {seconds:.2f}s, "
+            f"gen 0 collections: {collections}, peak traced memory {peak / 1024:.0f} KB"
+        )
+        assert result.get_column("0").get_metric("counts").n.value == 100 * num_profiles
+
+
+@pytest.mark.load
+def test_segment_cache_spill_benchmark(tmp_path: Any) -> None:
+    num_segments = 300
+    num_columns = 5
+    schema = DatasetSchema(segments=segment_on_column("key"))
+    df = pd.DataFrame(
+        np.random.random(size=(4 * num_segments, num_columns)), columns=[str(c) for c in range(num_columns)]
+    )
+    df["key"] = np.arange(len(df)) % num_segments
+
+    for max_segments in [None, 100, 10]:
+        cache = SegmentCache(schema, max_segments=max_segments, spill_dir=str(tmp_path))
+        start = time.perf_counter()
+        for chunk in np.array_split(df, 4):
+            segment_processing(schema, chunk, segment_cache=cache)
+        log_seconds = time.perf_counter() - start
+        # the sketches live outside the Python heap, so the serialized size stands in for the memory held
+        resident_bytes = sum(len(profile.view().serialize()) for profile in cache.get_segments().values())
+        start = time.perf_counter()
+        results = cache.flush(None)
+        flush_seconds = time.perf_counter() - start
+        TEST_LOGGER.info(
+            f"{num_segments} segments with max_segments={max_segments}: log {log_seconds:.2f}s, "
+            f"flush {flush_seconds:.2f}s, profiles held in memory {resident_bytes / 1024:.0f} KB serialized"
+        )
+        assert len(results.segments()) == num_segments
+
+
+@pytest.mark.load
+def test_condition_count_benchmark() -> None:
+    num_rows = 200000
+    X = Predicate()
+    numeric_conditions = {f"between_{i}": Condition(X.greater_than(i).and_(X.less_than(i + 50))) for i in range(10)}
+    numeric_conditions.update({f"equals_{i}": Condition(X.not_.equals(i)) for i in range(10)})
+    string_conditions = {f"match_{i}": Condition(X.matches(f"{i}[0-9]*")) for i in range(10)}
+    string_conditions.update({f"fullmatch_{i}": Condition(X.fullmatch(f"[0-9]+{i}")) for i in range(10)})
+    ints = np.random.randint(0, 100, size=num_rows)
+    for name, conditions, series in [
+        ("ints", numeric_conditions, pd.Series(ints)),
+        ("strings", string_conditions, pd.Series(ints.astype(str))),
+    ]:
+        column = PreprocessedColumn.apply(series)
+        timings = {}
+        results = {}
+        for mode in ["columnar_update", "_update_elementwise"]:
+            metric = ConditionCountMetric.zero(ConditionCountConfig(conditions=conditions))
+            start = time.perf_counter()
+            getattr(metric, mode)(column)
+            timings[mode] = time.perf_counter() - start
+            results[mode] = metric.to_summary_dict()
+        TEST_LOGGER.info(
+            f"{len(conditions)} conditions on {num_rows} {name}: vectorized {timings['columnar_update']:.3f}s, "
+            f"element by element {timings['_update_elementwise']:.3f}s"
+        )
+        assert results["columnar_update"] == results["_update_elementwise"]
+
+
+@pytest.mark.load
+def test_unicode_range_benchmark() -> None:
+    num_strings = 100000
+    words = ["hello", "wörld", "日本語", "Ελληνικά", "emoji 😀", "12345", "MiXeD CaSe"]
+    strings = pd.Series([" ".join(random.choices(words, k=4)) for _ in range(num_strings)])
+    column = PreprocessedColumn.apply(strings)
+    timings = {}
+    summaries = {}
+    for mode in ["columnar_update", "_columnar_update_python"]:
+        metric = UnicodeRangeMetric.zero(MetricConfig())
+        start = time.perf_counter()
+        getattr(metric, mode)(column)
+        timings[mode] = time.perf_counter() - start
+        summaries[mode] = metric.to_summary_dict()
+    TEST_LOGGER.info(
+        f"unicode ranges of {num_strings} strings: vectorized {timings['columnar_update']:.2f}s, "
+        f"python loop {timings['_columnar_update_python']:.2f}s"
+    )
+    # the KLL sketches are randomized, so quantiles can differ between the two
+    for key, value in summaries["columnar_update"].items():
+        if "/q_" not in key and not key.endswith("/median"):
+            assert value == summaries["_columnar_update_python"][key]
+
+
+@pytest.mark.load
+def test_embedding_metric_benchmark() -> None:
+    from whylogs.experimental.extras.embedding_metric import (
+        DistanceFunction,
+        EmbeddingConfig,
+        EmbeddingMetric,
+    )
+
+    num_references = 64
+    dim = 32
+    config = EmbeddingConfig(references=np.random.random((num_references, dim)), distance_fn=DistanceFunction.euclidean)
+    embeddings = np.random.random((100000, dim))
+
+    metric = EmbeddingMetric.zero(config)
+    column = PreprocessedColumn.apply(pd.Series(list(embeddings), dtype=object))
+    start = time.perf_counter()
+    metric.columnar_update(column)
+    batched_seconds = time.perf_counter() - start
+
+    # one update per embedding is what logging them before batching amounted to
+    num_single = 1000
+    single_metric = EmbeddingMetric.zero(config)
+    columns = [PreprocessedColumn.apply(pd.Series([embedding], dtype=object)) for embedding in embeddings[:num_single]]
+    start = time.perf_counter()
+    for column in columns:
+        single_metric.columnar_update(column)
+    single_seconds = time.perf_counter() - start
+    TEST_LOGGER.info(
+        f"{len(embeddings)} embeddings x {num_references} references batched: {batched_seconds:.2f}s, "
+        f"{num_single} embeddings one at a time: {single_seconds:.2f}s"
+    )
+    assert metric.submetrics["closest"]["counts"].n.value == len(embeddings)
+
+
+@pytest.mark.load
+def test_model_performance_metrics_benchmark() -> None:
+    from whylogs.core.model_performance_metrics.confusion_matrix import ConfusionMatrix
+    from whylogs.core.model_performance_metrics.regression_metrics import (
+        RegressionMetrics,
+    )
+
+    num_rows = 200000
+    for num_classes in [2, 200]:
+        labels = [f"class_{i}" for i in range(num_classes)]
+        predictions = random.choices(labels, k=num_rows)
+        targets = random.choices(labels, k=num_rows)
+        scores = np.random.random(num_rows).tolist()
+        timings = {}
+        for name in ["add", "_add_batches"]:
+            confusion_matrix = ConfusionMatrix(labels=labels)
+            start = time.perf_counter()
+            getattr(confusion_matrix, name)(predictions, targets, scores)
+            timings[name] = time.perf_counter() - start
+            assert sum(dist.n for dist in confusion_matrix.confusion_matrix.values()) == num_rows
+        TEST_LOGGER.info(
+            f"confusion matrix of {num_rows} rows with {num_classes} classes: vectorized {timings['add']:.2f}s, "
+            f"per row encoding and grouping {timings['_add_batches']:.2f}s"
+        )
+
+    regression_metrics = RegressionMetrics()
+    predictions = np.random.random(10 * num_rows).tolist()
+    targets = np.random.random(10 * num_rows).tolist()
+    start = time.perf_counter()
+    regression_metrics.add(predictions, targets)
+    TEST_LOGGER.info(f"regression metrics of {10 * num_rows} rows: {time.perf_counter() - start:.2f}s")
+
+
+@pytest.mark.load
+def test_log_stream_benchmark(tmp_path: Any) -> None:
+    num_rows = 500000
+    path = str(tmp_path / "data.csv")
+    df = pd.DataFrame(np.random.random(size=(num_rows, 4)), columns=[str(c) for c in range(4)])
+    df["strings"] = np.random.randint(0, 1000, size=num_rows).astype(str)
+    df.to_csv(path, index=False)
+    del df
+
+    def log_whole_file() -> Any:
+        return whylogs.log(pd.read_csv(path))
+
+    for name, log_file in [
+        ("read_csv then log", log_whole_file),
+        ("log_stream", lambda: whylogs.log_stream(path, chunksize=50000, read_ahead=0)),
+        ("log_stream with read ahead", lambda: whylogs.log_stream(path, chunksize=50000, read_ahead=1)),
+    ]:
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = log_file()
+        seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        TEST_LOGGER.info(f"{name} of {num_rows} rows: {seconds:.2f}s, peak traced memory {peak / 1024 / 1024:.0f} MB")
+        assert results.view().get_column("strings").get_metric("counts").n.value == num_rows
+
+
+@pytest.mark.load
+def test_segment_processing_benchmark() -> None:
+    schema = DatasetSchema(segments=segment_on_column("key"))
+
+    def groupby_segments(df: pd.DataFrame) -> Dict[Any, DatasetProfile]:
+        grouped = df.groupby(["key"])
+        profiles = {}
+        for group in grouped.groups.keys():
+            profile = DatasetProfile(schema)
+            profile.track(grouped.get_group(group))
+            profiles[group] = profile
+        return profiles
+
+    for num_segments in [10, 1000, 10000, 100000]:
+        num_rows = max(100000, 2 * num_segments)
+        df = pd.DataFrame(np.random.random(size=(num_rows, 2)), columns=["a", "b"])
+        df["key"] = np.random.randint(0, num_segments, size=num_rows)
+
+        start = time.perf_counter()
+        results = segment_processing(schema, df)
+        seconds = time.perf_counter() - start
+        message = f"{num_segments} segments of {num_rows} rows: sorted ranges {seconds:.2f}s"
+        if num_segments <= 10000:
+            start = time.perf_counter()
+            expected = groupby_segments(df)
+            message += f", groupby and get_group {time.perf_counter() - start:.2f}s"
+            assert len(results.segments()) == len(expected)
+        TEST_LOGGER.info(message)
+
+
+@pytest.mark.load
+def test_multi_partition_segment_processing_benchmark() -> None:
+    num_rows = 100000
+    df = pd.DataFrame(np.random.random(size=(num_rows, 4)), columns=[f"value{c}" for c in range(4)])
+    df["text"] = np.random.randint(0, 1000, size=num_rows).astype(str)
+    keys = [f"key{k}" for k in range(6)]
+    for key in keys:
+        df[key] = np.random.randint(0, 5, size=num_rows)
+    # segment on every key, then on every pair of keys
+    key_sets = [[key] for key in keys] + [[a, b] for i, a in enumerate(keys) for b in keys[i + 1 :]]
+
+    for num_partitions in [1, 6, 21]:
+        partitions = {}
+        for columns in key_sets[:num_partitions]:
+            partition = SegmentationPartition(name=",".join(columns), mapper=ColumnMapperFunction(col_names=columns))
+            partitions[partition.name] = partition
+
+        start = time.perf_counter()
+        results = segment_processing(DatasetSchema(segments=partitions), df)
+        shared_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        for name, partition in partitions.items():
+            segment_processing(DatasetSchema(segments={name: partition}), df)
+        separate_seconds = time.perf_counter() - start
+        TEST_LOGGER.info(
+            f"{num_partitions} partitions, {len(results.segments())} segments over {num_rows} rows: "
+            f"shared pass {shared_seconds:.2f}s, one pass per partition {separate_seconds:.2f}s"
+        )
+
+
+@pytest.mark.load
+def test_whylabs_upload_benchmark(monkeypatch: Any) -> None:
+    from tests.api.writer.test_whylabs import _local_writer, _upload_server
+
+    monkeypatch.setattr("whylogs.api.writer.whylabs._check_whylabs_condition_count_uncompound", lambda: False)
+    num_segments = 200
+    df = pd.DataFrame(
+        {"key": np.arange(num_segments * 10) % num_segments, "value": np.random.random(num_segments * 10)}
+    )
+    results = segment_processing(DatasetSchema(segments=segment_on_column("key")), df)
+    views = results.get_writables()
+
+    # a remote store answers in tens of milliseconds
+    with _upload_server([], delay_seconds=0.02) as (port, uploads):
+        writer = _local_writer(port, org_id="org-0", dataset_id="model-0")
+        start = time.perf_counter()
+        for view in views:
+            writer.write(file=view)
+        sequential_seconds = time.perf_counter() - start
+
+        writer = _local_writer(port, org_id="org-0", dataset_id="model-0", upload_workers=8)
+        start = time.perf_counter()
+        responses = writer.write_batch(views)
+        batch_seconds = time.perf_counter() - start
+
+    assert all(response[0] for response in responses)
+    stats = writer.upload_stats
+    TEST_LOGGER.info(
+        f"Uploaded {num_segments} segments: one by one {sequential_seconds:.2f}s, write_batch {batch_seconds:.2f}s, "
+        f"{stats.throughput / 1024:.0f} KiB/s, p50 latency {stats.latency_percentile(50) * 1000:.1f}ms, "
+        f"p95 latency {stats.latency_percentile(95) * 1000:.1f}ms"
+    )
+
+
+@pytest.mark.load
+def test_segment_container_benchmark(tmp_path: Any) -> None:
+    from whylogs.core.view.segmented_dataset_profile_view import (
+        SegmentContainerReader,
+        SegmentContainerWriter,
+    )
+
+    num_segments = 2000
+    df = pd.DataFrame(
+        {"key": np.arange(num_segments * 10) % num_segments, "value": np.random.random(num_segments * 10)}
+    )
+    views = segment_processing(DatasetSchema(segments=segment_on_column("key")), df).get_writables()
+
+    start = time.perf_counter()
+    for i, view in enumerate(views):
+        view.write(os.path.join(tmp_path, f"segment_{i}.bin"))
+    files_seconds = time.perf_counter() - start
+
+    path = os.path.join(tmp_path, "segments.bin")
+    start = time.perf_counter()
+    with SegmentContainerWriter(path) as writer:
+        for view in views:
+            writer.write(view)
+    container_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with SegmentContainerReader(path) as reader:
+        for view in views[::100]:
+            reader.read(view.segment)
+    read_seconds = (time.perf_counter() - start) / len(views[::100])
+    TEST_LOGGER.info(
+        f"{num_segments} segments: one file each {files_seconds:.2f}s, one container {container_seconds:.2f}s "
+        f"({os.path.getsize(path) / 1024:.0f} KiB), read one segment {read_seconds * 1000:.1f}ms"
+    )
+
+
+@pytest.mark.load
+def test_import_benchmark(tmp_path: Any) -> None:
+    import subprocess
+    import sys
+
+    path = os.path.join(tmp_path, "profile.bin")
+    whylogs.log(pd.DataFrame({"a": np.arange(100), "b": np.arange(100).astype(str)})).view().write(path)
+    env = dict(os.environ, WHYLOGS_NO_ANALYTICS="1")
+
+    def python_seconds(code: str, repeat: int = 5) -> float:
+        # best of a few fresh interpreters, they are the cold starts the import time matters for
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True, env=env)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    python_import = python_seconds("pass")
+    pandas_import = python_seconds("import pandas")
+    whylogs_import = python_seconds("import whylogs")
+    whylogs_read = python_seconds(f"import whylogs; whylogs.read({path!r}).view()")
+    TEST_LOGGER.info(
+        f"python {python_import * 1000:.0f}ms, import pandas {pandas_import * 1000:.0f}ms, "
+        f"import whylogs {whylogs_import * 1000:.0f}ms, import whylogs and read a profile {whylogs_read * 1000:.0f}ms"
+    )
+
+
+@pytest.mark.load
+def test_constraints_report_benchmark() -> None:
+    from whylogs.core.constraints import (
+        ConstraintsBuilder,
+        MetricConstraint,
+        MetricsSelector,
+    )
+    from whylogs.core.relations import Require
+
+    num_columns = 50
+    num_constraints = 20
+    df = pd.DataFrame({f"col_{i}": np.random.random(10000) for i in range(num_columns)})
+    view = whylogs.log(df).view()
+    builder = ConstraintsBuilder(dataset_profile_view=view)
+    for column_name in df.columns:
+        for i in range(num_constraints):
+            builder.add_constraint(
+                MetricConstraint(
+                    name=f"{column_name} mean below {i}",
+                    condition=Require("mean").less_than(i),
+                    metric_selector=MetricsSelector(column_name=column_name, metric_name="distribution"),
+                )
+            )
+    constraints = builder.build()
+
+    start = time.perf_counter()
+    report = constraints.generate_constraints_report(with_summary=True)
+    report_seconds = time.perf_counter() - start
+    TEST_LOGGER.info(f"Report of {len(report)} constraints on {num_columns} columns took {report_seconds * 1000:.0f}ms")
+
+
+@pytest.mark.load
+def test_constraints_plan_benchmark() -> None:
+    from whylogs.core.constraints import (
+        ConstraintsBuilder,
+        DatasetConstraint,
+        MetricConstraint,
+        MetricsSelector,
+        PrefixCondition,
+    )
+    from whylogs.core.relations import Require
+
+    num_segments = 1000
+    df = pd.DataFrame(
+        {
+            "key": np.arange(num_segments * 20) % num_segments,
+            "a": np.random.random(num_segments * 20),
+            "b": np.random.random(num_segments * 20),
+        }
+    )
+    results = whylogs.log(df, schema=DatasetSchema(segments=segment_on_column("key")))
+    segments = results.segments()
+    views = [results.view(segment) for segment in segments]
+
+    builder = ConstraintsBuilder(dataset_profile_view=views[0])
+    for column_name in ["a", "b"]:
+        for i in range(10):
+            builder.add_constraint(
+                MetricConstraint(
+                    name=f"{column_name} max below {i + 1}",
+                    condition=Require("max").less_than(i + 1),
+                    metric_selector=MetricsSelector(column_name=column_name, metric_name="distribution"),
+                )
+            )
+        builder.add_constraint(
+            DatasetConstraint(
+                name=f"{column_name} counted",
+                condition=PrefixCondition(f"and == :{column_name}:counts/n 20 == :{column_name}:distribution/n 20"),
+            )
+        )
+    constraints = builder.build()
+
+    start = time.perf_counter()
+    validated = [constraints.validate(view) for view in views]
+    validate_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    report = constraints.compile().report(results)
+    plan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    constraints.compile().report(results, max_workers=4)
+    parallel_seconds = time.perf_counter() - start
+
+    assert report.all(axis=1).tolist() == validated
+    TEST_LOGGER.info(
+        f"{len(report.columns)} constraints on {num_segments} segments: validate each profile "
+        f"{validate_seconds:.2f}s, plan report {plan_seconds:.2f}s, plan report with 4 threads {parallel_seconds:.2f}s"
+    )
+
+
+@pytest.mark.load
+def test_condition_validator_benchmark() -> None:
+    from whylogs.core.relations import Not
+    from whylogs.core.validators import ConditionValidator
+
+    num_rows = 200000
+    X = Predicate()
+    failed = []
+    strings = pd.Series([f"card 4{i:012d}" if i % 100 == 0 else f"request {i}" for i in range(num_rows)])
+    numbers = pd.Series(np.random.randint(0, 100, num_rows))
+
+    timings = {}
+    for name, data, conditions in [
+        ("strings", strings, {"noCreditCard": Not(X.matches(".*4[0-9]{12}(?:[0-9]{3})?"))}),
+        ("ints", numbers, {"lessthan90": X.less_than(90), "notZero": X.not_equal(0)}),
+    ]:
+        validator = ConditionValidator(
+            name=name, conditions=conditions, actions=[lambda name, cond_name, value: failed.append(value)]
+        )
+        column = PreprocessedColumn.apply(data)
+        start = time.perf_counter()
+        validator.columnar_validate(column)
+        timings[name] = time.perf_counter() - start
+    TEST_LOGGER.info(
+        f"Validated {num_rows} strings in {timings['strings']:.2f}s and {num_rows} ints in {timings['ints']:.2f}s, "
+        f"{len(failed)} failures passed to actions"
+    )
@@ -682,6 +682,138 @@ def test_apply_list(
             assert X.shape == Y.shape
 
 
+def test_apply_mixed_object_series() -> None:
+    column = [
+        1,
+        np.int32(2),
+        True,
+        np.bool_(False),
+        True,
+        1.5,
+        np.float32(2.5),
+        Decimal("3.5"),
+        math.inf,
+        "a",
+        np.str_("b"),
+        [1, 2],
+        np.asarray([3.0, 4.0]),
+        ["x", "y"],
+        np.timedelta64(1, "D"),
+        _UnknownType,
+        None,
+        math.nan,
+    ]
+    res = PreprocessedColumn.apply(pd.Series(column, dtype="object"))
+
+    assert res.numpy.ints.tolist() == [1, 2]
+    assert res.numpy.floats.tolist() == [1.5, 2.5, 3.5, math.inf]
+    assert res.pandas.strings.tolist() == ["a", "b"]
+    assert [t.tolist() for t in res.pandas.tensors] == [[1, 2], [3.0, 4.0]]
+    assert res.pandas.objs.tolist() == [["x", "y"], np.timedelta64(1, "D"), _UnknownType]
+    assert res.bool_count == 3
+    assert res.bool_count_where_true == 2
+    assert res.null_count == 2
+    assert res.nan_count == 1
+    assert res.inf_count == 1
+
+
+@pytest.mark.parametrize(
+    "column,attr,expected",
+    [
+        ([1, 2, 3], "ints", [1, 2, 3]),
+        ([1.0, 2.0, None], "floats", [1.0, 2.0]),
+        ([Decimal("1.5"), Decimal("2.5")], "floats", [1.5, 2.5]),
+        (["a", "b", None], "strings", ["a", "b"]),
+        ([True, False, True], None, []),
+    ],
+)
+def test_apply_homogeneous_object_series(column: List[Any], attr: Optional[str], expected: List[Any]) -> None:
+    res = PreprocessedColumn.apply(pd.Series(column, dtype="object"))
+    subviews = {
+        "ints": res.numpy.ints,
+        "floats": res.numpy.floats,
+        "strings": res.pandas.strings,
+        "tensors": res.pandas.tensors,
+        "objs": res.pandas.objs,
+    }
+    for name, subview in subviews.items():
+        if name == attr:
+            assert subview.tolist() == expected
+        else:
+            assert_subview_is_empty(subview)
+
+    if attr is None:
+        assert res.bool_count == len(column)
+        assert res.bool_count_where_true == sum(column)
+
+
+def test_apply_arrow_array() -> None:
+    pa = pytest.importorskip("pyarrow")
+
+    res = PreprocessedColumn.apply(pa.array([1, 2, None, 3]))
+    assert res.numpy.ints.tolist() == [1, 2, 3]
+    assert res.null_count == 1
+    assert res.nan_count == 0
+    assert res.len == 4
+
+    res = PreprocessedColumn.apply(pa.chunked_array([[1.0, None], [math.nan, math.inf]]))
+    assert res.numpy.floats.tolist() == [1.0, math.inf]
+    assert res.null_count == 2
+    assert res.nan_count == 2
+    assert res.inf_count == 1
+
+    res = PreprocessedColumn.apply(pa.array([True, False, None, True]))
+    assert res.bool_count == 3
+    assert res.bool_count_where_true == 2
+    assert res.null_count == 1
+
+    res = PreprocessedColumn.apply(pa.array(["a", None, "b", "a"]).dictionary_encode())
+    assert res.pandas.strings.tolist() == ["a", "b", "a"]
+    assert res.null_count == 1
+
+    res = PreprocessedColumn.apply(pa.array([[1, 2], [3]]))
+    assert [t.tolist() for t in res.pandas.tensors] == [[1, 2], [3]]
+
+
+def test_apply_arrow_array_is_zero_copy() -> None:
+    pa = pytest.importorskip("pyarrow")
+    array = pa.array(np.arange(10, dtype=np.int64))
+
+    res = PreprocessedColumn.apply(array)
+    assert np.shares_memory(res.numpy.ints, array.to_numpy())
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [1.5, np.nan, np.inf, 2.0, -np.inf, np.nan, 3.5, 4.0],
+        [1, 2, 3, 4, 5, 6, 7, 8],
+        pd.array([1, None, 3, None, 5, 6, 7, 8], dtype="Int64"),
+        ["a", None, 1, 2.5, "b", None, float("nan"), Decimal(1)],
+        ["a", True, None, False, "b", [1, 2], "c", "d"],
+    ],
+)
+def test_split_groups_matches_apply(values: Any) -> None:
+    series = pd.Series(values, index=range(10, 18))
+    codes = np.array([1, 0, -1, 2, 0, 1, 0, 2])
+    column = PreprocessedColumn.apply(series.reset_index(drop=True))
+
+    groups = list(column.split_groups(codes, 4))
+    assert len(groups) == 4
+    for group, result in enumerate(groups):
+        expected = PreprocessedColumn.apply(series[codes == group])
+        assert result.len == expected.len
+        for count in ["null_count", "nan_count", "inf_count", "bool_count", "bool_count_where_true"]:
+            assert getattr(result, count) == getattr(expected, count)
+        for view, expected_view in [(result.numpy, expected.numpy), (result.pandas, expected.pandas)]:
+            for name in ["ints", "floats", "strings", "tensors", "objs"]:
+                part = getattr(view, name, None)
+                expected_part = getattr(expected_view, name, None)
+                assert (part is None or len(part) == 0) == (expected_part is None or len(expected_part) == 0)
+                if expected_part is not None and len(expected_part) > 0:
+                    assert [repr(v) for v in part] == [repr(v) for v in expected_part]
+
+
 def test_apply_iterable() -> None:
     pass
 
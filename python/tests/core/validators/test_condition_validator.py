@@ -1,6 +1,8 @@
+import random
 from logging import getLogger
 from typing import Any
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -126,3 +128,63 @@ def test_number_conditions(numbers):
     assert profile._columns["floats"]._column_validators[0].failures["equals42"] == 4
     assert profile._columns["ints"]._column_validators[0].failures["equals42"] == 3
     assert profile._columns["ints"]._column_validators[1].failures["isEven"] == 1
+
+
+def test_condition_validator_accumulates_total(credit_card_validator, transcriptions) -> None:
+    credit_card_validator.columnar_validate(PreprocessedColumn.apply(transcriptions))
+    credit_card_validator.columnar_validate(PreprocessedColumn.apply(transcriptions[:2]))
+
+    assert credit_card_validator.to_summary_dict() == {"total_evaluations": 6, "noCreditCard": 2}
+
+
+def test_condition_validator_batch_actions() -> None:
+    calls = []
+    validator = ConditionValidator(
+        name="numbers",
+        conditions={"lessthan5": X.less_than(5), "isEven": even},
+        actions=[lambda name, cond_name, failed: calls.append((name, cond_name, list(failed)))],
+        batch_actions=True,
+    )
+
+    # the string raises in both conditions, it fails them
+    validator.columnar_validate(PreprocessedColumn.apply([1, 12, 42, 7, "x", 3.5]))
+
+    assert validator.to_summary_dict() == {"total_evaluations": 6, "lessthan5": 4, "isEven": 4}
+    assert sorted(calls) == [("numbers", "isEven", [1, 7, 3.5, "x"]), ("numbers", "lessthan5", [12, 42, 7, "x"])]
+
+
+def test_condition_validator_max_action_values() -> None:
+    failed = []
+    validator = ConditionValidator(
+        name="numbers",
+        conditions={"lessthan5": X.less_than(5)},
+        actions=[lambda name, cond_name, value: failed.append(value)],
+        max_action_values=10,
+    )
+
+    validator.columnar_validate(PreprocessedColumn.apply(list(range(1000))))
+
+    assert validator.failures["lessthan5"] == 995
+    assert len(failed) == 10
+    assert failed == sorted(failed) and all(value >= 5 for value in failed)
+    with pytest.raises(ValueError):
+        ConditionValidator(name="invalid", conditions={}, actions=[], max_action_values=-1)
+
+
+def test_condition_validator_sampling_keeps_global_random_state() -> None:
+    validator = ConditionValidator(
+        name="numbers",
+        conditions={"lessthan5": X.less_than(5)},
+        actions=[lambda name, cond_name, value: None],
+        max_action_values=10,
+    )
+    np.random.seed(0)
+    random.seed(0)
+    expected = (np.random.random(), random.random())
+
+    np.random.seed(0)
+    random.seed(0)
+    validator.columnar_validate(PreprocessedColumn.apply(list(range(1000))))
+    validator._validate_elementwise(PreprocessedColumn.apply(list(range(1000))))
+
+    assert (np.random.random(), random.random()) == expected
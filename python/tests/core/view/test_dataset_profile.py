@@ -6,6 +6,13 @@ import pandas as pd
 import pytest
 
 from whylogs.core import DatasetProfile, DatasetSchema
+from whylogs.core.metrics.condition_count_metric import (
+    Condition,
+    ConditionCountConfig,
+    ConditionCountMetric,
+)
+from whylogs.core.relations import Predicate
+from whylogs.core.validators import ConditionValidator
 
 FLOAT_TYPES = [float, np.float16, np.float32, np.float64, np.floating, np.float_, np.longdouble]
 INTEGER_TYPES = [int, np.intc, np.uintc, np.int_, np.uint, np.longlong, np.ulonglong]
@@ -89,6 +96,56 @@ def test_different_int_types(profile, data_type) -> None:
     assert profile._columns["col1"]._schema.dtype == int
 
 
+def test_track_arrow_table_matches_pandas() -> None:
+    pa = pytest.importorskip("pyarrow")
+    d = {
+        "ints": [1, 2, 3, 4],
+        "floats": [1.5, None, float("nan"), float("inf")],
+        "strings": ["a", "b", None, "a"],
+        "bools": [True, False, True, None],
+    }
+    df = pd.DataFrame(data=d)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.set_column(2, "strings", table.column("strings").dictionary_encode())
+
+    arrow_profile = DatasetProfile()
+    arrow_profile.track(table)
+    pandas_profile = DatasetProfile()
+    pandas_profile.track(pandas=df)
+
+    arrow_view = arrow_profile.view()
+    pandas_view = pandas_profile.view()
+    for col_name in ["ints", "floats", "strings"]:
+        for metric_name in ["counts", "types", "cardinality"]:
+            arrow_summary = arrow_view.get_column(col_name).get_metric(metric_name).to_summary_dict()
+            pandas_summary = pandas_view.get_column(col_name).get_metric(metric_name).to_summary_dict()
+            assert arrow_summary == pandas_summary
+
+    assert arrow_view.get_column("ints").get_metric("distribution").n == 4
+    assert arrow_view.get_column("floats").get_metric("distribution").n == 2
+    frequent_strings = arrow_view.get_column("strings").get_metric("frequent_items").strings
+    assert [(item.value, item.est) for item in frequent_strings] == [("a", 2), ("b", 1)]
+    bool_counts = arrow_view.get_column("bools").get_metric("counts").to_summary_dict()
+    assert bool_counts["n"] == 4 and bool_counts["null"] == 1
+    assert arrow_view.get_column("bools").get_metric("types").to_summary_dict()["boolean"] == 3
+
+
+def test_track_arrow_record_batch_chunks() -> None:
+    pa = pytest.importorskip("pyarrow")
+    batch = pa.RecordBatch.from_pydict({"col1": [1, 2, 3], "col2": ["x", "y", "z"]})
+    table = pa.Table.from_batches([batch, batch])
+
+    profile = DatasetProfile()
+    profile.track(batch)
+    profile.track(table)
+
+    view = profile.view()
+    assert profile._columns["col1"]._schema.dtype == np.int64
+    assert profile._columns["col2"]._schema.dtype.name == "object"
+    assert view.get_column("col1").get_metric("counts").n.value == 9
+    assert view.get_column("col2").get_metric("types").to_summary_dict()["string"] == 9
+
+
 def test_track_with_custom_schema() -> None:
     schema = DatasetSchema(types={"col1": str, "col2": np.int32, "col3": str})
     prof = DatasetProfile(schema=schema)
@@ -108,3 +165,150 @@ def test_default_dataset_timestamp() -> None:
 
     # the time in seconds between DatasetProfile creation and t1 assignment should be relatively small
     assert timestamp_delta < 30
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 4])
+def test_track_columns_with_workers(max_workers) -> None:
+    df = pd.DataFrame(
+        {
+            "ints": np.arange(1000),
+            "floats": np.linspace(0, 1, 1000),
+            "strings": [f"s{i % 10}" for i in range(1000)],
+        }
+    )
+    serial_profile = DatasetProfile()
+    serial_profile.track(pandas=df)
+    profile = DatasetProfile(DatasetSchema(max_workers=max_workers))
+    profile.track(pandas=df)
+    profile.track(pandas=df)
+
+    serial_view = serial_profile.view()
+    view = profile.view()
+    for col_name in df.columns:
+        counts = view.get_column(col_name).get_metric("counts").to_summary_dict()
+        assert counts["n"] == 2000
+        cardinality = view.get_column(col_name).get_metric("cardinality").to_summary_dict()
+        serial_cardinality = serial_view.get_column(col_name).get_metric("cardinality").to_summary_dict()
+        assert cardinality == serial_cardinality
+
+
+def test_invalid_max_workers() -> None:
+    with pytest.raises(ValueError):
+        DatasetSchema(max_workers=0)
+
+
+def test_track_row_resolves_only_new_keys(mocker) -> None:
+    schema = DatasetSchema(cache_size=3)
+    profile = DatasetProfile(schema)
+    resolve = mocker.spy(schema, "resolve")
+
+    for i in range(5):
+        profile.track(row={"a": i, "b": str(i)})
+    profile.track(row={"a": 5, "c": 1.5})
+
+    assert resolve.call_count == 2
+    assert resolve.call_args_list[1].kwargs["row"] == {"c": 1.5}
+    assert set(profile._columns.keys()) == {"a", "b", "c"}
+
+
+def test_track_row_buffers_rows_until_cache_size(mocker) -> None:
+    profile = DatasetProfile(DatasetSchema(cache_size=3))
+    profile.track(row={"a": 1, "b": "x"})
+    track_column = mocker.spy(profile._columns["a"], "track_column")
+
+    profile.track(row={"a": 2})
+    assert track_column.call_count == 0
+
+    profile.track(row={"a": 3, "b": "y"})
+    assert track_column.call_count == 1
+    assert track_column.call_args[0][0] == [1, 2, 3]
+    assert profile._row_buffer == []
+
+    profile.track(row={"a": 4})
+    view = profile.view()
+    assert view.get_column("a").get_metric("counts").n.value == 4
+    assert view.get_column("a").get_metric("ints").to_summary_dict() == {"max": 4, "min": 1}
+    assert view.get_column("b").get_metric("counts").n.value == 2
+    assert view.get_column("b").get_metric("counts").null.value == 0
+
+
+def test_track_row_copies_buffered_row() -> None:
+    profile = DatasetProfile()
+    row = {"a": 1}
+    profile.track(row=row)
+    row["a"] = 2
+    profile.track(row=row)
+
+    assert profile.view().get_column("a").get_metric("ints").to_summary_dict() == {"max": 2, "min": 1}
+
+
+def test_track_row_flushes_on_cache_bytes(mocker) -> None:
+    profile = DatasetProfile(DatasetSchema(cache_bytes=200))
+    profile.track(row={"a": "x" * 10})
+    track_column = mocker.spy(profile._columns["a"], "track_column")
+
+    profile.track(row={"a": "x" * 10})
+    assert track_column.call_count == 0
+    profile.track(row={"a": "x" * 100})
+    assert track_column.call_count == 1
+    assert profile._row_buffer == []
+
+
+def test_track_row_flushes_on_cache_max_age(mocker) -> None:
+    profile = DatasetProfile(DatasetSchema(cache_max_age=60))
+    monotonic = mocker.patch("whylogs.core.dataset_profile.time.monotonic", return_value=100.0)
+    profile.track(row={"a": 1})
+    track_column = mocker.spy(profile._columns["a"], "track_column")
+
+    monotonic.return_value = 159.0
+    profile.track(row={"a": 2})
+    assert track_column.call_count == 0
+
+    monotonic.return_value = 160.0
+    profile.track(row={"a": 3})
+    assert track_column.call_count == 1
+    assert track_column.call_args[0][0] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("kwargs", [{"cache_bytes": -1}, {"cache_max_age": -1.0}])
+def test_invalid_row_buffer_limits(kwargs) -> None:
+    with pytest.raises(ValueError):
+        DatasetSchema(**kwargs)
+
+
+def test_track_row_runs_validator_actions_on_track() -> None:
+    failures = []
+    validator = ConditionValidator(
+        name="positive",
+        conditions={"positive": Predicate().greater_than(0)},
+        actions=[lambda *args: failures.append(args)],
+    )
+    profile = DatasetProfile(DatasetSchema(validators={"x": [validator]}))
+    profile.track(row={"x": -1})
+
+    assert failures == [("positive", "positive", -1)]
+    assert profile._row_buffer == []
+
+
+def test_track_row_raises_condition_failures_on_track() -> None:
+    profile = DatasetProfile()
+    profile.track(row={"x": 1})
+    conditions = {"positive": Condition(Predicate().greater_than(0), throw_on_failure=True)}
+    profile.add_metric("x", ConditionCountMetric.zero(ConditionCountConfig(conditions=conditions)))
+
+    with pytest.raises(ValueError):
+        profile.track(row={"x": -1})
+    profile.track(row={"x": 2})
+    assert profile.view().get_column("x").get_metric("counts").n.value == 3
+
+
+def test_track_row_keeps_rows_when_flush_fails(mocker) -> None:
+    profile = DatasetProfile(DatasetSchema(cache_size=2))
+    profile.track(row={"a": 1})
+    mocker.patch.object(profile._columns["a"], "track_column", side_effect=[RuntimeError("failed"), None])
+
+    with pytest.raises(RuntimeError):
+        profile.track(row={"a": 2})
+    assert profile._row_buffer == [{"a": 1}, {"a": 2}]
+    profile.view()
+    assert profile._row_buffer == []
@@ -3,9 +3,10 @@ import pickle
 import time
 
 import pandas as pd
+import pytest
 
 import whylogs as why
-from whylogs.core import DatasetProfile, DatasetProfileView
+from whylogs.core import ColumnProfileView, DatasetProfile, DatasetProfileView
 from whylogs.core.model_performance_metrics.model_performance_metrics import (
     ModelPerformanceMetrics,
 )
@@ -70,6 +71,77 @@ def test_view_serder_bytes() -> None:
     assert len(view.to_pandas()) == len(rt.to_pandas())
 
 
+def test_view_serialize_matches_write(tmp_path: str) -> None:
+    df = pd.DataFrame(data={f"col{i}": [i, i + 1, None] for i in range(20)})
+    view = why.log(df).view()
+    output_file = os.path.join(tmp_path, "view.bin")
+    view.write(output_file)
+    data = view.serialize()
+
+    with open(output_file, "rb") as f:
+        assert len(f.read()) == len(data)
+    _assert_profiles_are_equal(DatasetProfileView.read(output_file), DatasetProfileView.deserialize(data))
+
+
+def test_read_selected_columns(tmp_path: str) -> None:
+    df = pd.DataFrame(data={f"col{i}": [i, i + 1, None] for i in range(20)})
+    view = why.log(df).view()
+    output_file = os.path.join(tmp_path, "view.bin")
+    view.write(output_file)
+
+    res = DatasetProfileView.read(output_file, columns=["col3", "col12", "missing"])
+
+    assert list(res.get_columns().keys()) == ["col3", "col12"]
+    for col_name in ["col3", "col12"]:
+        assert res.get_column(col_name).to_protobuf() == view.get_column(col_name).to_protobuf()
+    assert res.creation_timestamp == DatasetProfileView.read(output_file).creation_timestamp
+
+
+@pytest.mark.parametrize("from_bytes", [True, False])
+def test_lazy_read_decodes_columns_on_access(tmp_path: str, from_bytes: bool, mocker) -> None:
+    df = pd.DataFrame(data={f"col{i}": [i, i + 1, None] for i in range(20)})
+    view = why.log(df).view()
+    output_file = os.path.join(tmp_path, "view.bin")
+    view.write(output_file)
+    from_protobuf = mocker.spy(ColumnProfileView, "from_protobuf")
+
+    if from_bytes:
+        res = DatasetProfileView.deserialize(view.serialize(), lazy=True)
+    else:
+        res = DatasetProfileView.read(output_file, lazy=True)
+    assert from_protobuf.call_count == 0
+
+    assert res.get_column("col7").to_protobuf() == view.get_column("col7").to_protobuf()
+    assert res.get_column("col7") is res.get_column("col7")
+    assert from_protobuf.call_count == 1
+    assert len(res.get_columns()) == 20
+
+    merged = res.merge(view)
+    assert merged.get_column("col7").get_metric("counts").n.value == 6
+    _assert_profiles_are_equal(DatasetProfileView.deserialize(res.serialize()), DatasetProfileView.read(output_file))
+
+
+def test_merge_into_matches_merge() -> None:
+    view1 = why.log(pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None]})).view()
+    view2 = why.log(pd.DataFrame({"a": [4.5, 5.5], "c": [True, False]})).view()
+    view1_copy = DatasetProfileView.deserialize(view1.serialize())
+    view2_copy = DatasetProfileView.deserialize(view2.serialize())
+    expected = view1.merge(view2)
+
+    target = DatasetProfileView.deserialize(view1.serialize())
+    assert view2.merge_into(target) is target
+    pd.testing.assert_frame_equal(target.to_pandas(), expected.to_pandas())
+    assert target.creation_timestamp == min(view1_copy.creation_timestamp, view2.creation_timestamp)
+
+    # the source is untouched by later in-place merges into the target
+    target += view1
+    for view, view_copy in [(view1, view1_copy), (view2, view2_copy)]:
+        for col_name, column in view.get_columns().items():
+            assert column.to_protobuf() == view_copy.get_column(col_name).to_protobuf()
+    assert target.get_column("c").get_metric("counts").n.value == 2
+    assert target.get_column("a").get_metric("counts").n.value == 8
+
+
 def test_merge_nan_column(lending_club_df) -> None:
     series_1 = lending_club_df.head(500)
     series_2 = lending_club_df.tail(500)
@@ -212,3 +284,55 @@ def test_zero_and_merging() -> None:
     _assert_profiles_are_equal(view1, merged_zero_1)
     _assert_profiles_are_equal(view2, merged_zero_2)
     _assert_profiles_are_equal(merged1_2, merged_zero_1_2)
+
+
+def test_merge_into_keeps_source_dataset_metrics() -> None:
+    sources = []
+    for predictions in [[1, 2], [3, 4]]:
+        results = why.log_regression_metrics(
+            pd.DataFrame({"prediction": predictions, "target": [1, 3]}),
+            target_column="target",
+            prediction_column="prediction",
+        )
+        sources.append(results.view())
+    a, b = sources
+    a_metrics = dict(a._metrics)
+    b_metrics = dict(b._metrics)
+
+    target = DatasetProfileView(columns={}, dataset_timestamp=None, creation_timestamp=None)
+    a.merge_into(target)
+    b.merge_into(target)
+
+    assert target._metrics is not a._metrics and target._metrics is not b._metrics
+    assert a._metrics == a_metrics and b._metrics == b_metrics
+    performance = target._metrics["model_performance_metrics"]
+    assert performance.regression_metrics.count == 4
+    assert a._metrics["model_performance_metrics"].regression_metrics.count == 2
+
+
+def test_iadd_after_merge_keeps_merge_inputs() -> None:
+    a = why.log(pd.DataFrame({"x": [1, 2], "y": ["a", "b"]})).view()
+    b = why.log(pd.DataFrame({"x": [3], "z": [1.5]})).view()
+    c = why.log(pd.DataFrame({"x": [4], "y": ["c"], "z": [2.5]})).view()
+    a_copy = DatasetProfileView.deserialize(a.serialize())
+    b_copy = DatasetProfileView.deserialize(b.serialize())
+
+    merged = a.merge(b)
+    merged += c
+
+    assert merged.get_column("x").get_metric("counts").n.value == 4
+    assert merged.get_column("y").get_metric("counts").n.value == 3
+    assert merged.get_column("z").get_metric("counts").n.value == 2
+    for view, view_copy in [(a, a_copy), (b, b_copy)]:
+        for col_name, column in view.get_columns().items():
+            assert column.to_protobuf() == view_copy.get_column(col_name).to_protobuf()
+
+
+def test_iadd_keeps_live_profile() -> None:
+    profile = why.log(pd.DataFrame({"x": [1, 2]})).profile()
+    view = profile.view()
+
+    view += why.log(pd.DataFrame({"x": [3]})).view()
+
+    assert view.get_column("x").get_metric("counts").n.value == 3
+    assert profile.view().get_column("x").get_metric("counts").n.value == 2
@@ -0,0 +1,52 @@
+import os
+
+import pandas as pd
+import pytest
+
+import whylogs as why
+from whylogs.core import DatasetProfileView
+from whylogs.core.view import merge_views
+
+
+def _views(count: int):
+    return [why.log(pd.DataFrame({"a": [i, i + 1], "b": [f"x{i}", None]})).view() for i in range(count)]
+
+
+def _assert_counts(view: DatasetProfileView, count: int) -> None:
+    assert view.get_column("a").get_metric("counts").n.value == 2 * count
+    assert view.get_column("b").get_metric("counts").null.value == count
+    assert view.get_column("a").get_metric("distribution").max == count
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_merge_views(workers) -> None:
+    views = _views(37)
+    merged = merge_views(iter(views), workers=workers, batch_size=4)
+    _assert_counts(merged, 37)
+    # serialized timestamps are truncated to milliseconds
+    oldest = min(v.creation_timestamp for v in views)
+    assert abs((merged.creation_timestamp - oldest).total_seconds()) < 0.001
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_merge_views_from_paths_and_bytes(tmp_path: str, workers) -> None:
+    sources = []
+    for i, view in enumerate(_views(10)):
+        if i % 2:
+            sources.append(view.serialize())
+        else:
+            path = os.path.join(tmp_path, f"profile_{i}.bin")
+            view.write(path)
+            sources.append(path)
+
+    _assert_counts(merge_views(sources, workers=workers, batch_size=3), 10)
+
+
+def test_merge_views_empty() -> None:
+    assert merge_views([], workers=2).get_columns() == {}
+    assert merge_views([]).get_columns() == {}
+
+
+def test_merge_views_invalid_batch_size() -> None:
+    with pytest.raises(ValueError):
+        merge_views(_views(2), batch_size=1)
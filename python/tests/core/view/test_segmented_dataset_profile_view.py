@@ -0,0 +1,127 @@
+import io
+import os
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+import whylogs as why
+from whylogs.core import DatasetProfileView, DatasetSchema
+from whylogs.core.errors import DeserializationError
+from whylogs.core.proto import DatasetSegmentHeader
+from whylogs.core.segment import Segment
+from whylogs.core.segmentation_partition import segment_on_column
+from whylogs.core.utils.protobuf_utils import serialize_delimited_protobuf
+from whylogs.core.view.segmented_dataset_profile_view import (
+    SegmentContainerReader,
+    SegmentContainerWriter,
+    SegmentedDatasetProfileView,
+)
+
+
+def _segmented_views() -> List[SegmentedDatasetProfileView]:
+    df = pd.DataFrame({"x": [i % 3 for i in range(30)], "y": [i % 2 for i in range(30)], "value": range(30)})
+    partitions = {**segment_on_column("x"), **segment_on_column("y")}
+    results = why.log(df, schema=DatasetSchema(segments=partitions))
+    return [
+        SegmentedDatasetProfileView(profile_view=profile.view(), segment=segment, partition=partition)
+        for partition in results.partitions
+        for segment, profile in results.segments_in_partition(partition).items()
+    ]
+
+
+def _count(view: DatasetProfileView) -> int:
+    return view.get_column("value").get_metric("counts").n.value
+
+
+def test_container_round_trip(tmp_path: Any) -> None:
+    views = _segmented_views()
+    path = os.path.join(tmp_path, "segments.bin")
+    with SegmentContainerWriter(path) as writer:
+        for view in views:
+            writer.write(view)
+
+    with SegmentContainerReader(path) as reader:
+        assert reader.segments == [view.segment for view in views]
+        for view in reversed(views):
+            read_view = reader.read(view.segment)
+            assert _count(read_view) == _count(view.profile_view)
+            assert (
+                read_view.get_column("value").get_metric("distribution").max
+                == view.profile_view.get_column("value").get_metric("distribution").max
+            )
+        assert len(list(reader)) == len(views) == 5
+
+
+def test_container_read_by_key(tmp_path: Any) -> None:
+    views = _segmented_views()
+    buffer = io.BytesIO()
+    writer = SegmentContainerWriter(buffer)
+    for view in views:
+        writer.write(view)
+    writer.close()
+    path = os.path.join(tmp_path, "segments.bin")
+    with open(path, "wb") as f:
+        f.write(buffer.getvalue())
+
+    with SegmentContainerReader(path) as reader:
+        # only partition x has a segment "2"
+        assert _count(reader.read(("2",))) == 10
+        assert list(reader.read(("2",), columns=["value"]).get_columns()) == ["value"]
+        # both partitions have segments "0" and "1"
+        with pytest.raises(ValueError):
+            reader.read(("0",))
+        with pytest.raises(KeyError):
+            reader.read(("3",))
+        with pytest.raises(KeyError):
+            reader.read(Segment(key=("2",), parent_id="unknown"))
+        assert ("2",) in reader
+
+
+def test_single_segment_file(tmp_path: Any) -> None:
+    view = _segmented_views()[0]
+    path = os.path.join(tmp_path, "segment.bin")
+    view.write(path)
+
+    with SegmentContainerReader(path) as reader:
+        assert reader.segments == [view.segment]
+        assert _count(reader.read(view.segment)) == _count(view.profile_view)
+    # readers of unsegmented profiles read the first segment's profile
+    assert _count(DatasetProfileView.read(path)) == _count(view.profile_view)
+
+
+def test_single_segment_file_keeps_original_header() -> None:
+    view = _segmented_views()[0]
+    data = io.BytesIO()
+    view.write(file=data)
+    data.seek(0)
+    header = DatasetProfileView._read_segment_header(data)
+
+    assert header.layout_version == 0
+    assert [message.partition_id for message in header.segments] == [""]
+    assert header.offsets[0] == len(
+        serialize_delimited_protobuf(DatasetSegmentHeader(has_segments=True, offsets={0: 0}))
+    )
+    # the profile follows the header
+    assert _count(DatasetProfileView._read_profile(data)) == _count(view.profile_view)
+
+
+def test_container_streams_profiles_to_destination() -> None:
+    views = _segmented_views()
+    data = io.BytesIO()
+    writer = SegmentContainerWriter(data)
+    writer.write(views[0])
+    written = len(data.getvalue())
+    writer.write(views[1])
+    assert len(data.getvalue()) > written
+    written = len(data.getvalue())
+    # the index is appended on close
+    writer.close()
+    assert len(data.getvalue()) > written
+
+
+def test_unsegmented_file_is_rejected(tmp_path: Any) -> None:
+    path = os.path.join(tmp_path, "profile.bin")
+    why.log(pd.DataFrame({"value": [1, 2]})).view().write(path)
+    with pytest.raises(DeserializationError):
+        SegmentContainerReader(path)
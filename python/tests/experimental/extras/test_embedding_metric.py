@@ -1,7 +1,9 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 import whylogs as why
+from whylogs.core.metrics.metrics import OperationResult
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.resolvers import MetricSpec, ResolverSpec
 from whylogs.core.schema import DeclarativeSchema
@@ -103,3 +105,30 @@ def test_embedding_metric_serialization() -> None:
     )
     assert deserialized.submetrics["closest"]["counts"].n.value == 3
     assert (deserialized.references.value == metric.references.value).all()
+
+
+def test_embedding_metric_batches(monkeypatch) -> None:
+    # two reference vectors of 8 bytes per distance, so every batch holds 3 rows
+    monkeypatch.setattr("whylogs.experimental.extras.embedding_metric._DISTANCE_BATCH_BYTES", 48)
+    references = np.array([[0.01, 0.01, 0.01], [1, 1, 1]])
+    config = EmbeddingConfig(references=references, labels=["B", "A"], distance_fn=DistanceFunction.euclidean)
+    metric = EmbeddingMetric.zero(config)
+    rng = np.random.default_rng(0)
+    vectors = rng.random((10, 3)) * 2
+    tensors = [vectors[0], vectors[1:4], np.zeros(4)] + list(vectors[4:])  # one tensor has the wrong shape
+    result = metric.columnar_update(PreprocessedColumn.apply(pd.Series(tensors, dtype=object)))
+
+    assert result == OperationResult(failures=1, successes=len(tensors) - 1)
+    distances = DistanceFunction.euclidean(vectors, metric.references.value)
+    for i, label in enumerate(metric.labels):
+        distribution = metric.submetrics[f"{label}_distance"]["distribution"]
+        assert distribution.n == 10
+        assert distribution.mean.value == pytest.approx(distances[:, i].mean())
+        assert distribution.stddev == pytest.approx(distances[:, i].std(ddof=1))
+    closest = {
+        item.value: item.est
+        for item in metric.submetrics["closest"]["frequent_items"].to_summary_dict()["frequent_strings"]
+    }
+    expected = pd.Series(np.asarray(metric.labels)[distances.argmin(axis=1)]).value_counts().to_dict()
+    assert closest == expected
+    assert metric.submetrics["closest"]["types"].string.value == 10
@@ -1,6 +1,15 @@
+import os
+import subprocess
+import sys
+from typing import Any
+
+import numpy as np
 import pandas as pd
+import pytest
 
 import whylogs as why
+from whylogs.core.resolvers import MetricSpec, ResolverSpec
+from whylogs.core.schema import DeclarativeSchema
 
 
 def test_annotation() -> None:
@@ -13,3 +22,54 @@ def test_annotation() -> None:
     df = test_pdf()
     assert hasattr(df, "profiling_results")
     assert df.profiling_results is not None
+
+
+def _run_python(code: str) -> str:
+    env = dict(os.environ, WHYLOGS_NO_ANALYTICS="1")
+    return subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env=env
+    ).stdout.strip()
+
+
+def test_import_defers_optional_dependencies() -> None:
+    # run in a fresh interpreter, the test session has already imported everything
+    code = """
+import sys
+import pandas as pd
+import whylogs as why
+import whylogs.viz
+from whylogs.core import DatasetProfileView
+
+view = why.log(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})).view()
+DatasetProfileView.deserialize(view.serialize())
+print(sorted(m for m in ["IPython", "PIL", "sklearn", "whylabs_client", "boto3"] if m in sys.modules))
+"""
+    assert _run_python(code) == "[]"
+
+
+def test_lazy_metric_registration(tmp_path: Any) -> None:
+    embedding_metric = pytest.importorskip("whylogs.experimental.extras.embedding_metric")
+    schema = DeclarativeSchema(
+        [
+            ResolverSpec(
+                column_name="col1",
+                metrics=[
+                    MetricSpec(
+                        embedding_metric.EmbeddingMetric,
+                        embedding_metric.EmbeddingConfig(references=np.array([[0, 0], [1, 1]]), labels=["A", "B"]),
+                    )
+                ],
+            )
+        ]
+    )
+    path = str(tmp_path / "embedding.bin")
+    why.log(pd.DataFrame({"col1": [np.asarray([0.1, 0.2])]}), schema=schema).view().write(path)
+
+    code = f"""
+import sys
+import whylogs as why
+assert "sklearn" not in sys.modules
+view = why.read({path!r}).view()
+print(type(view.get_column("col1").get_metric("embedding")).__name__, "sklearn" in sys.modules)
+"""
+    assert _run_python(code) == "EmbeddingMetric True"
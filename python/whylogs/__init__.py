@@ -20,6 +20,7 @@ from .api import (
     log,
     log_classification_metrics,
     log_regression_metrics,
+    log_stream,
     logger,
     profiling,
     read,
@@ -55,6 +56,7 @@ __ALL__ = [
     log,
     log_classification_metrics,
     log_regression_metrics,
+    log_stream,
     logger,
     read,
     reader,
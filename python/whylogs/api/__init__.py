@@ -4,6 +4,7 @@ from .logger import (
     log,
     log_classification_metrics,
     log_regression_metrics,
+    log_stream,
     logger,
     read,
     reader,
@@ -14,6 +15,7 @@ __ALL__ = [
     log,
     log_classification_metrics,
     log_regression_metrics,
+    log_stream,
     logger,
     read,
     reader,
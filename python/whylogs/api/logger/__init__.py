@@ -13,9 +13,11 @@ from whylogs.api.logger.result_set import (
 from whylogs.api.logger.rolling import TimedRollingLogger
 from whylogs.api.logger.segment_processing import (
     _get_segment_from_group_key,
-    _grouped_dataframe,
     _log_segment,
+    _partition_columns,
+    _sorted_segments,
 )
+from whylogs.api.logger.stream import log_stream  # noqa: F401
 from whylogs.api.logger.transient import TransientLogger
 from whylogs.core import DatasetProfile, DatasetSchema
 from whylogs.core.model_performance_metrics.model_performance_metrics import (
@@ -73,10 +75,10 @@ def _segmented_performance_metrics(log_full_data, schema, data, performance_colu
 
     for partition_name in schema.segments:
         partition = schema.segments.get(partition_name)
-        grouped_data = _grouped_dataframe(partition, pandas=data)
+        sorted_data, group_keys, starts, ends = _sorted_segments(data, _partition_columns(partition))
         partition_segments = segmented_profiles.get(partition.id) or dict()
-        for group_key in grouped_data.groups.keys():
-            pandas_segment = grouped_data.get_group(group_key)
+        for group_key, start, end in zip(group_keys, starts, ends):
+            pandas_segment = sorted_data.iloc[start:end]
             segment_key = _get_segment_from_group_key(group_key, partition.id)
             diagnostic_logger.info(f"Computing {performance_metric} for segment {partition_name}->{segment_key}")
 
@@ -205,6 +207,7 @@ def logger(
 
 __ALL__ = [
     "log",
+    "log_stream",
     "read",
     "reader",
     "write",
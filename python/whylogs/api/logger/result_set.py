@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timezone
 from logging import getLogger
 from typing import Any, Dict, List, Optional, Union
 
@@ -133,9 +133,7 @@ class ResultSetWriter:
             logger.warning("Attempt to write a result set with no writables returned, nothing written!")
         else:
             logger.debug(f"About to write {len(files)} files:")
-            # TODO: special handling of large number of files, handle throttling
-            for view in files:
-                self._writer.write(profile=view, **kwargs)
+            self._writer.write_batch(files, **kwargs)
             logger.debug(f"Completed writing {len(files)} files!")
 
 
@@ -290,6 +288,13 @@ class SegmentedResultSet(ResultSet):
         self._dataset_properties = properties or dict()
 
     def profile(self, segment: Optional[Segment] = None) -> Optional[Union[DatasetProfile, DatasetProfileView]]:
+        """
+        Returns the profile of the given segment, or of the only segment when there is just one.
+
+        A segment may hold a DatasetProfile or a read-only DatasetProfileView, e.g. a segment that a bounded
+        SegmentCache spilled to disk comes back as a view. Use view() for a DatasetProfileView either way;
+        only a DatasetProfile can still track data.
+        """
         if not self._segments:
             return None
         elif segment:
@@ -330,7 +335,10 @@ class SegmentedResultSet(ResultSet):
             return
         for key in segment_keys:
             profile = self.profile(segment=key)
-            if profile:
+            if isinstance(profile, DatasetProfileView):
+                # segments spilled to disk by the SegmentCache come back as views
+                profile.dataset_timestamp = dataset_timestamp.astimezone(tz=timezone.utc)
+            elif profile:
                 profile.set_dataset_timestamp(dataset_timestamp)
 
     def segments(self, restrict_to_parition_id: Optional[str] = None) -> Optional[List[Segment]]:
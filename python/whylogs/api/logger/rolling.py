@@ -60,7 +60,13 @@ class Scheduler(object):
 
 
 class TimedRollingLogger(Logger):
-    """A rolling logger that continuously rotates files based on time."""
+    """
+    A rolling logger that continuously rotates files based on time.
+
+    When the schema defines segments, max_cached_segments bounds the number of segment profiles held in memory.
+    Least recently used segments beyond it are spilled to a temporary folder under spill_dir and merged back
+    at rollover.
+    """
 
     def __init__(
         self,
@@ -75,6 +81,8 @@ class TimedRollingLogger(Logger):
         fork: bool = False,
         skip_empty: bool = False,
         callback: Optional[Callable[[Writer, DatasetProfileView, str], None]] = None,
+        max_cached_segments: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ):
         super().__init__(schema)
         if base_name is None:
@@ -108,7 +116,7 @@ class TimedRollingLogger(Logger):
         now = time.time()
         self._current_batch_timestamp = self._compute_current_batch_timestamp(now)
         if schema and schema.segments:
-            self._segment_cache = SegmentCache(schema)
+            self._segment_cache = SegmentCache(schema, max_segments=max_cached_segments, spill_dir=spill_dir)
 
         self._current_profile: DatasetProfile = DatasetProfile(
             schema=schema,
@@ -229,7 +237,7 @@ class TimedRollingLogger(Logger):
 
             time_tuple = self._get_time_tuple()
 
-            profile_count = 0
+            timed_filenames = []
             for profile in profiles:
                 has_segments = isinstance(profile, SegmentedDatasetProfileView)
                 if has_segments:
@@ -237,18 +245,19 @@ class TimedRollingLogger(Logger):
                 else:
                     timed_filename = f"{self.base_name}.{time.strftime(self.suffix, time_tuple)}{self.file_extension}"
                 logging.debug("Writing out put with timed_filename: %s", timed_filename)
-
-                profile_count = profile_count + 1
-                logger.debug(f"Writing profile {profile_count} of {number_of_profiles}")
+                timed_filenames.append(timed_filename)
 
                 for store in self._store_list:
                     store.write(profile_view=profile, dataset_id=self.base_name)
 
-                for w in self._writers:
-                    w.write(file=profile, dest=timed_filename)
-                    if self._callback and callable(self._callback):
+            for w in self._writers:
+                logger.debug(f"Writing {number_of_profiles} profiles with {w}")
+                w.write_batch(profiles, dests=timed_filenames)
+                if self._callback and callable(self._callback):
+                    for profile, timed_filename in zip(profiles, timed_filenames):
                         self._callback(w, profile, timed_filename)
-                if not self._writers and self._callback and callable(self._callback):
+            if not self._writers and self._callback and callable(self._callback):
+                for profile, timed_filename in zip(profiles, timed_filenames):
                     self._callback(None, profile, timed_filename)
 
     def close(self) -> None:
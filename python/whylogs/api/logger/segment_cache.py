@@ -1,12 +1,18 @@
 import logging
+import os
+import shutil
+import tempfile
 import time
-from datetime import datetime
-from typing import Dict, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
 
 from whylogs.api.logger.result_set import SegmentedResultSet
 from whylogs.core.dataset_profile import DatasetProfile
 from whylogs.core.schema import DatasetSchema
 from whylogs.core.segment import Segment
+from whylogs.core.view.dataset_profile_view import DatasetProfileView
+from whylogs.core.view.merge import merge_views
 
 logger = logging.getLogger(__name__)
 
@@ -17,35 +23,135 @@ class SegmentCache(object):
 
     Stores DatasetProfiles while processing inputs using a segmentation DatasetSchema.
     The contained profiles may be stored in memory or on disk.
+
+    Args:
+        schema: the segmentation schema used to create the profiles.
+        segments: optional profiles to start with.
+        max_segments: maximum number of profiles kept in memory. When a new segment would exceed it, the least
+            recently used profile is serialized to the spill directory and dropped from memory. If the segment
+            shows up again it starts from a fresh profile, and the spilled profiles are merged back at flush.
+            Those segments are returned by flush as DatasetProfileViews, the others as DatasetProfiles.
+            None keeps every profile in memory.
+        spill_dir: directory in which a temporary folder for spilled profiles is created. Defaults to the
+            system temporary directory.
     """
 
-    def __init__(self, schema: DatasetSchema, segments: Optional[Dict[Segment, DatasetProfile]] = None):
+    def __init__(
+        self,
+        schema: DatasetSchema,
+        segments: Optional[Dict[Segment, DatasetProfile]] = None,
+        max_segments: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        if max_segments is not None and max_segments < 1:
+            raise ValueError(f"max_segments must be at least 1, got {max_segments}")
         self._schema = schema
-        self._cache = segments or dict()
+        self._cache: Dict[Segment, DatasetProfile] = OrderedDict(segments or dict())
+        self._max_segments = max_segments
+        self._spill_dir = spill_dir
+        self._spill_path: Optional[str] = None
+        self._spill_count = 0
+        self._spilled: Dict[Segment, List[str]] = dict()
+        self._spilled_metrics: Dict[Segment, Dict[str, Any]] = dict()
 
     def get_or_create_matching_profile(self, segment_key: Segment) -> DatasetProfile:
         profile = self._cache.get(segment_key)
         if profile is None:
             profile = DatasetProfile(schema=self._schema)
             self._cache[segment_key] = profile
+            self._evict()
+        else:
+            self._cache.move_to_end(segment_key)  # type: ignore
         return profile
 
     def get_segments(self) -> Dict[Segment, DatasetProfile]:
+        """Returns the profiles currently held in memory, spilled profiles are not included."""
         return self._cache
 
+    @property
+    def spilled_segments(self) -> int:
+        """Number of segments with at least one profile spilled to disk."""
+        return len(self._spilled)
+
+    def _evict(self) -> None:
+        if self._max_segments is None:
+            return
+        while len(self._cache) > self._max_segments:
+            # profiles being tracked right now are skipped, so the cache may briefly go over budget
+            segment_key = next((key for key, profile in self._cache.items() if not profile.is_active), None)
+            if segment_key is None:
+                return
+            self._spill(segment_key, self._cache.pop(segment_key))
+
+    def _spill(self, segment_key: Segment, profile: DatasetProfile) -> None:
+        if self._spill_path is None:
+            self._spill_path = tempfile.mkdtemp(prefix="whylogs_segments_", dir=self._spill_dir)
+        path = os.path.join(self._spill_path, f"segment_{self._spill_count}.bin")
+        self._spill_count += 1
+        view = profile.view()
+        # only the columns go to disk, the dataset-level metrics stay in memory: they are small and not all of
+        # them can be serialized
+        DatasetProfileView(
+            columns=view.get_columns(),
+            dataset_timestamp=view.dataset_timestamp,
+            creation_timestamp=view.creation_timestamp,
+        ).write(path)
+        self._spilled.setdefault(segment_key, []).append(path)
+        if view._metrics:
+            metrics = self._spilled_metrics.setdefault(segment_key, dict())
+            for metric_name, metric in view._metrics.items():
+                spilled_metric = metrics.get(metric_name)
+                metrics[metric_name] = metric if spilled_metric is None else spilled_metric.merge(metric)
+        logger.debug(f"Spilled profile for segment {segment_key} to {path}")
+
+    def _cleanup(self) -> None:
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+        self._spill_path = None
+        self._spilled = dict()
+        self._spilled_metrics = dict()
+
     def flush(self, dataset_timestamp: Optional[datetime]) -> SegmentedResultSet:
-        segmented_profiles: Dict[str, Dict[Segment, DatasetProfile]] = dict()
-        for segment_key in self._cache:
-            segments = segmented_profiles.get(segment_key.parent_id)
-            if segments is None:
-                segments = dict()
-                segmented_profiles[segment_key.parent_id] = segments
-            while self._cache[segment_key].is_active:
-                time.sleep(1)
-            segments[segment_key] = self._cache[segment_key]
-
-        results = SegmentedResultSet(segments=segmented_profiles, partitions=list(self._schema.segments.values()))
-        self._cache = dict()
-        if dataset_timestamp:
-            results.set_dataset_timestamp(dataset_timestamp)
-        return results
+        """
+        Returns the result set of all segments and starts over with an empty cache. Segments that were never
+        spilled keep their DatasetProfile. Spilled segments are merged with their on-disk profiles into a
+        DatasetProfileView, which can be written or viewed but not tracked into.
+        """
+        segmented_profiles: Dict[str, Dict[Segment, Union[DatasetProfile, DatasetProfileView]]] = dict()
+        cache, spilled = self._cache, self._spilled
+        self._cache = OrderedDict()
+        try:
+            for segment_key in list(cache) + [key for key in spilled if key not in cache]:
+                segments = segmented_profiles.get(segment_key.parent_id)
+                if segments is None:
+                    segments = dict()
+                    segmented_profiles[segment_key.parent_id] = segments
+                profile = cache.get(segment_key)
+                if profile is not None:
+                    while profile.is_active:
+                        time.sleep(1)
+                    if dataset_timestamp:
+                        profile.set_dataset_timestamp(dataset_timestamp)
+                if segment_key not in spilled:
+                    segments[segment_key] = profile
+                    continue
+                sources: List[Union[str, DatasetProfileView]] = list(spilled[segment_key])
+                if profile is not None:
+                    sources.append(profile.view())
+                if segment_key in self._spilled_metrics:
+                    sources.append(
+                        DatasetProfileView(
+                            columns={},
+                            dataset_timestamp=None,
+                            creation_timestamp=None,
+                            metrics=self._spilled_metrics[segment_key],
+                        )
+                    )
+                view = merge_views(sources)
+                if dataset_timestamp:
+                    view.dataset_timestamp = dataset_timestamp.astimezone(tz=timezone.utc)
+                segments[segment_key] = view
+        finally:
+            self._cleanup()
+
+        return SegmentedResultSet(segments=segmented_profiles, partitions=list(self._schema.segments.values()))
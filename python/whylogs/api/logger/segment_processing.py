@@ -6,13 +6,14 @@ from whylogs.api.logger.segment_cache import SegmentCache
 from whylogs.core import DatasetSchema
 from whylogs.core.dataset_profile import DatasetProfile
 from whylogs.core.input_resolver import _pandas_or_dict
+from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.segment import Segment
 from whylogs.core.segmentation_partition import SegmentationPartition, SegmentFilter
-from whylogs.core.stubs import pd
+from whylogs.core.stubs import np, pd
 
 logger = logging.getLogger(__name__)
 
-_MAX_SEGMENT_PARTITIONS = 10
+_MAX_SEGMENT_PARTITIONS = 1000
 
 
 def _process_segment(
@@ -44,23 +45,112 @@ def _get_segment_from_group_key(group_key, partition_id) -> Tuple[str, ...]:
     return Segment(segment_tuple_key, partition_id)
 
 
+def _segment_codes(
+    pandas: pd.DataFrame, columns: List[str], mask: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, List[Tuple[Any, ...]]]:
+    """
+    Number the segment of each row of a DataFrame from 0, in the order pandas.groupby(columns) sorts the segments.
+    Rows with a null segment key, or outside of the mask, get -1.
+
+    Returns:
+        the segment code of each row and the values of the segment columns for each segment.
+    """
+    codes = pandas.groupby(columns, sort=True).ngroup().to_numpy()
+    # rows with a null segment key have no group, like pandas.groupby they are dropped. Depending on the version,
+    # pandas may still number the groups of null keys when segmenting on several columns
+    skipped = pandas[columns].isnull().to_numpy().any(axis=1)
+    if mask is not None:
+        skipped |= ~mask
+    rows = np.flatnonzero(~skipped)
+    _, first_rows, row_codes = np.unique(codes[rows], return_index=True, return_inverse=True)
+    codes = np.full(len(pandas), -1, dtype=np.int64)
+    codes[rows] = row_codes
+    key_values = [pandas[column].take(rows[first_rows]).tolist() for column in columns]
+    return codes, list(zip(*key_values))
+
+
+def _sorted_segments(
+    pandas: pd.DataFrame, columns: List[str]
+) -> Tuple[pd.DataFrame, List[Tuple[Any, ...]], List[int], List[int]]:
+    """
+    Sort the rows of a DataFrame by segment, so each segment is the contiguous range of rows [start, end).
+    Segments are found and ordered like pandas.groupby(columns) would, without building a DataFrame per group.
+
+    Returns:
+        the sorted DataFrame, the values of the segment columns for each segment, and the start and end
+        position of each segment.
+    """
+    codes, group_keys = _segment_codes(pandas, columns)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(group_keys) + 1))
+    order = order[bounds[0] :]
+    sorted_data = pandas if np.array_equal(order, np.arange(len(pandas))) else pandas.take(order)
+    bounds -= bounds[0]
+    return sorted_data, group_keys, bounds[:-1].tolist(), bounds[1:].tolist()
+
+
+def _filter_mask(filter: SegmentFilter, pandas: pd.DataFrame) -> np.ndarray:
+    """The rows of a DataFrame kept by a segment filter, as a boolean mask."""
+    if not pandas.index.is_unique:
+        pandas = pandas.reset_index(drop=True)
+    filtered_pandas, _ = _filter_inputs(filter, pandas=pandas)
+    mask = np.zeros(len(pandas), dtype=bool)
+    mask[pandas.index.get_indexer(filtered_pandas.index)] = True
+    return mask
+
+
+def _process_pandas_partitions(
+    partitions: List[SegmentationPartition],
+    schema: DatasetSchema,
+    pandas: pd.DataFrame,
+    segment_cache: Optional[SegmentCache] = None,
+) -> Dict[str, Dict[Segment, Any]]:
+    """
+    Segment a DataFrame on all the partitions in a single pass. Each column is split by PreprocessedColumn once,
+    then the typed values are grouped by the segments of every partition, without copying a DataFrame per segment.
+    """
+    segmented_profiles: Dict[str, Dict[Segment, Any]] = {}
+    partition_codes = []
+    for partition in partitions:
+        if not partition.simple:
+            raise NotImplementedError("custom mapped segments not yet implemented")
+        segmented_profiles[partition.id] = {}
+        columns = partition.mapper.col_names if partition.mapper else None
+        if columns:
+            # simple means we can segment on column values
+            mask = _filter_mask(partition.filter, pandas) if partition.filter else None
+            partition_codes.append((partition, *_segment_codes(pandas, columns, mask)))
+    if not partition_codes:
+        return segmented_profiles
+
+    split_columns = {name: PreprocessedColumn.apply(pandas[name].reset_index(drop=True)) for name in pandas.columns}
+    for partition, codes, group_keys in partition_codes:
+        segments = segmented_profiles[partition.id]
+        order = np.argsort(codes, kind="stable")
+        column_groups = {
+            name: column.split_groups(codes, len(group_keys), order) for name, column in split_columns.items()
+        }
+        for group_key in group_keys:
+            segment_key = _get_segment_from_group_key(group_key, partition.id)
+            profile = None
+            if segment_cache:
+                profile = segment_cache.get_or_create_matching_profile(segment_key)
+            if profile is None:
+                profile = DatasetProfile(schema)
+            profile._track_preprocessed(pandas, {name: next(groups) for name, groups in column_groups.items()})
+            segments[segment_key] = profile
+    return segmented_profiles
+
+
 def _process_simple_partition(
     partition_id: str,
     schema: DatasetSchema,
     segments: Dict[Segment, Any],
     columns: List[str],
-    pandas: Optional[pd.DataFrame] = None,
     row: Optional[Mapping[str, Any]] = None,
     segment_cache: Optional[SegmentCache] = None,
 ):
-    if pandas is not None:
-        # simple means we can segment on column values
-        grouped_data = pandas.groupby(columns)
-        for group in grouped_data.groups.keys():
-            pandas_segment = grouped_data.get_group(group)
-            segment_key = _get_segment_from_group_key(group, partition_id)
-            _process_segment(pandas_segment, segment_key, segments, schema, segment_cache)
-    elif row:
+    if row:
         # TODO: consider if we need to combine with the column names
         segment_key = Segment(tuple(str(row[element]) for element in columns), partition_id)
         _process_segment(row, segment_key, segments, schema, segment_cache)
@@ -89,14 +179,13 @@ def _filter_inputs(
     return (filtered_pandas, filtered_row)
 
 
-def _grouped_dataframe(partition: SegmentationPartition, pandas: pd.DataFrame):
+def _partition_columns(partition: SegmentationPartition) -> List[str]:
     columns = partition.mapper.col_names if partition.mapper else None
     if not columns:
         raise ValueError(
             "Please use column segmentation, there are no columns defined and ColumnMapperFunction not yet supported."
         )
-    grouped_data = pandas.groupby(columns)
-    return grouped_data
+    return columns
 
 
 def _log_segment(
@@ -109,12 +198,14 @@ def _log_segment(
 ) -> Dict[Segment, Any]:
     segments: Dict[Segment, Any] = {}
     pandas, row = _pandas_or_dict(obj, pandas, row)
+    if pandas is not None:
+        return _process_pandas_partitions([partition], schema, pandas, segment_cache)[partition.id]
     if partition.filter:
-        pandas, row = _filter_inputs(partition.filter, pandas, row)
+        _, row = _filter_inputs(partition.filter, row=row)
     if partition.simple:
         columns = partition.mapper.col_names if partition.mapper else None
         if columns:
-            _process_simple_partition(partition.id, schema, segments, columns, pandas, row, segment_cache)
+            _process_simple_partition(partition.id, schema, segments, columns, row, segment_cache)
     else:
         raise NotImplementedError("custom mapped segments not yet implemented")
     return segments
@@ -132,22 +223,26 @@ def segment_processing(
     assert not (
         number_of_partitions > _MAX_SEGMENT_PARTITIONS
     ), f"Attempt to process {number_of_partitions} partitions is larger than the max of {_MAX_SEGMENT_PARTITIONS}, use a lower number of partitions"
-    segmented_profiles = dict()
-    segment_partitions = list()
-
-    for partition_name in schema.segments:
-        segment_partition = schema.segments[partition_name]
-        logger.info(f"Processing partition with name({partition_name})")
+    segment_partitions = list(schema.segments.values())
+    for partition_name, segment_partition in schema.segments.items():
         logger.debug(f"{partition_name}: is simple ({segment_partition.simple}), id ({segment_partition.id})")
         if segment_partition.filter:
-            # TODO segments filter
             logger.debug(f"{partition_name}: defines filter ({segment_partition.filter})")
         if segment_partition.mapper:
             logger.debug(
                 f"{partition_name}: defines mapper on colums ({segment_partition.mapper.col_names}) and id ({segment_partition.mapper.id})"
             )
-        partition_segments = _log_segment(segment_partition, schema, obj, pandas, row, segment_cache)
-        segmented_profiles[segment_partition.id] = partition_segments
-        segment_partitions.append(segment_partition)
-        logger.debug(f"Done profiling for partition with name({partition_name})")
+
+    pandas, row = _pandas_or_dict(obj, pandas, row)
+    if pandas is not None:
+        # all the partitions share the preprocessing of the DataFrame
+        segmented_profiles = _process_pandas_partitions(segment_partitions, schema, pandas, segment_cache)
+    else:
+        segmented_profiles = dict()
+        for segment_partition in segment_partitions:
+            logger.info(f"Processing partition with name({segment_partition.name})")
+            segmented_profiles[segment_partition.id] = _log_segment(
+                segment_partition, schema, row=row, segment_cache=segment_cache
+            )
+    logger.debug("Done profiling the partitions")
     return SegmentedResultSet(segments=segmented_profiles, partitions=segment_partitions)
@@ -0,0 +1,183 @@
+import logging
+import os
+import queue
+import threading
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from whylogs.api.logger.result_set import ProfileResultSet, ResultSet
+from whylogs.api.logger.segment_cache import SegmentCache
+from whylogs.api.logger.segment_processing import segment_processing
+from whylogs.core import DatasetProfile, DatasetSchema
+from whylogs.core.stubs import pd
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CHUNK_SIZE = 100000
+
+# any source accepted by log_stream: an iterable of chunks, or the path of a CSV or Parquet file
+StreamSource = Union[Iterable[Any], str, "os.PathLike[str]"]
+
+
+def _file_format(path: str, file_format: Optional[str]) -> str:
+    if file_format is not None:
+        return file_format.lower()
+    name = path.lower()
+    for suffix in [".gz", ".bz2", ".zip", ".xz", ".zst"]:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    if name.endswith((".parquet", ".pq")):
+        return "parquet"
+    if name.endswith((".csv", ".tsv", ".txt")):
+        return "csv"
+    raise ValueError(f"Cannot infer the file format of {path}, please pass file_format='csv' or 'parquet'")
+
+
+def _read_csv(path: str, chunksize: int, **kwargs: Any) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(path, chunksize=chunksize, **kwargs) as reader:
+        yield from reader
+
+
+def _read_parquet(path: str, chunksize: int, **kwargs: Any) -> Iterator[Any]:
+    # record batches are tracked as Arrow, they are never converted to Pandas
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    try:
+        yield from parquet_file.iter_batches(batch_size=chunksize, **kwargs)
+    finally:
+        parquet_file.close()
+
+
+def _read_chunks(
+    source: StreamSource, chunksize: int, file_format: Optional[str] = None, **read_kwargs: Any
+) -> Iterator[Any]:
+    if not isinstance(source, (str, os.PathLike)):
+        if read_kwargs or file_format is not None:
+            raise ValueError("file_format and reader arguments are only supported when logging a file")
+        return iter(source)
+    path = os.fspath(source)
+    file_format = _file_format(path, file_format)
+    if file_format == "csv":
+        return _read_csv(path, chunksize, **read_kwargs)
+    if file_format == "parquet":
+        return _read_parquet(path, chunksize, **read_kwargs)
+    raise ValueError(f"Unsupported file format {file_format}, only csv and parquet files can be streamed")
+
+
+class _ReadAhead(object):
+    """
+    Iterates over chunks read by a background thread. At most `size` chunks are buffered ahead of the consumer,
+    so reading the next chunks overlaps with profiling the current one while peak memory stays bounded.
+    Errors raised by the reader are raised again in the consuming thread.
+    """
+
+    _DONE = object()
+
+    def __init__(self, chunks: Iterator[Any], size: int):
+        self._chunks = chunks
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=size)
+        self._stopped = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._read, name="whylogs-read-ahead", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _read(self) -> None:
+        try:
+            for chunk in self._chunks:
+                if not self._put(chunk):
+                    return
+        except BaseException as e:  # noqa
+            self._error = e
+        finally:
+            close = getattr(self._chunks, "close", None)
+            if close is not None and self._stopped.is_set():
+                close()
+        self._put(self._DONE)
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            while True:
+                chunk = self._queue.get()
+                if chunk is self._DONE:
+                    break
+                yield chunk
+            if self._error is not None:
+                raise self._error
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+
+def log_stream(
+    source: StreamSource,
+    *,
+    chunksize: int = _DEFAULT_CHUNK_SIZE,
+    schema: Optional[DatasetSchema] = None,
+    read_ahead: int = 1,
+    file_format: Optional[str] = None,
+    max_cached_segments: Optional[int] = None,
+    **read_kwargs: Any,
+) -> ResultSet:
+    """
+    Profile a dataset that doesn't fit in memory one chunk at a time.
+
+    All the chunks are tracked into the same profile, so only the chunks being read or profiled are held in
+    memory at once.
+
+    Args:
+        source: an iterable of chunks, each of them anything whylogs.log accepts (Pandas DataFrames, Arrow tables
+            or record batches, rows), or the path of a CSV or Parquet file.
+        chunksize: number of rows read at once from a file. Ignored for iterables, which are already chunked.
+        schema: the schema used for the profile.
+        read_ahead: number of chunks read ahead by a background thread while the current chunk is profiled.
+            0 reads the chunks in the calling thread.
+        file_format: "csv" or "parquet". Inferred from the file extension by default.
+        max_cached_segments: with a segmented schema, maximum number of segment profiles kept in memory.
+            Least recently used profiles are spilled to disk, see SegmentCache.
+        read_kwargs: passed to pandas.read_csv or pyarrow.parquet.ParquetFile.iter_batches.
+
+    Returns:
+        a ResultSet with the profile of the whole dataset.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    if read_ahead < 0:
+        raise ValueError(f"read_ahead must not be negative, got {read_ahead}")
+
+    chunks: Iterable[Any] = _read_chunks(source, chunksize, file_format, **read_kwargs)
+    read_ahead_chunks = _ReadAhead(iter(chunks), read_ahead) if read_ahead > 0 else None
+    try:
+        return _log_chunks(read_ahead_chunks or chunks, schema, max_cached_segments)
+    finally:
+        if read_ahead_chunks is not None:
+            read_ahead_chunks.close()
+
+
+def _log_chunks(
+    chunks: Iterable[Any], schema: Optional[DatasetSchema], max_cached_segments: Optional[int]
+) -> ResultSet:
+    if schema and schema.segments:
+        segment_cache = SegmentCache(schema, max_segments=max_cached_segments)
+        for chunk in chunks:
+            segment_processing(schema, chunk, segment_cache=segment_cache)
+        return segment_cache.flush(dataset_timestamp=None)
+
+    profile = DatasetProfile(schema=schema)
+    chunk_count = 0
+    for chunk in chunks:
+        profile.track(chunk)
+        chunk_count += 1
+    logger.debug(f"Profiled {chunk_count} chunks")
+    return ProfileResultSet(profile)
@@ -2,15 +2,14 @@ import logging
 import os
 import uuid
 from datetime import datetime, timezone
-from functools import reduce
 from glob import glob
 from typing import List, Optional, Union
 
-import whylogs as why
 from whylogs.api.store.profile_store import ProfileStore
 from whylogs.api.store.query import DatasetIdQuery, DateQuery
 from whylogs.api.writer.local import LocalWriter
 from whylogs.core import DatasetProfileView
+from whylogs.core.view import merge_views
 
 DEFAULT_DIR = "profile_store/"
 logger = logging.getLogger(__name__)
@@ -103,9 +102,7 @@ class LocalStore(ProfileStore):
             return None
 
         logger.debug(f"Profiles found! Number of profiles is {len(files_list)}")
-        profiles_list = (why.read(file).view() for file in files_list)
-        merged_profile = reduce(lambda x, y: x.merge(y), profiles_list)
-        return merged_profile
+        return merge_views(files_list)
 
     def write(self, profile_view: DatasetProfileView, dataset_id: str) -> None:
         if not os.path.isdir(os.path.join(self._default_path, dataset_id)):
@@ -6,6 +6,7 @@ from datetime import timedelta, timezone
 from whylogs.api.store import ProfileStore
 from whylogs.api.store.query import BaseQuery, DatasetIdQuery, DateQuery
 from whylogs.core import DatasetProfile, DatasetProfileView
+from whylogs.core.view import merge_views
 
 logger = logging.getLogger(__name__)
 
@@ -63,10 +64,7 @@ class SQLiteStore(ProfileStore):
             logger.error("Define a supported Query object")
             raise ValueError
 
-        profile_view = DatasetProfileView.zero()
-        for item in response:
-            profile_view = profile_view.merge(DatasetProfileView.deserialize(item[0]))
-        return profile_view
+        return merge_views(item[0] for item in response)
 
     def _insert_blob(self, profile_view: DatasetProfileView, dataset_id: str):
         try:
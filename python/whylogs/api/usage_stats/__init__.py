@@ -26,18 +26,8 @@ ANALYTICS_OPT_OUT = "WHYLOGS_NO_ANALYTICS"
 # Flag to disable it internally
 _TELEMETRY_DISABLED = False
 _TRACKED_EVENTS: Dict[str, bool] = {}
-_SITE_PACKAGES: List[str] = []
-
-try:
-    # fix for virtualenv lack of definition for getsitepackages
-    if hasattr(site, "getsitepackages"):
-        _SITE_PACKAGES = site.getsitepackages()
-    else:
-        from distutils.sysconfig import get_python_lib
-
-        _SITE_PACKAGES = [get_python_lib()]
-except:  # noqa
-    logger.debug("Encountered exception when checking site packages")
+# computed by the telemetry thread the first time it's needed, not when whylogs is imported
+_SITE_PACKAGES: Optional[List[str]] = None
 
 if os.getenv(ANALYTICS_OPT_OUT) is not None:
     logger.debug("Opted out of usage statistics. Skipping.")
@@ -166,7 +156,30 @@ def _send_stats_event(event_name: str, identity: str, properties: Optional[Dict[
             resp.close()
 
 
+def _get_site_packages() -> List[str]:
+    global _SITE_PACKAGES
+    if _SITE_PACKAGES is not None:
+        return _SITE_PACKAGES
+
+    _SITE_PACKAGES = []
+    try:
+        # fix for virtualenv lack of definition for getsitepackages
+        if hasattr(site, "getsitepackages"):
+            _SITE_PACKAGES = site.getsitepackages()
+        else:
+            from distutils.sysconfig import get_python_lib
+
+            _SITE_PACKAGES = [get_python_lib()]
+    except:  # noqa
+        logger.debug("Encountered exception when checking site packages")
+    return _SITE_PACKAGES
+
+
 def _get_terminal_mode() -> str:
+    # IPython is always imported when running in it, don't pay for importing it otherwise
+    if "IPython" not in sys.modules:
+        return "shell" if hasattr(sys, "ps1") else "headless"
+
     try:
         from IPython.core.getipython import get_ipython  # type: ignore
 
@@ -203,7 +216,7 @@ def _get_environment() -> str:
 
 def _has_lib(lib_name: str) -> bool:
     try:
-        for p in _SITE_PACKAGES:
+        for p in _get_site_packages():
             if os.path.exists(os.path.join(p, lib_name)):
                 return True
     except:  # noqa
@@ -1,20 +1,34 @@
 import logging
 import os
-from typing import Any, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
 from whylogs.api.writer import Writer
 from whylogs.api.writer.writer import Writable
 from whylogs.core.utils import deprecated_alias
+from whylogs.core.view.segmented_dataset_profile_view import (
+    SegmentContainerWriter,
+    SegmentedDatasetProfileView,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class LocalWriter(Writer):
-    def __init__(self, base_dir: Optional[str] = None, base_name: Optional[str] = None) -> None:
+    """
+    Writes profiles to the local file system.
+
+    With segment_container set, write_batch writes the segments of a batch, such as the segments of a segmented
+    result set, into a single container file instead of a file each. Use SegmentContainerReader to read them.
+    """
+
+    def __init__(
+        self, base_dir: Optional[str] = None, base_name: Optional[str] = None, segment_container: bool = False
+    ) -> None:
         if base_dir is None:
             base_dir = os.getcwd()
         self._base_dir = base_dir
         self._base_name = base_name
+        self._segment_container = segment_container
 
     @deprecated_alias(profile="file")
     def write(
@@ -28,9 +42,34 @@ class LocalWriter(Writer):
         file.write(full_path, **kwargs)
         return True, full_path
 
-    def option(self, base_dir: Optional[str] = None, base_name: Optional[str] = None) -> "LocalWriter":  # type: ignore
+    def write_batch(
+        self,
+        files: List[Writable],
+        dests: Optional[List[Optional[str]]] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[bool, str]]:
+        segments = [file for file in files if isinstance(file, SegmentedDatasetProfileView)]
+        if not self._segment_container or dests is not None or not segments:
+            return super().write_batch(files, dests, **kwargs)
+
+        dest = self._base_name or f"profile_{segments[0].creation_timestamp}_segments.bin"
+        full_path = os.path.join(self._base_dir, dest)
+        with SegmentContainerWriter(full_path) as container:
+            for segment in segments:
+                container.write(segment)
+        logger.debug(f"Wrote {len(segments)} segments to {full_path}")
+        return [
+            (True, full_path) if isinstance(file, SegmentedDatasetProfileView) else self.write(file, **kwargs)
+            for file in files
+        ]
+
+    def option(  # type: ignore
+        self, base_dir: Optional[str] = None, base_name: Optional[str] = None, segment_container: Optional[bool] = None
+    ) -> "LocalWriter":
         if base_dir is not None:
             self._base_dir = base_dir
         if base_name is not None:
             self._base_name = base_name
+        if segment_container is not None:
+            self._segment_container = segment_container
         return self
@@ -1,15 +1,33 @@
 import abc
 import copy
 import datetime
+import io
 import logging
 import os
-import tempfile
-from typing import IO, Any, Dict, List, Optional, Tuple, Union
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from urllib.parse import urlparse
 
 import requests  # type: ignore
 import whylabs_client  # type: ignore
 from urllib3 import PoolManager, ProxyManager
+from urllib3.exceptions import HTTPError
 from whylabs_client import ApiClient, Configuration  # type: ignore
 from whylabs_client.api.feature_weights_api import FeatureWeightsApi
 from whylabs_client.api.log_api import AsyncLogResponse  # type: ignore
@@ -21,7 +39,7 @@ from whylabs_client.api.log_api import (
 )
 from whylabs_client.api.models_api import ModelsApi
 from whylabs_client.model.column_schema import ColumnSchema
-from whylabs_client.rest import ForbiddenException  # type: ignore
+from whylabs_client.rest import ApiException, ForbiddenException  # type: ignore
 
 from whylogs import __version__ as _version
 from whylogs.api.logger import log
@@ -58,28 +76,193 @@ _UPLOAD_POOLER_CACHE: Dict[str, Union[PoolManager, ProxyManager]] = dict()
 _US_WEST2_DOMAIN = "songbird-20201223060057342600000001.s3.us-west-2.amazonaws.com"
 _S3_PUBLIC_DOMAIN = os.environ.get("_WHYLABS_PRIVATE_S3_DOMAIN") or _US_WEST2_DOMAIN
 
+# responses to a request that may succeed when sent again
+_RETRYABLE_STATUS_CODES = frozenset([408, 429, 500, 502, 503, 504])
+_MAX_RECORDED_LATENCIES = 10000
 
-def _check_whylabs_condition_count_uncompound() -> bool:
-    whylabs_config_url = (
-        "https://whylabs-public.s3.us-west-2.amazonaws.com/whylogs_config/whylabs_condition_count_disabled"
-    )
-    logger.info(f"checking: {whylabs_config_url}")
+T = TypeVar("T")
+
+
+class _RetryableUploadError(Exception):
+    pass
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, ApiException):
+        return error.status in _RETRYABLE_STATUS_CODES
+    return isinstance(error, (_RetryableUploadError, HTTPError, requests.RequestException, ConnectionError))
+
+
+@dataclass
+class UploadStats:
+    """
+    Statistics of the profiles uploaded by a WhyLabsWriter.
+
+    uploads and failures count the profiles, retries counts the requests that were sent again. latencies holds
+    the duration of the most recent uploads in seconds, including the request for the upload URL.
+    elapsed_seconds is the wall clock time spent in write and write_batch calls.
+    """
+
+    uploads: int = 0
+    failures: int = 0
+    retries: int = 0
+    bytes_uploaded: int = 0
+    elapsed_seconds: float = 0.0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=_MAX_RECORDED_LATENCIES))
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _record_upload(self, success: bool, size: int, latency: float) -> None:
+        with self._lock:
+            if success:
+                self.uploads += 1
+                self.bytes_uploaded += size
+                self.latencies.append(latency)
+            else:
+                self.failures += 1
+
+    def _record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def _record_elapsed(self, seconds: float) -> None:
+        with self._lock:
+            self.elapsed_seconds += seconds
+
+    @property
+    def throughput(self) -> float:
+        """Bytes uploaded per second of write calls."""
+        return self.bytes_uploaded / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def latency_percentile(self, q: float) -> Optional[float]:
+        """Latency of the recent uploads at percentile q, between 0 and 100."""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * q / 100))]
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        return {
+            "uploads": self.uploads,
+            "failures": self.failures,
+            "retries": self.retries,
+            "bytes_uploaded": self.bytes_uploaded,
+            "elapsed_seconds": self.elapsed_seconds,
+            "throughput": self.throughput,
+            "latency_p50": self.latency_percentile(50),
+            "latency_p95": self.latency_percentile(95),
+        }
+
+
+def _serialize_view(view: Union[DatasetProfileView, SegmentedDatasetProfileView]) -> bytes:
+    # segmented profiles are uploaded in the v0 format
+    buffer = io.BytesIO()
+    if isinstance(view, SegmentedDatasetProfileView):
+        view.write(file=buffer, use_v0=True)
+    else:
+        view.write(file=buffer)
+    return buffer.getvalue()
+
+
+def _env_seconds(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if not value:
+        return default
     try:
-        response = requests.head(whylabs_config_url)
-        logger.info(f"checking: {whylabs_config_url}")
-        logger.info(f"headers are: {response.headers} code: {response.status_code}")
-        if response.status_code == 200:
-            logger.info(
-                "found the whylabs condition count disabled file so running uncompound on condition count metrics"
-            )
-            return True
-        else:
-            logger.info(
-                f"Got response code {response.status_code} but expected 200, so allowing condition count upload to whylabs uncompounded!"
-            )
-    except Exception:
-        logger.warning("Error trying to read whylabs config, falling back to defaults for uncompounding")
-    return False
+        return float(value)
+    except ValueError:
+        logger.warning(f"Invalid value {value} for {name}, using the default of {default} seconds")
+        return default
+
+
+class _CachedRemoteFlag(object):
+    """
+    A flag that is True when a remote file exists, cached for ttl_seconds.
+
+    Until the first check completes, get waits for it for at most timeout_seconds and falls back to False.
+    Once a value is cached, get never blocks: an expired value is returned while a background thread
+    checks the file again.
+    ttl_seconds and timeout_seconds default to the WHYLABS_CONFIG_REFRESH_SECONDS and
+    WHYLABS_CONFIG_TIMEOUT_SECONDS environment variables, read the first time they are needed.
+    """
+
+    def __init__(self, url: str, ttl_seconds: Optional[float] = None, timeout_seconds: Optional[float] = None) -> None:
+        self._url = url
+        self._ttl_seconds_value = ttl_seconds
+        self._timeout_seconds_value = timeout_seconds
+        self._value: Optional[bool] = None
+        self._checked_at = 0.0
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def _ttl_seconds(self) -> float:
+        if self._ttl_seconds_value is None:
+            self._ttl_seconds_value = _env_seconds("WHYLABS_CONFIG_REFRESH_SECONDS", 600)
+        return self._ttl_seconds_value
+
+    @property
+    def _timeout_seconds(self) -> float:
+        if self._timeout_seconds_value is None:
+            self._timeout_seconds_value = _env_seconds("WHYLABS_CONFIG_TIMEOUT_SECONDS", 2)
+        return self._timeout_seconds_value
+
+    def _check(self) -> bool:
+        logger.info(f"checking: {self._url}")
+        try:
+            response = requests.head(self._url, timeout=self._timeout_seconds)
+            logger.info(f"headers are: {response.headers} code: {response.status_code}")
+            if response.status_code == 200:
+                logger.info(
+                    "found the whylabs condition count disabled file so running uncompound on condition count metrics"
+                )
+                return True
+            else:
+                logger.info(
+                    f"Got response code {response.status_code} but expected 200, so allowing condition count upload to whylabs uncompounded!"
+                )
+        except Exception:
+            logger.warning("Error trying to read whylabs config, falling back to defaults for uncompounding")
+        return False
+
+    def _refresh(self) -> None:
+        value = self._check()
+        with self._lock:
+            self._value = value
+            self._checked_at = time.monotonic()
+            self._refresh_thread = None
+
+    def refresh_if_expired(self) -> Optional[threading.Thread]:
+        """Start checking the remote file in a background thread unless a fresh value is cached."""
+        with self._lock:
+            fresh = self._value is not None and time.monotonic() - self._checked_at < self._ttl_seconds
+            if not fresh and self._refresh_thread is None:
+                self._refresh_thread = threading.Thread(
+                    target=self._refresh, name="whylabs-config-refresh", daemon=True
+                )
+                self._refresh_thread.start()
+            return self._refresh_thread
+
+    def get(self) -> bool:
+        refresh_thread = self.refresh_if_expired()
+        with self._lock:
+            value = self._value
+        if value is None and refresh_thread is not None:
+            refresh_thread.join(self._timeout_seconds)
+            with self._lock:
+                value = self._value
+            if value is None:
+                logger.warning(f"Timed out checking {self._url}, falling back to defaults for uncompounding")
+        return bool(value)
+
+
+_CONDITION_COUNT_UNCOMPOUND = _CachedRemoteFlag(
+    url="https://whylabs-public.s3.us-west-2.amazonaws.com/whylogs_config/whylabs_condition_count_disabled"
+)
+
+
+def _check_whylabs_condition_count_uncompound() -> bool:
+    return _CONDITION_COUNT_UNCOMPOUND.get()
 
 
 def _validate_api_key(api_key: Optional[str]) -> str:
@@ -186,6 +369,9 @@ class WhyLabsWriter(Writer):
     _s3_private_domain: Optional[str] = None
     _s3_endpoint_subject: Optional[str] = None
     _timeout_seconds: float = 300.0
+    _max_retries: int = 3
+    _retry_backoff_seconds: float = 1.0
+    _upload_workers: int = 8
 
     def __init__(
         self,
@@ -203,6 +389,7 @@ class WhyLabsWriter(Writer):
         self._reference_profile_name = os.environ.get("WHYLABS_REFERENCE_PROFILE_NAME")
         self._ssl_ca_cert = ssl_ca_cert
         self._api_config: Optional[Configuration] = None
+        self._upload_stats = UploadStats()
 
         if api_key:
             self._key_refresher = StaticKeyRefresher(api_key)
@@ -251,6 +438,10 @@ class WhyLabsWriter(Writer):
     def key_id(self) -> str:
         return self._key_refresher.key_id
 
+    @property
+    def upload_stats(self) -> UploadStats:
+        return self._upload_stats
+
     def _refresh_client(self) -> None:
         """
         Refresh the API client by comparing various configs. We try to
@@ -335,6 +526,9 @@ class WhyLabsWriter(Writer):
         ssl_ca_cert: Optional[str] = None,
         api_client: Optional[ApiClient] = None,
         timeout_seconds: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        upload_workers: Optional[int] = None,
     ) -> "WhyLabsWriter":
         """
 
@@ -345,6 +539,10 @@ class WhyLabsWriter(Writer):
         api_key the API key
         reference_profile_name the name of the reference profile
         configuration the additional configuration for the REST client
+        timeout_seconds the timeout of a single upload request
+        max_retries the number of times a request failing with a transient error is sent again
+        retry_backoff_seconds the delay before the first retry, doubled for every following retry
+        upload_workers the number of profiles uploaded concurrently by write_batch
 
         Returns a "WhyLabsWriter" with these options configured
         -------
@@ -368,6 +566,16 @@ class WhyLabsWriter(Writer):
             self._refresh_client()
         if timeout_seconds is not None:
             self._timeout_seconds = timeout_seconds
+        if max_retries is not None:
+            if max_retries < 0:
+                raise ValueError(f"max_retries must not be negative, got {max_retries}")
+            self._max_retries = max_retries
+        if retry_backoff_seconds is not None:
+            self._retry_backoff_seconds = retry_backoff_seconds
+        if upload_workers is not None:
+            if upload_workers < 1:
+                raise ValueError(f"upload_workers must be at least 1, got {upload_workers}")
+            self._upload_workers = upload_workers
         return self
 
     def _tag_columns(self, columns: List[str], value: str) -> Tuple[bool, str]:
@@ -484,72 +692,148 @@ class WhyLabsWriter(Writer):
         elif isinstance(file, EstimationResult):
             return self.write_estimation_result(file, **kwargs)
 
-        view = file.view() if isinstance(file, DatasetProfile) else file
-        has_segments = isinstance(view, SegmentedDatasetProfileView)
+        # check the remote config while the profile is prepared, so the upload doesn't wait for it
+        _CONDITION_COUNT_UNCOMPOUND.refresh_if_expired()
+        view = self._get_view(file)
+        flags = FeatureFlags(_check_whylabs_condition_count_uncompound())
+        if kwargs.get("dataset_id") is not None:
+            self._dataset_id = kwargs.get("dataset_id")
+
+        start = time.perf_counter()
+        try:
+            return self._upload_view(view, flags, self._get_dataset_timestamp_epoch(view))
+        finally:
+            self._upload_stats._record_elapsed(time.perf_counter() - start)
 
-        if not has_segments and not isinstance(view, DatasetProfileView):
+    def write_batch(
+        self, files: List[Writable], dests: Optional[List[Optional[str]]] = None, **kwargs: Any
+    ) -> List[Tuple[bool, str]]:
+        """
+        Upload several profiles concurrently, for example all the segments of a segmented result set.
+
+        Up to upload_workers profiles are serialized and uploaded at once. The upload URL of a profile is
+        requested while the profile is serialized, and transient failures are retried with exponential backoff.
+        dests are ignored, as they are by write.
+
+        Returns
+        -------
+        List[Tuple[bool, str]]
+            the result of each upload, in the order of files.
+        """
+        if kwargs.get("dataset_id") is not None:
+            self._dataset_id = kwargs.get("dataset_id")
+        profile_indexes = {
+            i for i, file in enumerate(files) if not isinstance(file, (FeatureWeights, EstimationResult))
+        }
+        if len(profile_indexes) < 2 or self._upload_workers < 2:
+            return [self.write(file, **kwargs) for file in files]
+
+        _CONDITION_COUNT_UNCOMPOUND.refresh_if_expired()
+        self._validate_org_and_dataset()
+        # feature weights and estimation results are written one by one
+        results: Dict[int, Tuple[bool, str]] = {
+            i: self.write(file, **kwargs) for i, file in enumerate(files) if i not in profile_indexes
+        }
+        flags = FeatureFlags(_check_whylabs_condition_count_uncompound())
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(
+                self._upload_workers, thread_name_prefix="whylogs-upload-url"
+            ) as url_executor, ThreadPoolExecutor(
+                self._upload_workers, thread_name_prefix="whylogs-upload"
+            ) as executor:
+                pending: Dict[Future, int] = dict()
+
+                def collect(max_pending: int) -> None:
+                    while len(pending) > max_pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            i = pending.pop(future)
+                            try:
+                                results[i] = future.result()
+                            except Exception as e:
+                                # a failed profile doesn't stop the upload of the others
+                                logger.warning(f"Failed to upload profile {i} of the batch: {e}")
+                                self._upload_stats._record_upload(False, 0, 0.0)
+                                results[i] = False, str(e)
+
+                for i in sorted(profile_indexes):
+                    view = self._get_view(files[i])
+                    dataset_timestamp = self._get_dataset_timestamp_epoch(view)
+                    # the URL is requested ahead of the upload, while the worker uncompounds and serializes the view
+                    upload_url = url_executor.submit(self._timed_upload_url, dataset_timestamp)
+                    pending[executor.submit(self._upload_view, view, flags, dataset_timestamp, upload_url)] = i
+                    # bound the number of profiles serialized ahead of their upload
+                    collect(2 * self._upload_workers)
+                collect(0)
+        finally:
+            self._upload_stats._record_elapsed(time.perf_counter() - start)
+        return [results[i] for i in range(len(files))]
+
+    @staticmethod
+    def _get_view(file: Writable) -> Union[DatasetProfileView, SegmentedDatasetProfileView]:
+        view = file.view() if isinstance(file, DatasetProfile) else file
+        if not isinstance(view, (DatasetProfileView, SegmentedDatasetProfileView)):
             raise ValueError(
                 "You must pass either a DatasetProfile or a DatasetProfileView in order to use this writer!"
             )
+        return view
 
-        flags = FeatureFlags(_check_whylabs_condition_count_uncompound())
+    @staticmethod
+    def _get_dataset_timestamp_epoch(view: Union[DatasetProfileView, SegmentedDatasetProfileView]) -> int:
+        utc_now = datetime.datetime.now(datetime.timezone.utc)
+        dataset_timestamp = view.dataset_timestamp or utc_now
+        stamp = dataset_timestamp.timestamp()
+        time_delta_seconds = utc_now.timestamp() - stamp
+        if time_delta_seconds < 0:
+            logger.warning(
+                f"About to upload a profile with a dataset_timestamp that is in the future: "
+                f"{time_delta_seconds}s old."
+            )
+        elif time_delta_seconds > WEEK_IN_SECONDS:
+            if time_delta_seconds > FIVE_YEARS_IN_SECONDS:
+                logger.error(
+                    f"A profile being uploaded to WhyLabs has a dataset_timestamp of({dataset_timestamp}) "
+                    f"compared to current datetime: {utc_now}. Uploads of profiles older than 5 years "
+                    "might not be monitored in WhyLabs and may take up to 24 hours to show up."
+                )
+            else:
+                logger.warning(
+                    f"A profile being uploaded to WhyLabs has a dataset_timestamp of {dataset_timestamp} "
+                    f"which is older than 7 days compared to {utc_now}. These profiles should be processed "
+                    f"within 24 hours."
+                )
 
+        if stamp <= 0:
+            logger.error(
+                f"Profiles should have timestamps greater than 0, but found a timestamp of {stamp}"
+                f" and current timestamp is {utc_now.timestamp()}, this is likely an error."
+            )
+        return int(stamp * 1000)
+
+    def _upload_view(
+        self,
+        view: Union[DatasetProfileView, SegmentedDatasetProfileView],
+        flags: FeatureFlags,
+        dataset_timestamp: int,
+        upload_url: Optional["Future[Tuple[str, float]]"] = None,
+    ) -> Tuple[bool, str]:
         if _uncompound_metric_feature_flag():
-            if has_segments:
+            if isinstance(view, SegmentedDatasetProfileView):
                 updated_profile_view = _uncompound_dataset_profile(view.profile_view, flags)
                 view = SegmentedDatasetProfileView(
                     profile_view=updated_profile_view, segment=view._segment, partition=view._partition
                 )
-
             else:
                 view = _uncompound_dataset_profile(view, flags)
 
-        if kwargs.get("dataset_id") is not None:
-            self._dataset_id = kwargs.get("dataset_id")
-
-        with tempfile.NamedTemporaryFile() as tmp_file:
-            if has_segments:
-                view.write(file=tmp_file, use_v0=True)
-            else:
-                view.write(file=tmp_file)
-            tmp_file.flush()
-            tmp_file.seek(0)
-            utc_now = datetime.datetime.now(datetime.timezone.utc)
-            dataset_timestamp = view.dataset_timestamp or utc_now
-            stamp = dataset_timestamp.timestamp()
-            time_delta_seconds = utc_now.timestamp() - stamp
-            if time_delta_seconds < 0:
-                logger.warning(
-                    f"About to upload a profile with a dataset_timestamp that is in the future: "
-                    f"{time_delta_seconds}s old."
-                )
-            elif time_delta_seconds > WEEK_IN_SECONDS:
-                if time_delta_seconds > FIVE_YEARS_IN_SECONDS:
-                    logger.error(
-                        f"A profile being uploaded to WhyLabs has a dataset_timestamp of({dataset_timestamp}) "
-                        f"compared to current datetime: {utc_now}. Uploads of profiles older than 5 years "
-                        "might not be monitored in WhyLabs and may take up to 24 hours to show up."
-                    )
-                else:
-                    logger.warning(
-                        f"A profile being uploaded to WhyLabs has a dataset_timestamp of {dataset_timestamp} "
-                        f"which is older than 7 days compared to {utc_now}. These profiles should be processed "
-                        f"within 24 hours."
-                    )
-
-            if stamp <= 0:
-                logger.error(
-                    f"Profiles should have timestamps greater than 0, but found a timestamp of {stamp}"
-                    f" and current timestamp is {utc_now.timestamp()}, this is likely an error."
-                )
-
-            dataset_timestamp_epoch = int(stamp * 1000)
-            response = self._do_upload(
-                dataset_timestamp=dataset_timestamp_epoch,
-                profile_file=tmp_file,
-            )
-        # TODO: retry
-        return response
+        profile_bytes = _serialize_view(view)
+        if upload_url is None:
+            return self._do_upload(dataset_timestamp=dataset_timestamp, profile_bytes=profile_bytes)
+        url, url_seconds = upload_url.result()
+        return self._do_upload(
+            dataset_timestamp=dataset_timestamp, profile_bytes=profile_bytes, upload_url=url, url_seconds=url_seconds
+        )
 
     def _validate_org_and_dataset(self) -> None:
         if self._org_id is None:
@@ -591,15 +875,37 @@ class WhyLabsWriter(Writer):
         else:
             return False, str(result)
 
+    def _with_retries(self, request: Callable[[], T]) -> T:
+        """Call request, calling it again after an exponentially growing delay when it fails with a transient error"""
+        attempt = 0
+        while True:
+            try:
+                return request()
+            except Exception as e:
+                if attempt >= self._max_retries or not _is_retryable(e):
+                    raise
+                # jitter spreads out the retries of concurrent uploads
+                delay = self._retry_backoff_seconds * (2**attempt) * random.uniform(0.5, 1.0)
+                attempt += 1
+                logger.info(
+                    f"Request to WhyLabs failed with {e}, retry {attempt} of {self._max_retries} in {delay:.2f}s"
+                )
+                self._upload_stats._record_retry()
+                time.sleep(delay)
+
     def _put_file(self, profile_file: IO[bytes], upload_url: str, dataset_timestamp: int) -> Tuple[bool, str]:
-        # TODO: probably want to call this API using asyncio
+        return self._put_bytes(profile_file.read(), upload_url, dataset_timestamp)
+
+    def _put_bytes(self, profile_bytes: bytes, upload_url: str, dataset_timestamp: int) -> Tuple[bool, str]:
         headers = {"Content-Type": "application/octet-stream"}
         if self._s3_endpoint_subject:
             logger.info(f"Override Host parameter since we are using S3 private endpoint: {self._s3_private_domain}")
             headers["Host"] = self._s3_endpoint_subject
         response = self._s3_pool.request(
-            "PUT", upload_url, headers=headers, timeout=self._timeout_seconds, body=profile_file.read()
+            "PUT", upload_url, headers=headers, timeout=self._timeout_seconds, body=profile_bytes
         )
+        if response.status in _RETRYABLE_STATUS_CODES:
+            raise _RetryableUploadError(f"{response.status} {response.reason}")
         is_successful = False
         if response.status == 200:
             is_successful = True
@@ -610,26 +916,49 @@ class WhyLabsWriter(Writer):
         return is_successful, response.reason
 
     def _do_upload(
-        self, dataset_timestamp: int, profile_path: Optional[str] = None, profile_file: Optional[IO[bytes]] = None
+        self,
+        dataset_timestamp: int,
+        profile_path: Optional[str] = None,
+        profile_file: Optional[IO[bytes]] = None,
+        profile_bytes: Optional[bytes] = None,
+        upload_url: Optional[str] = None,
+        url_seconds: float = 0.0,
     ) -> Tuple[bool, str]:
-        assert profile_path or profile_file, "Either a file or file path must be specified when uploading profiles"
+        """
+        Upload a profile. The recorded latency is the time spent requesting the upload URL, url_seconds if the URL
+        was requested beforehand, plus the time spent uploading, so it doesn't depend on how the upload was queued.
+        """
+        assert (
+            profile_path or profile_file or profile_bytes is not None
+        ), "Either a file, file path or bytes must be specified when uploading profiles"
         self._validate_org_and_dataset()
 
-        logger.debug("Generating the upload URL")
-        upload_url = self._get_upload_url(dataset_timestamp=dataset_timestamp)
-        try:
+        if upload_url is None:
+            logger.debug("Generating the upload URL")
+            upload_url, url_seconds = self._timed_upload_url(dataset_timestamp)
+        if profile_bytes is None:
             if profile_file:
-                return self._put_file(profile_file, upload_url, dataset_timestamp)
-            elif profile_path:
-                with open(profile_path, "rb") as f:
-                    return self._put_file(f, upload_url, dataset_timestamp)
-        except requests.RequestException as e:
+                profile_bytes = profile_file.read()
+            else:
+                with open(profile_path, "rb") as f:  # type: ignore
+                    profile_bytes = f.read()
+        start = time.perf_counter()
+        try:
+            result = self._with_retries(lambda: self._put_bytes(profile_bytes, upload_url, dataset_timestamp))
+        except (_RetryableUploadError, HTTPError, requests.RequestException) as e:
             logger.info(
                 f"Failed to upload {self._org_id}/{self._dataset_id}/{dataset_timestamp} to "
                 + f"{self.whylabs_api_endpoint} with API token ID: {self.key_id}. Error occurred: {e}"
             )
-            return False, str(e)
-        return False, "Either a profile_file or profile_path must be specified when uploading profiles to WhyLabs!"
+            result = False, str(e)
+        self._upload_stats._record_upload(result[0], len(profile_bytes), url_seconds + time.perf_counter() - start)
+        return result
+
+    def _timed_upload_url(self, dataset_timestamp: int) -> Tuple[str, float]:
+        """Request the upload URL, returns it with the seconds the request took."""
+        start = time.perf_counter()
+        upload_url = self._with_retries(lambda: self._get_upload_url(dataset_timestamp=dataset_timestamp))
+        return upload_url, time.perf_counter() - start
 
     def _get_or_create_feature_weights_client(self) -> FeatureWeightsApi:
         return FeatureWeightsApi(self._api_client)
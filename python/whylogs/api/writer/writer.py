@@ -1,6 +1,6 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Tuple, TypeVar
+from typing import Any, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T", bound="Writer")
 
@@ -41,6 +41,19 @@ class Writer(ABC):
     ) -> Tuple[bool, str]:
         pass
 
+    def write_batch(
+        self,
+        files: List[Writable],
+        dests: Optional[List[Optional[str]]] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[bool, str]]:
+        """Write several files, each to the matching dest if dests are given.
+
+        Writers that can write files concurrently override this. By default the files are written one by one."""
+        if dests is None:
+            return [self.write(file=file, **kwargs) for file in files]
+        return [self.write(file=file, dest=dest, **kwargs) for file, dest in zip(files, dests)]
+
     @abstractmethod
     def option(self: T, **kwargs: Any) -> T:
         pass
@@ -44,6 +44,8 @@ class ColumnProfile(object):
     def flush(self) -> None:
         """Force emptying the cache and update the internal metrics."""
 
+        if not self._cache:
+            return
         logger.debug("Flushing out the cache for col: %s. Cache size: %s", self._name, self._cache_size)
         old_cache = self._cache
         self._cache = []
@@ -58,7 +60,8 @@ class ColumnProfile(object):
             validator.columnar_validate(extracted_column)
 
     def track_column(self, series: Any) -> None:
-        ex_col = PreprocessedColumn.apply(series)
+        # values already split by PreprocessedColumn, e.g. a segment of a column, are tracked as they are
+        ex_col = series if isinstance(series, PreprocessedColumn) else PreprocessedColumn.apply(series)
         self._process_extracted_column(ex_col)
 
     def _track_datum(self, value: Any) -> None:
@@ -1,6 +1,7 @@
 from .metric_constraints import (
     Constraints,
     ConstraintsBuilder,
+    ConstraintsPlan,
     DatasetConstraint,
     MetricConstraint,
     MetricsSelector,
@@ -10,6 +11,7 @@ from .metric_constraints import (
 __ALL__ = [
     Constraints,
     ConstraintsBuilder,
+    ConstraintsPlan,
     DatasetConstraint,
     MetricConstraint,
     MetricsSelector,
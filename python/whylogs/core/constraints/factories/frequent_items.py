@@ -1,4 +1,4 @@
-from whylogs.core.configs import SummaryConfig
+from whylogs.core.summary_cache import metric_summary
 
 from ..metric_constraints import MetricConstraint, MetricsSelector
 
@@ -17,7 +17,7 @@ def frequent_strings_in_reference_set(column_name: str, reference_set: dict) ->
     frequent_strings = MetricsSelector(metric_name="frequent_items", column_name=column_name)
 
     def labels_in_set(metric):
-        frequent_strings = metric.to_summary_dict(SummaryConfig())["frequent_strings"]
+        frequent_strings = metric_summary(metric)["frequent_strings"]
         result = all(item.value in reference_set for item in frequent_strings)
         return result
 
@@ -42,7 +42,7 @@ def n_most_common_items_in_set(column_name: str, n: int, reference_set: dict) ->
     constraint_name = f"{column_name} {n}-most common items in set {reference_set}"
 
     def most_common_in_set(metric):
-        frequent_strings = metric.to_summary_dict(SummaryConfig())["frequent_strings"]
+        frequent_strings = metric_summary(metric)["frequent_strings"]
         most_common_items = frequent_strings[:n]
         result = all(item.value in reference_set for item in most_common_items)
         return result
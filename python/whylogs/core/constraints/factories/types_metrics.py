@@ -1,3 +1,5 @@
+from whylogs.core.summary_cache import metric_summary
+
 from ..metric_constraints import MetricConstraint, MetricsSelector
 
 
@@ -35,7 +37,7 @@ def column_is_nullable_datatype(column_name: str, datatype: str) -> MetricConstr
     """
 
     def is_integer(x) -> bool:
-        types_dict = x.to_summary_dict()
+        types_dict = metric_summary(x)
         for key in types_dict.keys():
             if key == datatype and types_dict[key] == 0:
                 return False
@@ -1,12 +1,31 @@
+import operator
 import re
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from whylogs.core.metrics.metrics import Metric
 from whylogs.core.predicate_parser import _METRIC_REF, _PROFILE_REF, _tokenize
+from whylogs.core.stubs import pd
+from whylogs.core.summary_cache import (
+    SummaryCache,
+    get_summary_cache,
+    metric_summary,
+    summary_cache,
+)
 from whylogs.core.utils import deprecated
 from whylogs.core.view.column_profile_view import ColumnProfileView
 from whylogs.core.view.dataset_profile_view import DatasetProfileView
@@ -41,6 +60,12 @@ class MetricsSelector:
             else:
                 raise ValueError("metrics_resolver must return a list of Metrics if defined!")
 
+        cache = get_summary_cache()
+        if cache is not None:
+            return cache.get_metrics((profile, self.column_name, self.metric_name), lambda: self._select(profile))
+        return self._select(profile)
+
+    def _select(self, profile: DatasetProfileView) -> List[Metric]:
         results: List[Metric] = []
         column_profile_view = self.column_profile(profile)
         if column_profile_view is None:
@@ -82,8 +107,7 @@ class MetricConstraint:
 
     def _get_metric_summary(self, metrics: List[Metric]) -> Optional[Dict[str, Any]]:
         if len(metrics) == 1:  # Only returns a summary for single metrics.
-            metric_summary = pretty_display(metrics[0].namespace, metrics[0].to_summary_dict())
-            return metric_summary
+            return pretty_display(metrics[0].namespace, metric_summary(metrics[0]))
         return None
 
     @deprecated(message="Please use validate_profile()")
@@ -129,6 +153,13 @@ class MetricConstraint:
         return self._validate_metrics(metrics)
 
     def validate_profile(self, dataset_profile: DatasetProfileView) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        # the condition and the summary of the result share the metric summaries
+        with summary_cache():
+            return self._validate_profile(dataset_profile)
+
+    def _validate_profile(
+        self, dataset_profile: DatasetProfileView, with_summary: bool = True
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         # custom metric resolver allows empty metrics
         if self.metric_selector is None:
             raise ValueError("can't call validate with an empty metric selector")
@@ -137,7 +168,7 @@ class MetricConstraint:
             metrics = metric_selector.apply(dataset_profile)
             logger.info(f"validate using custom metric selector and found {metrics}")
             validate_result = self._validate_metrics(metrics)
-            metric_summary = self._get_metric_summary(metrics)
+            metric_summary = self._get_metric_summary(metrics) if with_summary else None
             return (validate_result, metric_summary)
 
         # standard selector requires a column be resolved
@@ -186,7 +217,7 @@ class MetricConstraint:
                 return (True, None)
 
         validate_result = self._validate_metrics(metrics)
-        metric_summary = self._get_metric_summary(metrics)
+        metric_summary = self._get_metric_summary(metrics) if with_summary else None
         return (validate_result, metric_summary)
 
 
@@ -217,12 +248,18 @@ class DatasetConstraint:
     def _get_metric_summary(self, metrics: Dict[str, Metric]) -> Optional[Dict[str, Any]]:
         summary: Dict[str, Any] = dict()
         for path, metric in metrics.items():
-            metric_summary = pretty_display(metric.namespace, metric.to_summary_dict())
-            for component, value in metric_summary.items():
+            pretty_summary = pretty_display(metric.namespace, metric_summary(metric))
+            for component, value in pretty_summary.items():
                 summary[f"{path}/{component}"] = value
         return summary
 
     def validate_profile(self, dataset_profile: DatasetProfileView) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        with summary_cache():
+            return self._validate_profile(dataset_profile)
+
+    def _validate_profile(
+        self, dataset_profile: DatasetProfileView, with_summary: bool = True
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
         try:
             validate_result, metrics = self.condition(dataset_profile)
         except MissingMetric as e:
@@ -236,7 +273,7 @@ class DatasetConstraint:
             )
             return (True, None)
 
-        metric_summary = self._get_metric_summary(metrics)
+        metric_summary = self._get_metric_summary(metrics) if with_summary else None
         return (validate_result, metric_summary)
 
 
@@ -250,7 +287,7 @@ class MetricConstraintWrapper:
         self.constraint = constraint
 
     def __call__(self, profile: DatasetProfileView) -> Tuple[bool, Dict[str, Metric]]:
-        valid, _ = self.constraint.validate_profile(profile)
+        valid, _ = self.constraint._validate_profile(profile, with_summary=False)
         metrics = self.constraint.metric_selector.apply(profile)  # Metrics used during evaluation
         columns = profile.get_columns()
         metric_map: Dict[str, Metric] = dict()
@@ -267,21 +304,90 @@ _INT_RE = re.compile(r"[-+]?\d+")
 _FLOAT_RE = re.compile(r"[-+]?(\d+(\.\d*)?|\.\d+)([eE][-+]?\d+)?")
 
 
+def _regex_match(left: Any, right: Any) -> Any:
+    regex = re.compile(right) if isinstance(right, str) else None
+    # TODO: should we try to str(left) ?
+    return regex and isinstance(left, str) and bool(regex.match(left))
+
+
+def _regex_fullmatch(left: Any, right: Any) -> Any:
+    regex = re.compile(right) if isinstance(right, str) else None
+    # TODO: should we try to str(left) ?
+    return regex and isinstance(left, str) and bool(regex.fullmatch(left))
+
+
+_BINARY_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    # Relational operators
+    "~": _regex_match,
+    "~=": _regex_fullmatch,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    # Boolean operators, both operands are always evaluated so the metrics they use are tracked
+    "and": lambda left, right: left and right,
+    "or": lambda left, right: left or right,
+    # Arithmetic operators
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "**": operator.pow,
+    "/": operator.truediv,
+    "//": operator.floordiv,
+    "%": operator.mod,
+}
+
+# evaluates a compiled (sub)expression on a profile, tracking the metrics it used in the dictionary
+_Evaluator = Callable[[DatasetProfileView, Dict[str, Metric]], Any]
+
+
+def _profile_reference(token: str, column_name: str, metric_name: str, component_name: str) -> _Evaluator:
+    metric_path = f"{column_name}/{metric_name}"
+
+    def evaluate(profile: DatasetProfileView, metric_map: Dict[str, Metric]) -> Any:
+        try:
+            metric = profile.get_column(column_name).get_metric(metric_name)  # type: ignore
+            summary = metric_summary(metric)  # type: ignore
+        except:  # noqa
+            raise MissingMetric(token)
+
+        # Track Metrics referenced during evaluation
+        metric_map[metric_path] = metric  # type: ignore
+        try:
+            return summary[component_name]
+        except:  # noqa
+            raise ValueError(f"Component {component_name} not found in {metric_path}")
+
+    return evaluate
+
+
+def _binary_operation(operation: Callable[[Any, Any], Any], left: _Evaluator, right: _Evaluator) -> _Evaluator:
+    return lambda profile, metric_map: operation(left(profile, metric_map), right(profile, metric_map))
+
+
+def _literal(value: Any) -> _Evaluator:
+    return lambda profile, metric_map: value
+
+
 class PrefixCondition:
     """
     Interpret expressions in the form used to serialize Predicate expressions.
     This is probably a reasonable serialization format for DatasetConstraint
     conditions, but might not be the best user interface for creating conditions
     in client code.
+
+    The expression is compiled into a tree of functions the first time the condition
+    is evaluated, later evaluations only look up the metrics it references.
     """
 
     def __init__(self, expression: str) -> None:
         self._expression = expression
         self._tokens = _tokenize(expression)
-        self._profile = None
-        self._metric_map: Dict[str, Metric] = dict()
+        self._evaluator: Optional[_Evaluator] = None
 
-    def _interpret(self, i: int) -> Tuple[Any, int]:  # noqa: C901
+    def _compile(self, i: int) -> Tuple[_Evaluator, int]:
         token = self._tokens[i]
 
         # Metric reference        :column_name:metric_namespace/component_name
@@ -290,143 +396,45 @@ class PrefixCondition:
 
         match = _METRIC_REF.fullmatch(token)
         if bool(match):
-            path = token[2:]
             # TODO: get dataset-level metric from profile
             # TODO: self._metric_map[path] = metric
-            return 0, i + 1
+            return _literal(0), i + 1
 
         match = _PROFILE_REF.fullmatch(token)
         if bool(match):
             column_name, path = match.groups()
             metric_name, component_name = path.split("/", 1)
-            try:
-                metric = self._profile.get_column(column_name).get_metric(metric_name)  # type: ignore
-                summary = metric.to_summary_dict()
-            except:  # noqa
-                raise MissingMetric(token)
-
-            # Track Metrics referenced during evaluation
-            metric_path = f"{column_name}/{metric_name}"
-            self._metric_map[metric_path] = metric
-            try:
-                value = summary[component_name]
-            except:  # noqa
-                raise ValueError(f"Component {component_name} not found in {metric_path}")
-
-            return value, i + 1
-
-        # Relational operators
-
-        if token == "~":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            regex = re.compile(right) if isinstance(right, str) else None
-            # TODO: should we try to str(left) ?
-            return (regex and isinstance(left, str) and bool(regex.match(left))), i
-
-        if token == "~=":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            regex = re.compile(right) if isinstance(right, str) else None
-            # TODO: should we try to str(left) ?
-            return (regex and isinstance(left, str) and bool(regex.fullmatch(left))), i
-
-        if token == "==":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left == right), i
-
-        if token == "!=":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left != right), i
-
-        if token == "<":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left < right), i
-
-        if token == "<=":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left <= right), i
-
-        if token == ">":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left > right), i
-
-        if token == ">=":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left >= right), i
-
-        # Boolean operators
-
-        if token == "and":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left and right), i
-
-        if token == "or":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left or right), i
+            return _profile_reference(token, column_name, metric_name, component_name), i + 1
+
+        operation = _BINARY_OPERATORS.get(token)
+        if operation is not None:
+            left, i = self._compile(i + 1)
+            right, i = self._compile(i)
+            return _binary_operation(operation, left, right), i
 
         if token == "not":
-            right, i = self._interpret(i + 1)
-            return (not right), i
-
-        # Arithmetic operators
-
-        if token == "+":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left + right), i
-
-        if token == "-":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left - right), i
-
-        if token == "*":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left * right), i
-
-        if token == "**":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left**right), i
-
-        if token == "/":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left / right), i
-
-        if token == "//":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left // right), i
-
-        if token == "%":
-            left, i = self._interpret(i + 1)
-            right, i = self._interpret(i)
-            return (left % right), i
+            right, i = self._compile(i + 1)
+            return (lambda profile, metric_map: not right(profile, metric_map)), i
 
         # Literals
 
         if token.startswith('"'):
-            return token[1:-1], i + 1
+            return _literal(token[1:-1]), i + 1
 
         if bool(_INT_RE.fullmatch(token)):
-            return int(token), i + 1
+            return _literal(int(token)), i + 1
 
         if bool(_FLOAT_RE.fullmatch(token)):
-            return float(token), i + 1
+            return _literal(float(token)), i + 1
 
         raise ValueError(f"Unparsable expression: '{self._expression}' at token {i}: '{token}'")
 
+    def compile(self) -> _Evaluator:
+        """Compiles the expression if it wasn't yet, raises ValueError if it can't be parsed."""
+        if self._evaluator is None:
+            self._evaluator, _ = self._compile(0)
+        return self._evaluator
+
     def __call__(self, profile: DatasetProfileView) -> Tuple[bool, Optional[Dict[str, Metric]]]:
         """
         relational operators: ~ ~= == < <= > >= !=
@@ -441,13 +449,12 @@ class PrefixCondition:
         :column_name:metric_namespace -> Metric for the metrics used in evaluating
         the expression.
         """
-        self._profile = profile
-        self._metric_map = dict()
-        passes, _ = self._interpret(0)
+        metric_map: Dict[str, Metric] = dict()
+        passes = self.compile()(profile, metric_map)
         if not isinstance(passes, bool):
             raise ValueError(f"Contraint expression should return a boolean, got {type(passes)}")
 
-        return passes, self._metric_map
+        return passes, metric_map
 
 
 def _make_report(
@@ -478,6 +485,11 @@ class Constraints:
         self.dataset_profile_view = dataset_profile_view
 
     def validate(self, profile_view: Optional[DatasetProfileView] = None) -> bool:
+        # constraints on the same metrics compute their summaries once
+        with summary_cache():
+            return self._validate(profile_view)
+
+    def _validate(self, profile_view: Optional[DatasetProfileView] = None) -> bool:
         profile = self._resolve_profile_view(profile_view)
         column_names = self.column_constraints.keys()
         if len(column_names) == 0 and len(self.dataset_constraints) == 0:
@@ -487,13 +499,13 @@ class Constraints:
         for column_name in column_names:
             columnar_constraints = self.column_constraints[column_name]
             for constraint_name, metric_constraint in columnar_constraints.items():
-                (result, _) = metric_constraint.validate_profile(profile)
+                (result, _) = metric_constraint._validate_profile(profile, with_summary=False)
                 if not result:
                     logger.info(f"{constraint_name} failed on column {column_name}")
                     return False
 
         for constraint in self.dataset_constraints:
-            (result, _) = constraint.validate_profile(profile)
+            (result, _) = constraint._validate_profile(profile, with_summary=False)
             if not result:
                 logger.info(f"{constraint.name} failed on dataset")
                 return False
@@ -501,20 +513,24 @@ class Constraints:
 
     @deprecated(message="Please use generate_constraints_report()")
     def report(self, profile_view: Optional[DatasetProfileView] = None) -> List[Tuple[str, int, int]]:
+        with summary_cache():
+            return self._report(profile_view)
+
+    def _report(self, profile_view: Optional[DatasetProfileView] = None) -> List[Tuple[str, int, int]]:
         profile = self._resolve_profile_view(profile_view)
         column_names = self.column_constraints.keys()
         results: List[Tuple[str, int, int]] = []
         for column_name in column_names:
             columnar_constraints = self.column_constraints[column_name]
             for constraint_name, metric_constraint in columnar_constraints.items():
-                (result, _) = metric_constraint.validate_profile(profile)
+                (result, _) = metric_constraint._validate_profile(profile, with_summary=False)
                 if not result:
                     logger.info(f"{constraint_name} failed on column {column_name}")
                     results.append((constraint_name, 0, 1))
                 else:
                     results.append((constraint_name, 1, 0))
         for constraint in self.dataset_constraints:
-            result, _ = constraint.validate_profile(profile)
+            result, _ = constraint._validate_profile(profile, with_summary=False)
             if not result:
                 logger.info(f"{constraint.name} failed on dataset")
                 results.append((constraint.name, 0, 1))
@@ -533,7 +549,7 @@ class Constraints:
         constraint_name: str,
         with_summary: bool,
     ) -> ReportResult:
-        (result, metric_summary) = metric_constraint.validate_profile(profile_view)
+        (result, metric_summary) = metric_constraint._validate_profile(profile_view, with_summary)
         return _make_report(constraint_name, result, with_summary, metric_summary)
 
     def _generate_dataset_report(
@@ -542,11 +558,17 @@ class Constraints:
         constraint: DatasetConstraint,
         with_summary: bool,
     ) -> ReportResult:
-        (result, summary) = constraint.validate_profile(profile_view)
+        (result, summary) = constraint._validate_profile(profile_view, with_summary)
         return _make_report(constraint.name, result, with_summary, summary)
 
     def generate_constraints_report(
         self, profile_view: Optional[DatasetProfileView] = None, with_summary=False
+    ) -> List[ReportResult]:
+        with summary_cache():
+            return self._generate_constraints_report(profile_view, with_summary)
+
+    def _generate_constraints_report(
+        self, profile_view: Optional[DatasetProfileView], with_summary: bool
     ) -> List[ReportResult]:
         profile = self._resolve_profile_view(profile_view)
         column_names = self.column_constraints.keys()
@@ -589,6 +611,109 @@ class Constraints:
             )
         return profile_view if profile_view is not None else self.dataset_profile_view
 
+    def compile(self) -> "ConstraintsPlan":
+        """Returns a plan evaluating these constraints against many profiles, see ConstraintsPlan."""
+        return ConstraintsPlan(self)
+
+
+class ConstraintsPlan:
+    """
+    The constraints of a Constraints suite prepared for evaluation against many profiles.
+
+    PrefixCondition expressions are compiled once when the plan is created. Each profile is evaluated
+    with its own SummaryCache, so the constraints on the same metric share its summary.
+    Constraints with the same name on different columns are labeled column_name/constraint_name
+    in the report.
+    """
+
+    def __init__(self, constraints: Constraints) -> None:
+        names = [name for column in constraints.column_constraints.values() for name in column]
+        names += [constraint.name for constraint in constraints.dataset_constraints]
+        duplicates = {name for name in names if names.count(name) > 1}
+
+        self._labels: List[str] = []
+        self._constraints: List[Union[MetricConstraint, DatasetConstraint]] = []
+        for column_name, column_constraints in constraints.column_constraints.items():
+            for name, metric_constraint in column_constraints.items():
+                self._labels.append(f"{column_name}/{name}" if name in duplicates else name)
+                self._constraints.append(metric_constraint)
+        for dataset_constraint in constraints.dataset_constraints:
+            if isinstance(dataset_constraint.condition, PrefixCondition):
+                dataset_constraint.condition.compile()
+            self._labels.append(dataset_constraint.name)
+            self._constraints.append(dataset_constraint)
+
+    @property
+    def labels(self) -> List[str]:
+        return list(self._labels)
+
+    def evaluate(self, profile_view: DatasetProfileView) -> List[bool]:
+        """Returns whether the profile passes each constraint, in the order of labels."""
+        with summary_cache(SummaryCache()):
+            return [
+                constraint._validate_profile(profile_view, with_summary=False)[0] for constraint in self._constraints
+            ]
+
+    def report(
+        self,
+        profiles: Union[Sequence[DatasetProfileView], Mapping[Any, DatasetProfileView], Any],
+        max_workers: Optional[int] = None,
+    ) -> "pd.DataFrame":
+        """
+        Evaluates the constraints against every profile.
+
+        Args:
+            profiles: a list of profile views, a dictionary of profile views by label, or a result set.
+                The profiles of a segmented result set are labeled by segment key, with one index level
+                per segmentation column.
+            max_workers: number of threads evaluating profiles concurrently, profiles are evaluated one
+                after the other by default.
+
+        Returns:
+            a DataFrame with one row per profile and one boolean column per constraint, True where the
+            profile passes the constraint.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        labels, views = _labeled_views(profiles)
+        if max_workers is None or max_workers == 1 or len(views) < 2:
+            results = [self.evaluate(view) for view in views]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self.evaluate, views))
+
+        return pd.DataFrame(
+            results, index=_profile_index(labels), columns=pd.Index(self._labels, name="constraint"), dtype=bool
+        )
+
+
+def _labeled_views(
+    profiles: Union[Sequence[DatasetProfileView], Mapping[Any, DatasetProfileView], Any]
+) -> Tuple[List[Any], List[DatasetProfileView]]:
+    if isinstance(profiles, DatasetProfileView):
+        return [0], [profiles]
+    if isinstance(profiles, Mapping):
+        return list(profiles.keys()), list(profiles.values())
+    if hasattr(profiles, "segments"):  # SegmentedResultSet
+        segments = profiles.segments() or []
+        return [segment.key for segment in segments], [profiles.view(segment) for segment in segments]
+    if hasattr(profiles, "view"):  # other result sets
+        return [0], [profiles.view()]
+    views = list(profiles)
+    return list(range(len(views))), views
+
+
+def _profile_index(labels: List[Any]) -> "pd.Index":
+    # like a groupby, segments are labeled by their value when segmented on one column
+    if labels and all(isinstance(label, tuple) for label in labels):
+        lengths = {len(label) for label in labels}
+        if lengths == {1}:
+            return pd.Index([label[0] for label in labels], name="segment")
+        if len(lengths) == 1:
+            return pd.MultiIndex.from_tuples(labels)
+    return pd.Index(labels, name="profile", tupleize_cols=False)
+
 
 class ConstraintsBuilder:
     def __init__(self, dataset_profile_view: DatasetProfileView, constraints: Optional[Constraints] = None) -> None:
@@ -1,18 +1,24 @@
 import logging
+import os
 import os.path
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from whylogs.api.writer.writer import Writable
 from whylogs.core.metrics import Metric
+from whylogs.core.metrics.condition_count_metric import ConditionCountMetric
 from whylogs.core.model_performance_metrics.model_performance_metrics import (
     ModelPerformanceMetrics,
 )
 from whylogs.core.utils.utils import deprecated_alias
 
 from .column_profile import ColumnProfile
-from .input_resolver import _pandas_or_dict
+from .input_resolver import _is_arrow_table, _pandas_or_dict
+from .preprocessing import PreprocessedColumn
 from .schema import DatasetSchema
 from .stubs import pd
 from .view import DatasetProfileView
@@ -22,6 +28,29 @@ logger = logging.getLogger(__name__)
 _LARGE_CACHE_SIZE_LIMIT = 1024 * 100
 _MODEL_PERFORMANCE_KEY = "model_performance_metrics"
 
+# Thread pools for DatasetSchema.max_workers, shared by all the profiles using the same number of workers
+_COLUMN_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+_COLUMN_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_column_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _COLUMN_EXECUTORS_LOCK:
+        executor = _COLUMN_EXECUTORS.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="whylogs-columns")
+            _COLUMN_EXECUTORS[max_workers] = executor
+        return executor
+
+
+if hasattr(os, "register_at_fork"):
+    # the pool threads don't survive a fork, the child process starts new pools if it needs them
+    os.register_at_fork(after_in_child=_COLUMN_EXECUTORS.clear)
+
+
+def _track_column_values(column_values: List[Tuple[ColumnProfile, Any]]) -> None:
+    for column_profile, values in column_values:
+        column_profile.track_column(values)
+
 
 class DatasetProfile(Writable):
     """
@@ -55,6 +84,10 @@ class DatasetProfile(Writable):
         self._columns: Dict[str, ColumnProfile] = dict()
         self._is_active = False
         self._track_count = 0
+        self._row_buffer: List[Mapping[str, Any]] = []
+        self._row_buffer_bytes = 0
+        self._row_buffer_start = 0.0
+        self._buffer_rows = True
         new_cols = schema.get_col_names()
         self._initialize_new_columns(new_cols)
         self._metrics: Dict[str, Union[Metric, Any]] = metrics or dict()
@@ -87,6 +120,7 @@ class DatasetProfile(Writable):
         if col_name not in self._columns:
             raise ValueError(f"{col_name} is not a column in the dataset profile")
         self._columns[col_name].add_metric(metric)
+        self._update_row_buffering()
 
     def add_dataset_metric(self, name: str, metric: Metric) -> None:
         self._metrics[name] = metric
@@ -121,20 +155,23 @@ class DatasetProfile(Writable):
         pandas: Optional[pd.DataFrame] = None,
         row: Optional[Mapping[str, Any]] = None,
     ) -> None:
+        if _is_arrow_table(obj) and pandas is None and row is None:
+            self._track_arrow(obj)
+            return
+
         pandas, row = _pandas_or_dict(obj, pandas, row)
 
-        # TODO: do this less frequently when operating at row level
+        if row is not None:
+            self._track_row(row)
+            return
+
         dirty = self._schema.resolve(pandas=pandas, row=row)
         if dirty:
             schema_col_keys = self._schema.get_col_names()
             new_cols = (col for col in schema_col_keys if col not in self._columns)
             self._initialize_new_columns(tuple(new_cols))
 
-        if row is not None:
-            for k in row.keys():
-                self._columns[k]._track_datum(row[k])
-            return
-        elif pandas is not None:
+        if pandas is not None:
             # TODO: iterating over each column in order assumes single column metrics
             #   but if we instead iterate over a new artifact contained in dataset profile: "MetricProfiles", then
             #   each metric profile can specify which columns its tracks, and we can call like this:
@@ -142,6 +179,7 @@ class DatasetProfile(Writable):
             if pandas.empty:
                 logger.warning("whylogs was passed an empty pandas DataFrame so nothing to profile in this call.")
                 return
+            columns = []
             for k in pandas.keys():
                 column_values = pandas.get(k)
                 if column_values is None:
@@ -149,11 +187,134 @@ class DatasetProfile(Writable):
                         f"whylogs was passed a pandas DataFrame with key [{k}] but DataFrame.get({k}) returned nothing!"
                     )
                 else:
-                    self._columns[k].track_column(column_values)
+                    columns.append((self._columns[k], column_values))
+            self._track_columns(columns)
             return
 
         raise NotImplementedError
 
+    def _track_preprocessed(self, pandas: pd.DataFrame, columns: Mapping[str, PreprocessedColumn]) -> None:
+        """
+        Track columns already split by PreprocessedColumn, such as the segments of a DataFrame produced by
+        PreprocessedColumn.split_groups(). The DataFrame the columns come from is only used to resolve the schema.
+        """
+        try:
+            self._is_active = True
+            self._track_count += 1
+            if self._schema.resolve(pandas=pandas):
+                schema_col_keys = self._schema.get_col_names()
+                self._initialize_new_columns(tuple(col for col in schema_col_keys if col not in self._columns))
+            self._track_columns([(self._columns[k], column) for k, column in columns.items()])
+        finally:
+            self._is_active = False
+
+    def _track_row(self, row: Mapping[str, Any]) -> None:
+        """
+        Buffer a single row. The schema is only resolved for keys that don't have a column yet. The buffered rows
+        are converted to columns and tracked in one batch once the buffer holds DatasetSchema.cache_size rows,
+        the values take up more than DatasetSchema.cache_bytes or the oldest row is older than
+        DatasetSchema.cache_max_age seconds.
+        The row is copied but its values aren't, so a list or array changed after it was tracked is profiled as
+        changed. Profiles with validators or condition count metrics don't buffer rows, as their actions and
+        failures belong to the row being tracked.
+        """
+        new_keys = [k for k in row.keys() if k not in self._columns]
+        if new_keys:
+            self._schema.resolve(row={k: row[k] for k in new_keys})
+            schema_col_keys = self._schema.get_col_names()
+            self._initialize_new_columns(tuple(col for col in schema_col_keys if col not in self._columns))
+
+        if not self._buffer_rows:
+            self._flush_rows()
+            self._track_columns([(self._columns[k], [v]) for k, v in row.items()])
+            return
+
+        if not self._row_buffer:
+            self._row_buffer_start = time.monotonic()
+        # copy the row so the caller can reuse its dict while the values are buffered
+        self._row_buffer.append(dict(row))
+
+        cache_bytes = self._schema.cache_bytes
+        if cache_bytes is not None:
+            self._row_buffer_bytes += sum(sys.getsizeof(v) for v in row.values())
+
+        cache_max_age = self._schema.cache_max_age
+        if (
+            len(self._row_buffer) >= self._schema.cache_size
+            or (cache_bytes is not None and self._row_buffer_bytes >= cache_bytes)
+            or (cache_max_age is not None and time.monotonic() - self._row_buffer_start >= cache_max_age)
+        ):
+            self._flush_rows()
+
+    def _flush_rows(self) -> None:
+        """
+        Transpose the buffered rows into one list of values per column and track the columns in one batch.
+        The buffer is only emptied once the rows are tracked, if tracking raises the rows stay buffered.
+        """
+        if not self._row_buffer:
+            return
+        rows = self._row_buffer
+
+        keys = rows[0].keys()
+        column_values: Dict[str, List[Any]] = {}
+        if all(row.keys() == keys for row in rows):
+            for k in keys:
+                column_values[k] = [row[k] for row in rows]
+        else:
+            # missing keys are skipped rather than tracked as None
+            for row in rows:
+                for k, v in row.items():
+                    values = column_values.get(k)
+                    if values is None:
+                        values = column_values[k] = []
+                    values.append(v)
+        self._track_columns([(self._columns[k], values) for k, values in column_values.items()])
+        self._row_buffer = []
+        self._row_buffer_bytes = 0
+
+    def _update_row_buffering(self) -> None:
+        self._buffer_rows = not any(
+            column._column_validators or any(isinstance(m, ConditionCountMetric) for m in column._metrics.values())
+            for column in self._columns.values()
+        )
+
+    def _track_arrow(self, table: Any) -> None:
+        """Track a pyarrow.Table or pyarrow.RecordBatch one Arrow chunk at a time, without converting it to Pandas."""
+        if self._schema.resolve(arrow=table.schema):
+            schema_col_keys = self._schema.get_col_names()
+            new_cols = (col for col in schema_col_keys if col not in self._columns)
+            self._initialize_new_columns(tuple(new_cols))
+
+        if table.num_rows == 0:
+            logger.warning("whylogs was passed an empty Arrow table so nothing to profile in this call.")
+            return
+        columns = []
+        for name, column in zip(table.schema.names, table.columns):
+            for chunk in getattr(column, "chunks", [column]):
+                if len(chunk) > 0:
+                    columns.append((self._columns[name], chunk))
+        self._track_columns(columns)
+
+    def _track_columns(self, columns: List[Tuple[ColumnProfile, Any]]) -> None:
+        """
+        Track each column's values with its ColumnProfile. If the schema sets max_workers, the columns are
+        tracked concurrently on a thread pool, each ColumnProfile being updated by a single thread.
+        """
+        max_workers = self._schema.max_workers or 1
+        if max_workers <= 1 or len(columns) <= 1:
+            _track_column_values(columns)
+            return
+
+        # chunks of the same column must be tracked in order by the same task
+        tasks: Dict[int, List[Tuple[ColumnProfile, Any]]] = {}
+        for column_profile, values in columns:
+            tasks.setdefault(id(column_profile), []).append((column_profile, values))
+
+        executor = _get_column_executor(max_workers)
+        futures = [executor.submit(_track_column_values, task) for task in tasks.values()]
+        for future in futures:
+            future.result()
+
     def _track_classification_metrics(self, targets, predictions, scores=None) -> None:
         """
         Function to track metrics based on validation data.
@@ -219,8 +380,10 @@ class DatasetProfile(Writable):
                 self._columns[col] = ColumnProfile(name=col, schema=col_schema, cache_size=self._schema.cache_size)
             else:
                 logger.warning("Encountered a column without schema: %s", col)
+        self._update_row_buffering()
 
     def view(self) -> DatasetProfileView:
+        self._flush_rows()
         columns = {}
         for c_name, c in self._columns.items():
             columns[c_name] = c.view()
@@ -232,6 +395,7 @@ class DatasetProfile(Writable):
         )
 
     def flush(self) -> None:
+        self._flush_rows()
         for col in self._columns.values():
             col.flush()
 
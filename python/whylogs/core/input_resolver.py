@@ -1,8 +1,20 @@
+import sys
 from typing import Any, Dict, Mapping, Optional, Tuple
 
 from whylogs.core.stubs import pd
 
 
+def _is_arrow_table(obj: Any) -> bool:
+    # pyarrow is optional and slow to import: if nothing imported it yet, obj can't be an Arrow object
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(obj, (pa.Table, pa.RecordBatch))
+
+
+def _is_arrow_array(obj: Any) -> bool:
+    pa = sys.modules.get("pyarrow")
+    return pa is not None and isinstance(obj, (pa.Array, pa.ChunkedArray))
+
+
 def _pandas_or_dict(
     obj: Any, pandas: Optional[pd.DataFrame] = None, row: Optional[Mapping[str, Any]] = None
 ) -> Tuple[Optional[pd.DataFrame], Optional[Mapping[str, Any]]]:
@@ -16,6 +28,8 @@ def _pandas_or_dict(
             row = obj
         elif pd.DataFrame is not None and isinstance(obj, pd.DataFrame):
             pandas = obj
+        elif _is_arrow_table(obj):
+            pandas = obj.to_pandas()
 
     if pandas is not None and row is not None:
         raise ValueError("Cannot pass both pandas and row params")
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Generic, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
 
 import whylogs_sketching as ds  # type: ignore
 
@@ -86,6 +86,27 @@ def _fs_merge(lhs: ds.frequent_strings_sketch, rhs: ds.frequent_strings_sketch)
     return copy
 
 
+def _kll_merge_in_place(lhs: ds.kll_doubles_sketch, rhs: ds.kll_doubles_sketch) -> ds.kll_doubles_sketch:
+    lhs.merge(rhs)
+    return lhs
+
+
+def _fs_merge_in_place(lhs: ds.frequent_strings_sketch, rhs: ds.frequent_strings_sketch) -> ds.frequent_strings_sketch:
+    lhs.merge(rhs)
+    return lhs
+
+
+# Aggregators that have an equivalent updating the left hand side value instead of copying it
+_IN_PLACE_AGGREGATORS: Dict[_Aggregator, Callable[[Any, Any], Any]] = {
+    _kll_merge: _kll_merge_in_place,
+    _fs_merge: _fs_merge_in_place,
+}
+
+
+def get_in_place_aggregator(aggregator: _Aggregator) -> Optional[Callable[[Any, Any], Any]]:
+    return _IN_PLACE_AGGREGATORS.get(aggregator)
+
+
 class AggregatorRegistry:
     def __init__(self) -> None:
         self._id_aggs: Dict[int, _Aggregator] = _ID_AGGREGATORS.copy()
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional, Type, TypeVar
 from whylogs.core.configs import SummaryConfig
 from whylogs.core.errors import DeserializationError, UnsupportedError
 from whylogs.core.metrics import Metric
-from whylogs.core.metrics.metrics import _METRIC_DESERIALIZER_REGISTRY, OperationResult
+from whylogs.core.metrics.metrics import OperationResult, _get_registered_metric
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricComponentMessage, MetricMessage
 
@@ -77,6 +77,25 @@ class CompoundMetric(Metric, ABC):
     def merge(self: COMPOUND_METRIC, other: COMPOUND_METRIC) -> COMPOUND_METRIC:
         return self.__class__(self.merge_submetrics(other))
 
+    def merge_into(self: COMPOUND_METRIC, target: COMPOUND_METRIC) -> COMPOUND_METRIC:
+        if type(self).merge is not CompoundMetric.merge:
+            return self._merge_into_copy(target)
+        return self._merge_submetrics_into(target)
+
+    def _merge_submetrics_into(self: COMPOUND_METRIC, target: COMPOUND_METRIC) -> COMPOUND_METRIC:
+        if self.namespace != target.namespace:
+            raise ValueError(f"Attempt to merge CompoundMetrics {self.namespace} and {target.namespace}")
+
+        for submetric_name, submetric in self.submetrics.items():
+            target_submetric = target.submetrics.get(submetric_name)
+            if target_submetric is None:
+                target.submetrics[submetric_name] = deepcopy(submetric)
+            elif target_submetric.namespace != submetric.namespace:
+                raise ValueError("Attempt to merge CompoundMetrics with incompatible submetric types")
+            else:
+                submetric.merge_into(target_submetric)
+        return target
+
     def to_protobuf(self) -> MetricMessage:
         msg = {}
         for sub_name, submetric in self.submetrics.items():
@@ -119,9 +138,8 @@ class CompoundMetric(Metric, ABC):
 
         for m_name_and_type, metric_components in submetric_msgs.items():
             m_name, m_type = m_name_and_type.split(":")
-            if m_type in _METRIC_DESERIALIZER_REGISTRY:
-                metric_class = _METRIC_DESERIALIZER_REGISTRY[m_type]
-            else:
+            metric_class = _get_registered_metric(m_type)
+            if metric_class is None:
                 raise UnsupportedError(f"Unsupported metric: {m_type}")
 
             m_msg = MetricMessage(metric_components=metric_components)
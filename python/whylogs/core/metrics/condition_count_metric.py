@@ -1,5 +1,4 @@
 import logging
-import re
 from copy import copy
 from dataclasses import dataclass, field
 from itertools import chain
@@ -15,7 +14,10 @@ from whylogs.core.metrics.metrics import (
 )
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricMessage
+from whylogs.core.relations import Predicate
 from whylogs.core.relations import Relation as Rel
+from whylogs.core.relations import evaluate_elementwise
+from whylogs.core.stubs import is_not_stub, np, pd
 
 logger = logging.getLogger(__name__)
 
@@ -23,39 +25,55 @@ logger = logging.getLogger(__name__)
 Relation = Rel  # type: ignore
 
 
+_VALUE_RELATIONS = {
+    Relation.match,  # type: ignore
+    Relation.fullmatch,  # type: ignore
+    Relation.equal,  # type: ignore
+    Relation.less,  # type: ignore
+    Relation.leq,  # type: ignore
+    Relation.greater,  # type: ignore
+    Relation.geq,  # type: ignore
+    Relation.neq,  # type: ignore
+}
+
+
 # relation() is annoying, use Predicate instead
 def relation(op: Relation, value: Union[str, int, float]) -> Callable[[Any], bool]:  # type: ignore
-    if op == Relation.match:  # type: ignore
-        return lambda x: re.compile(value).match(x)  # type: ignore
-    if op == Relation.fullmatch:  # type: ignore
-        return lambda x: re.compile(value).fullmatch(x)  # type: ignore
-    if op == Relation.equal:  # type: ignore
-        return lambda x: x == value  # type: ignore
-    if op == Relation.less:  # type: ignore
-        return lambda x: x < value  # type: ignore
-    if op == Relation.leq:  # type: ignore
-        return lambda x: x <= value  # type: ignore
-    if op == Relation.greater:  # type: ignore
-        return lambda x: x > value  # type: ignore
-    if op == Relation.geq:  # type: ignore
-        return lambda x: x >= value  # type: ignore
-    if op == Relation.neq:  # type: ignore
-        return lambda x: x != value  # type: ignore
+    # the relations are built as predicates so ConditionCountMetric can evaluate them vectorized
+    if op in _VALUE_RELATIONS:
+        return Predicate(op, value)
     raise ValueError("Unknown ConditionCountMetric predicate")
 
 
 def and_relations(left: Callable[[Any], bool], right: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    if isinstance(left, Predicate) and isinstance(right, Predicate):
+        return left.and_(right)
     return lambda x: left(x) and right(x)
 
 
 def or_relations(left: Callable[[Any], bool], right: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    if isinstance(left, Predicate) and isinstance(right, Predicate):
+        return left.or_(right)
     return lambda x: left(x) or right(x)
 
 
 def not_relation(relation: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    if isinstance(relation, Predicate):
+        return Predicate(Relation._not, right=relation)  # type: ignore
     return lambda x: not relation(x)
 
 
+def _as_array(values: Any) -> "np.ndarray":
+    if isinstance(values, np.ndarray):
+        return values
+    if isinstance(values, pd.Series):
+        return values.to_numpy()
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):  # element by element so nested sequences stay objects
+        array[i] = value
+    return array
+
+
 @dataclass(frozen=True)
 class Condition:
     relation: Callable[[Any], bool]
@@ -118,8 +136,36 @@ class ConditionCountMetric(Metric):
         if data.len <= 0:
             return OperationResult.ok(0)
 
+        if not is_not_stub(np.ndarray):
+            return self._update_elementwise(data)
+
         count = 0
-        failed_conditions: Set[str] = set()
+        failed_conditions: Dict[str, Condition] = dict()
+        for chunk in data.raw_iterator():
+            values = _as_array(chunk)
+            count += len(values)
+            for cond_name, condition in self.conditions.items():
+                if isinstance(condition.relation, Predicate):
+                    matches, errors = condition.relation.evaluate_array(values)
+                else:
+                    matches, errors = evaluate_elementwise(condition.relation, values)
+                match_count = int(np.count_nonzero(matches))
+                self.matches[cond_name].set(self.matches[cond_name].value + match_count)
+                if match_count == len(values):
+                    continue
+                failed_conditions[cond_name] = condition
+                if condition.actions:
+                    for datum in values[~(matches | errors)].tolist():
+                        for action in condition.actions:
+                            action(self.namespace, cond_name, datum)
+
+        self.total.set(self.total.value + count)
+        self._report_failures(failed_conditions)
+        return OperationResult.ok(count)
+
+    def _update_elementwise(self, data: PreprocessedColumn) -> OperationResult:
+        count = 0
+        failed_conditions: Dict[str, Condition] = dict()
         for datum in list(chain.from_iterable(data.raw_iterator())):
             count += 1
             for cond_name, condition in self.conditions.items():
@@ -127,23 +173,26 @@ class ConditionCountMetric(Metric):
                     if condition.relation(datum):
                         self.matches[cond_name].set(self.matches[cond_name].value + 1)
                     else:
-                        failed_conditions.add(cond_name)
+                        failed_conditions[cond_name] = condition
                         for action in condition.actions:
                             action(self.namespace, cond_name, datum)
 
                 except Exception as e:  # noqa
                     logger.debug(e)
-                    failed_conditions.add(cond_name)
+                    failed_conditions[cond_name] = condition
 
         self.total.set(self.total.value + count)
-        if failed_conditions:
-            if condition.log_on_failure:
-                logger.warning(f"Condition(s) {', '.join(failed_conditions)} failed")
+        self._report_failures(failed_conditions)
+        return OperationResult.ok(count)
 
-            if condition.throw_on_failure:
-                raise ValueError(f"Condition(s) {', '.join(failed_conditions)} failed")
+    def _report_failures(self, failed_conditions: Dict[str, Condition]) -> None:
+        to_log = [cond_name for cond_name, condition in failed_conditions.items() if condition.log_on_failure]
+        if to_log:
+            logger.warning(f"Condition(s) {', '.join(to_log)} failed")
 
-        return OperationResult.ok(count)
+        to_throw = [cond_name for cond_name, condition in failed_conditions.items() if condition.throw_on_failure]
+        if to_throw:
+            raise ValueError(f"Condition(s) {', '.join(to_throw)} failed")
 
     @classmethod
     def zero(cls, config: Optional[MetricConfig] = None) -> "ConditionCountMetric":
@@ -17,6 +17,10 @@ class DecoratedFunction(ABC):
         pass
 
 
+# number of functions registered so far. Lookups cached against the registries are stale once it changes.
+_registration_count = 0
+
+
 def _decorate_func(  # type: ignore
     *,
     key: Any,  # type: ignore
@@ -50,6 +54,8 @@ def _func_wrapper(
             return existing_
         raise ValueError(f"Builtin aggregator for type {key} is already registered")
 
+    global _registration_count
     wrapped_func = clazz.build(func=func, name=name)
     wrapper_dict[key] = wrapped_func
+    _registration_count += 1
     return wrapped_func
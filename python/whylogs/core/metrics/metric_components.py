@@ -1,15 +1,27 @@
+import importlib
 from dataclasses import dataclass
-from typing import Generic, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar
 
 import whylogs_sketching as ds  # type: ignore
 
+from whylogs.core.metrics import decorators
 from whylogs.core.metrics.aggregators import (
     AggregatorRegistry,
+    _Aggregator,
     _id_aggregator,
     get_aggregator,
+    get_in_place_aggregator,
+)
+from whylogs.core.metrics.deserializers import (
+    DeserializerRegistry,
+    _Deserializer,
+    get_deserializer,
+)
+from whylogs.core.metrics.serializers import (
+    Serializer,
+    SerializerRegistry,
+    get_serializer,
 )
-from whylogs.core.metrics.deserializers import DeserializerRegistry, get_deserializer
-from whylogs.core.metrics.serializers import SerializerRegistry, get_serializer
 from whylogs.core.proto import MetricComponentMessage
 
 T = TypeVar("T")
@@ -23,6 +35,79 @@ class Registries:
     deserializerRegistry: Optional[DeserializerRegistry] = None
 
 
+_DEFAULT_REGISTRIES = Registries()
+
+_Functions = Tuple[Optional[_Aggregator], Optional[Serializer], Optional[_Deserializer]]
+
+# registry lookups by (mtype, type_id, registries), along with the registration count they were resolved at
+_RESOLVED_FUNCTIONS: Dict[Tuple[Optional[type], int, Registries], Tuple[int, _Functions]] = dict()
+
+# the value type of each field of the MetricComponentMessage value oneof
+_ONEOF_MTYPES: Dict[Optional[str], type] = {
+    "n": int,
+    "d": float,
+    "frequent_items": ds.frequent_strings_sketch,
+    "hll": ds.hll_sketch,
+    "kll": ds.kll_doubles_sketch,
+}
+
+# modules registering the serialization of component types with optional dependencies, they are only imported
+# the first time a component with one of their type IDs is deserialized
+_LAZY_COMPONENT_MODULES: Dict[int, str] = {
+    101: "whylogs.experimental.extras.matrix_component",
+}
+
+_DESERIALIZED_COMPONENT_CLASSES: Dict[Tuple[Optional[str], int, Optional[Registries]], Type["MetricComponent"]] = dict()
+
+
+def _resolve_functions(mtype: Optional[type], type_id: int, registries: Registries) -> _Functions:
+    key = (mtype, type_id, registries)
+    resolved = _RESOLVED_FUNCTIONS.get(key)
+    if resolved is not None and resolved[0] == decorators._registration_count:
+        return resolved[1]
+
+    registration_count = decorators._registration_count
+    functions = (
+        get_aggregator(mtype=mtype, type_id=type_id, registry=registries.aggregatorRegistry),
+        get_serializer(mtype=mtype, type_id=type_id, registry=registries.serializerRegistry),
+        get_deserializer(mtype=mtype, type_id=type_id, registry=registries.deserializerRegistry),
+    )
+    _, serializer, deserializer = functions
+    if serializer is None and deserializer is not None:
+        raise ValueError("Serializer and deserializer must be defined in pairs, but serializer is None")
+    if serializer is not None and deserializer is None:
+        raise ValueError("Serializer and deserializer must be defined in pairs, but deserializer is None")
+    _RESOLVED_FUNCTIONS[key] = (registration_count, functions)
+    return functions
+
+
+def _deserialized_component_class(
+    field: Optional[str], type_id: int, registries: Optional[Registries]
+) -> Type["MetricComponent"]:
+    key = (field, type_id, registries)
+    component_class = _DESERIALIZED_COMPONENT_CLASSES.get(key)
+    if component_class is not None:
+        return component_class
+
+    if type_id in _LAZY_COMPONENT_MODULES:
+        importlib.import_module(_LAZY_COMPONENT_MODULES[type_id])
+
+    _mtype = _ONEOF_MTYPES.get(field)
+    _type_id = type_id
+    _registries = registries
+
+    class DeserializedComponent(MetricComponent[Any]):
+        mtype = _mtype
+        type_id = _type_id
+        registries = _registries
+
+        def __deepcopy__(self, memo) -> "DeserializedComponent":
+            return DeserializedComponent.from_protobuf(self.to_protobuf(), self.registries)
+
+    _DESERIALIZED_COMPONENT_CLASSES[key] = DeserializedComponent
+    return DeserializedComponent
+
+
 class MetricComponent(Generic[T]):
     """
     A metric component is the smallest unit for a metric.
@@ -41,26 +126,12 @@ class MetricComponent(Generic[T]):
 
         registries = self.registries
         if registries is None:
-            registries = Registries()
+            registries = _DEFAULT_REGISTRIES
 
         self._registries = registries
-        optional_mtype = None
-        if hasattr(self, "mtype"):
-            optional_mtype = self.mtype
-        self._aggregator = get_aggregator(
-            mtype=optional_mtype, type_id=self.type_id, registry=registries.aggregatorRegistry
-        )
-        self._serializer = get_serializer(
-            mtype=optional_mtype, type_id=self.type_id, registry=registries.serializerRegistry
+        self._aggregator, self._serializer, self._deserializer = _resolve_functions(
+            getattr(self, "mtype", None), self.type_id, registries
         )
-        self._deserializer = get_deserializer(
-            mtype=optional_mtype, type_id=self.type_id, registry=registries.deserializerRegistry
-        )
-
-        if self._serializer is None and self._deserializer is not None:
-            raise ValueError("Serializer and deserializer must be defined in pairs, but serializer is None")
-        if self._serializer is not None and self._deserializer is None:
-            raise ValueError("Serializer and deserializer must be defined in pairs, but deserializer is None")
 
     @property
     def value(self) -> T:
@@ -77,6 +148,26 @@ class MetricComponent(Generic[T]):
             )
         return self.__class__(self._aggregator(self.value, other.value))
 
+    def __iadd__(self: M, other: M) -> M:
+        return other.merge_into(self)
+
+    def merge_into(self: M, target: M) -> M:
+        """
+        Merge this component into target without allocating a new component and return target.
+        Sketches that support it (KLL, frequent strings) are merged in place instead of being copied.
+        """
+        if self._aggregator is None:
+            raise ValueError(
+                f"Attempting to aggregate metric component without an aggregator. Type: {self.mtype} with ID: "
+                f"{self.type_id}"
+            )
+        in_place_aggregator = get_in_place_aggregator(self._aggregator)
+        if in_place_aggregator is not None:
+            in_place_aggregator(target.value, self.value)
+        else:
+            target.set(self._aggregator(target.value, self.value))
+        return target
+
     def to_protobuf(self) -> MetricComponentMessage:
         if self._serializer is None:
             raise ValueError(
@@ -89,37 +180,17 @@ class MetricComponent(Generic[T]):
 
     @classmethod
     def from_protobuf(cls: Type["M"], msg: MetricComponentMessage, registries: Optional[Registries] = None) -> "M":
-        # TODO: need to deserialize this against a registry
         field = msg.WhichOneof("value")
-        _mtype: Optional[type] = None
-        if field == "n":
-            _mtype = int
-        elif field == "d":
-            _mtype = float
-        elif field == "frequent_items":
-            _mtype = ds.frequent_strings_sketch
-        elif field == "hll":
-            _mtype = ds.hll_sketch
-        elif field == "kll":
-            _mtype = ds.kll_doubles_sketch
-        _type_id = msg.type_id
-
-        _registries = registries
-
-        class DeserializedComponent(MetricComponent[M]):
-            mtype = _mtype
-            type_id = msg.type_id
-            registries = _registries
-
-            def __deepcopy__(self, memo) -> "DeserializedComponent":
-                return DeserializedComponent.from_protobuf(self.to_protobuf())
-
-        component = DeserializedComponent(value=None)  # type: ignore
+        # the component classes are shared by all the components with the same field and type ID
+        component_class = _deserialized_component_class(field, msg.type_id, registries)
+        component = component_class(value=None)  # type: ignore
         if component._deserializer is not None:
             component._value = component._deserializer(msg=msg)
             return component  # type: ignore
         else:
-            raise ValueError(f"Attempt to deserialize a type without a deserializer. Type: {_mtype}. ID: {_type_id}")
+            raise ValueError(
+                f"Attempt to deserialize a type without a deserializer. Type: {component.mtype}. ID: {msg.type_id}"
+            )
 
 
 class IntegralComponent(MetricComponent[int]):
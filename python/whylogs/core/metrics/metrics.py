@@ -1,4 +1,5 @@
 import dataclasses
+import importlib
 import math
 import statistics
 import sys
@@ -26,7 +27,7 @@ from whylogs.core.metrics.metric_components import (
 )
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricComponentMessage, MetricMessage
-from whylogs.core.stubs import pd as pd
+from whylogs.core.stubs import np, pd
 
 T = TypeVar("T")
 M = TypeVar("M", bound=MetricComponent)
@@ -62,6 +63,25 @@ class MetricConfig:
 
 _METRIC_DESERIALIZER_REGISTRY: Dict[str, Type[METRIC]] = {}  # type: ignore
 
+# modules registering metrics that need optional dependencies (sklearn, PIL), they are only imported
+# the first time a profile with one of their namespaces is deserialized
+_LAZY_METRIC_MODULES: Dict[str, str] = {
+    "embedding": "whylogs.experimental.extras.embedding_metric",
+    "image": "whylogs.extras.image_metric",
+}
+
+
+def _get_registered_metric(namespace: str) -> Optional[Type[METRIC]]:  # type: ignore
+    """
+    Returns the metric class registered for the namespace, or None if there is none. Importing the module of a lazily
+    registered metric registers it.
+    """
+    metric_class = _METRIC_DESERIALIZER_REGISTRY.get(namespace)
+    if metric_class is None and namespace in _LAZY_METRIC_MODULES:
+        importlib.import_module(_LAZY_METRIC_MODULES[namespace])
+        metric_class = _METRIC_DESERIALIZER_REGISTRY.get(namespace)
+    return metric_class
+
 
 def custom_metric(metric: Type[METRIC]) -> Type[METRIC]:  # type: ignore
     global _METRIC_DESERIALIZER_REGISTRY
@@ -111,6 +131,30 @@ class Metric(ABC):
 
         return self.__class__(**res)
 
+    def __iadd__(self: METRIC, other: METRIC) -> METRIC:
+        return other.merge_into(self)
+
+    def merge_into(self: METRIC, target: METRIC) -> METRIC:
+        """
+        Merge this metric into target, updating target's components in place, and return target.
+
+        Metrics that only hold components are merged component by component. Metrics overriding merge()
+        fall back to it and target takes over the merged state.
+        """
+        if type(self).merge is not Metric.merge:
+            return self._merge_into_copy(target)
+
+        for k, v in self.__dict__.items():
+            if isinstance(v, MetricComponent):
+                v.merge_into(target.__dict__[k])
+        return target
+
+    def _merge_into_copy(self: METRIC, target: METRIC) -> METRIC:
+        """Merge with merge() and have target take over the state of the merged metric."""
+        merged = target.merge(self)
+        target.__dict__.update(merged.__dict__)
+        return target
+
     def to_protobuf(self) -> MetricMessage:
         if not dataclasses.is_dataclass(self):
             raise ValueError("Metric object is not a dataclass")
@@ -270,9 +314,12 @@ class DistributionMetric(Metric):
                     self.kll.value.update(arr)
                     n_b = len(arr)
                     if n_b > 1:
-                        n_b = len(arr)
-                        mean_b = arr.mean()
-                        m2_b = arr.var() * (n_b - 1)
+                        # the reductions of Series have a high fixed cost, reduce the values with numpy. Series
+                        # keep the sample variance Series.var() computes, ndarrays the population variance
+                        ddof = 1 if isinstance(arr, pd.Series) else 0
+                        values = arr.to_numpy() if isinstance(arr, pd.Series) else arr
+                        mean_b = values.mean()
+                        m2_b = values.var(ddof=ddof) * (n_b - 1)
 
                         second = VarianceM2Result(n=n_b, mean=mean_b, m2=m2_b)
                         first = parallel_variance_m2(first=first, second=second)
@@ -322,6 +369,24 @@ class DistributionMetric(Metric):
 
         return DistributionMetric(kll=kll, mean=FractionalComponent(mean), m2=FractionalComponent(m2))
 
+    def merge_into(self, target: "DistributionMetric") -> "DistributionMetric":
+        a_n = target.kll.value.get_n()
+        b_n = self.kll.value.get_n()
+
+        delta = self.avg - target.avg
+        new_n = a_n + b_n
+        if a_n != 0 or b_n != 0:
+            m2 = target.m2.value + self.m2.value + delta**2 * a_n * b_n / new_n
+            mean = (a_n / new_n) * (target.avg) + (b_n / new_n) * (self.avg)
+        else:
+            m2 = 0
+            mean = 0
+
+        self.kll.merge_into(target.kll)
+        target.mean.set(mean)
+        target.m2.set(m2)
+        return target
+
     @property
     def n(self) -> float:
         return self.kll.value.get_n()
@@ -436,6 +501,19 @@ class DistributionMetric(Metric):
 register_metric(DistributionMetric)
 
 
+def _distinct_value_counts(strings: pd.Series) -> Optional[Tuple[List[Any], np.ndarray]]:
+    """
+    Returns the distinct values and their counts for a categorical (e.g. dictionary encoded Arrow) Series
+    without materializing every value, or None if the Series isn't categorical.
+    """
+    if not isinstance(strings.dtype, pd.CategoricalDtype):
+        return None
+    codes = strings.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(strings.cat.categories))
+    present = np.flatnonzero(counts)
+    return strings.cat.categories[present].tolist(), counts[present]
+
+
 @dataclass(frozen=True)
 class FrequentItem:
     value: str
@@ -462,8 +540,13 @@ class FrequentItemsMetric(Metric):
                 self.frequent_strings.value.update_np(arr)
                 successes += len(arr)
         if view.pandas.strings is not None:
-            strings = [s[0 : self.max_frequent_item_size] for s in view.pandas.strings.to_list()]
-            self.frequent_strings.value.update_str_list(strings)
+            value_counts = _distinct_value_counts(view.pandas.strings)
+            if value_counts is not None:
+                for value, count in zip(*value_counts):
+                    self.frequent_strings.value.update(value[0 : self.max_frequent_item_size], int(count))
+            else:
+                strings = [s[0 : self.max_frequent_item_size] for s in view.pandas.strings.to_list()]
+                self.frequent_strings.value.update_str_list(strings)
             successes += len(view.pandas.strings)
 
         if view.list.ints is not None:
@@ -536,7 +619,11 @@ class CardinalityMetric(Metric):
                 self.hll.value.update_np(view.numpy.floats)
                 successes += len(view.numpy.floats)
         if view.pandas.strings is not None:
-            self.hll.value.update_str_list(view.pandas.strings.to_list())
+            value_counts = _distinct_value_counts(view.pandas.strings)
+            if value_counts is not None:
+                self.hll.value.update_str_list(value_counts[0])
+            else:
+                self.hll.value.update_str_list(view.pandas.strings.to_list())
             successes += len(view.pandas.strings)
 
         # update everything in the remaining lists
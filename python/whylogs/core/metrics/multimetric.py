@@ -7,7 +7,7 @@ from whylogs.core.configs import SummaryConfig
 from whylogs.core.errors import DeserializationError, UnsupportedError
 from whylogs.core.metrics import Metric
 from whylogs.core.metrics.metric_components import MetricComponent
-from whylogs.core.metrics.metrics import _METRIC_DESERIALIZER_REGISTRY, OperationResult
+from whylogs.core.metrics.metrics import OperationResult, _get_registered_metric
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricComponentMessage, MetricMessage
 
@@ -98,6 +98,24 @@ class MultiMetric(Metric, ABC):
     def merge(self: MULTI_METRIC, other: MULTI_METRIC) -> MULTI_METRIC:
         return self.__class__(self.merge_submetrics(other))
 
+    def merge_into(self: MULTI_METRIC, target: MULTI_METRIC) -> MULTI_METRIC:
+        if type(self).merge is not MultiMetric.merge:
+            return self._merge_into_copy(target)
+        return self._merge_submetrics_into(target)
+
+    def _merge_submetrics_into(self: MULTI_METRIC, target: MULTI_METRIC) -> MULTI_METRIC:
+        if self.namespace != target.namespace:
+            raise ValueError(f"Attempt to merge MultiMetrics {self.namespace} and {target.namespace}")
+
+        for submetric_name, metrics in self.submetrics.items():
+            target_metrics = target.submetrics.setdefault(submetric_name, {})
+            for namespace, metric in metrics.items():
+                if namespace in target_metrics:
+                    metric.merge_into(target_metrics[namespace])
+                else:
+                    target_metrics[namespace] = deepcopy(metric)
+        return target
+
     def to_protobuf(self) -> MetricMessage:
         msg = {}
         for sub_name, metrics in self.submetrics.items():
@@ -156,9 +174,8 @@ class MultiMetric(Metric, ABC):
 
         for sub_name, metric_msgs in submetric_msgs.items():
             for namespace, metric_components in metric_msgs.items():
-                if namespace in _METRIC_DESERIALIZER_REGISTRY:
-                    metric_class = _METRIC_DESERIALIZER_REGISTRY[namespace]
-                else:
+                metric_class = _get_registered_metric(namespace)
+                if metric_class is None:
                     raise UnsupportedError(f"Unsupported metric: {namespace}")
 
                 metric_msg = MetricMessage(metric_components=metric_components)
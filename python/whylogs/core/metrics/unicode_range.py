@@ -14,9 +14,21 @@ from whylogs.core.metrics.metrics import (
 from whylogs.core.metrics.multimetric import MultiMetric
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricMessage
+from whylogs.core.stubs import is_not_stub, np, pd
 
 _STRING_LENGTH = "string_length"
 
+# upper bound on the number of code points decoded at once, the strings are processed in batches below it
+_BATCH_CODE_POINTS = 1 << 22
+
+
+def _int_column(values: "np.ndarray") -> PreprocessedColumn:
+    # DistributionMetric computes the variance of pandas and numpy input differently, the counts are wrapped
+    # in a Series without copying so the submetrics match what logging the counts as a list produced
+    if is_not_stub(pd.Series):
+        return PreprocessedColumn.apply(pd.Series(values, copy=False))
+    return PreprocessedColumn.apply(values)
+
 
 @dataclass
 class UnicodeRangeMetric(MultiMetric):
@@ -74,7 +86,77 @@ class UnicodeRangeMetric(MultiMetric):
         result.submetrics = submetrics
         return result
 
+    def merge_into(self, target: "UnicodeRangeMetric") -> "UnicodeRangeMetric":
+        # merge() only rebuilds the range definitions, target already has its own
+        return self._merge_submetrics_into(target)
+
+    def _range_bins(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Split the code points into bins at every range boundary, so each bin is either inside or outside
+        of any range. Returns the bin boundaries and a matrix of bins by ranges with a 1 where the bin
+        is inside the range. Code points outside of every range count as UNKNOWN.
+        """
+        ranges = list(self.range_definitions.values())
+        boundaries = np.unique([bound for lower, upper in ranges for bound in (lower, upper + 1)])
+        # bin i holds the code points in [boundaries[i - 1], boundaries[i])
+        bin_starts = np.concatenate(([-1], boundaries))
+        bin_ends = np.concatenate((boundaries, [0x110000 + 1]))
+        membership = np.array(
+            [(lower <= bin_starts) & (bin_ends <= upper + 1) for lower, upper in ranges], dtype=np.int64
+        ).T
+        unknown = list(self.range_definitions.keys()).index("UNKNOWN")
+        membership[membership.sum(axis=1) == 0, unknown] = 1
+        return boundaries, membership
+
+    def _range_counts(self, data: List[str]) -> "np.ndarray":
+        """Returns the number of characters of each string in each range, as a ranges by strings matrix."""
+        if self.normalize:
+            data = [unicodedata.normalize("NFD", value) for value in data]
+        if self.lower_case:
+            data = [value.lower() for value in data]
+        lengths = np.fromiter(map(len, data), dtype=np.int64, count=len(data))
+        boundaries, membership = self._range_bins()
+        num_bins = len(boundaries) + 1
+        counts = np.empty((membership.shape[1], len(data)), dtype=np.int64)
+
+        ends = np.cumsum(lengths)
+        start = 0
+        while start < len(data):
+            offset = ends[start - 1] if start > 0 else 0
+            end = max(int(np.searchsorted(ends, offset + _BATCH_CODE_POINTS, side="right")), start + 1)
+            code_points = np.frombuffer("".join(data[start:end]).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+            owners = np.repeat(np.arange(end - start, dtype=np.int64), lengths[start:end])
+            bins = np.searchsorted(boundaries, code_points, side="right")
+            per_bin = np.bincount(owners * num_bins + bins, minlength=(end - start) * num_bins)
+            counts[:, start:end] = (per_bin.reshape(end - start, num_bins) @ membership).T
+            start = end
+        return counts
+
     def columnar_update(self, view: PreprocessedColumn) -> OperationResult:
+        if not is_not_stub(np.ndarray):
+            return self._columnar_update_python(view)
+
+        data = (
+            view.pandas.strings.to_list() if view.pandas.strings is not None and not view.pandas.strings.empty else []
+        )
+        data = (data + view.list.strings) if view.list.strings else data
+        if not data:
+            return OperationResult.ok(0)
+
+        lengths = np.fromiter(map(len, data), dtype=np.int64, count=len(data))
+        submetric_col = _int_column(lengths)
+        for metric in self.submetrics[_STRING_LENGTH].values():
+            metric.columnar_update(submetric_col)
+
+        counts = self._range_counts(data)
+        for range_name, range_counts in zip(self.range_definitions.keys(), counts):
+            submetric_col = _int_column(range_counts)
+            for metric in self.submetrics[range_name].values():
+                metric.columnar_update(submetric_col)
+
+        return OperationResult.ok(len(data))
+
+    def _columnar_update_python(self, view: PreprocessedColumn) -> OperationResult:
         data = (
             view.pandas.strings.to_list() if view.pandas.strings is not None and not view.pandas.strings.empty else []
         )
@@ -84,7 +166,6 @@ class UnicodeRangeMetric(MultiMetric):
         for value in data:
             lengths.append(len(value))
             range_counter: Dict[str, int] = {range_name: 0 for range_name in self.range_definitions.keys()}
-            # TODO: need to transform to utf-32 or handle surrogates
             s = unicodedata.normalize("NFD", value) if self.normalize else value
             s = s.lower() if self.lower_case else s
             for char in s:
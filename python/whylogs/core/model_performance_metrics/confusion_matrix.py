@@ -1,8 +1,10 @@
+from itertools import repeat
 from logging import getLogger
 from typing import Dict, List, Optional, Tuple, Union
 
 import whylogs_sketching as ds  # type: ignore
 
+from whylogs.core.metrics.maths import VarianceM2Result, parallel_variance_m2
 from whylogs.core.metrics.metric_components import FractionalComponent, KllComponent
 from whylogs.core.metrics.metrics import DistributionMetric, MetricConfig
 from whylogs.core.preprocessing import PreprocessedColumn
@@ -12,6 +14,7 @@ from whylogs.core.proto.v0 import (
     ScoreMatrixMessage,
     VarianceMessage,
 )
+from whylogs.core.stubs import is_not_stub, np
 
 MODEL_METRICS_MAX_LABELS = 256
 MODEL_METRICS_LABEL_SIZE_WARNING_THRESHOLD = 64
@@ -31,6 +34,29 @@ def _encode_to_integers(values, uniques):
     return [table[v] for v in values]
 
 
+def _encode_to_array(values, uniques) -> "np.ndarray":
+    """
+    Encode values as their index in the sorted uniques. Numbers and strings are looked up with a binary search,
+    anything else, or values that aren't found, go through _encode_to_integers.
+    """
+    value_array = np.asarray(values)
+    unique_array = np.asarray(uniques)
+    numeric = value_array.dtype.kind in "biuf" and unique_array.dtype.kind in "biuf"
+    # numpy turns a list mixing strings and numbers into strings, only take lists of actual strings
+    strings = (
+        value_array.dtype.kind == "U"
+        and unique_array.dtype.kind == "U"
+        and all(map(isinstance, values, repeat(str)))
+        and all(map(isinstance, uniques, repeat(str)))
+    )
+    if (numeric or strings) and value_array.ndim == 1 and len(unique_array) > 0:
+        indices = np.searchsorted(unique_array, value_array)
+        found = unique_array[np.minimum(indices, len(unique_array) - 1)] == value_array
+        if found.all():
+            return indices
+    return np.asarray(_encode_to_integers(values, uniques), dtype=np.int64)
+
+
 class ConfusionMatrix:
     """
 
@@ -92,12 +118,45 @@ class ConfusionMatrix:
         if not isinstance(predictions, list):
             predictions = [predictions]
 
-        if scores is None:
-            scores = [1.0 for _ in range(len(targets))]
-
         if len(targets) != len(predictions):
             raise ValueError("both targets and predictions need to have the same length")
 
+        if not is_not_stub(np.ndarray):
+            self._add_batches(predictions, targets, scores or [1.0 for _ in range(len(targets))])
+            return
+
+        size = len(self.labels)
+        cells = _encode_to_array(predictions, self.labels) * size + _encode_to_array(targets, self.labels)
+        score_array = np.ones(len(cells)) if scores is None else np.asarray(scores, dtype=float)
+
+        # sort the scores by cell, then each cell's scores are a contiguous slice
+        order = np.argsort(cells, kind="stable")
+        cells = cells[order]
+        score_array = score_array[order]
+        starts = np.flatnonzero(np.diff(cells, prepend=-1))
+        ends = np.append(starts[1:], len(cells))
+
+        # the moments of all cells at once, so the per cell work is just the sketch update
+        counts = (ends - starts).astype(float)
+        means = np.add.reduceat(score_array, starts) / counts
+        m2s = np.add.reduceat((score_array - np.repeat(means, ends - starts)) ** 2, starts)
+        for start, end, mean, m2 in zip(starts.tolist(), ends.tolist(), means.tolist(), m2s.tolist()):
+            entry_key = divmod(int(cells[start]), size)
+            if entry_key not in self.confusion_matrix:
+                self.confusion_matrix[entry_key] = DistributionMetric.zero(self.default_config)
+            dist = self.confusion_matrix[entry_key]
+            first = VarianceM2Result(n=dist.kll.value.get_n(), mean=dist.mean.value, m2=dist.m2.value)
+            moments = parallel_variance_m2(first=first, second=VarianceM2Result(n=end - start, mean=mean, m2=m2))
+            dist.kll.value.update(score_array[start:end])
+            dist.mean.set(moments.mean)
+            dist.m2.set(moments.m2)
+
+    def _add_batches(
+        self,
+        predictions: List[Union[str, int, bool, float]],
+        targets: List[Union[str, int, bool, float]],
+        scores: List[float],
+    ) -> None:
         targets_indx = _encode_to_integers(targets, self.labels)
         prediction_indx = _encode_to_integers(predictions, self.labels)
 
@@ -90,7 +90,7 @@ class ModelPerformanceMetrics:
             targets (List[Union[str, int, bool]]):
             scores (List[float], optional):
         """
-        labels = sorted(list(set(targets + predictions)))
+        labels = sorted(set(targets).union(predictions))
         confusion_matrix = ConfusionMatrix(labels=labels)
         confusion_matrix.add(predictions, targets, scores)
 
@@ -2,6 +2,7 @@ import math
 from typing import List
 
 from whylogs.core.proto.v0 import RegressionMetricsMessage
+from whylogs.core.stubs import is_not_stub, np
 
 
 class RegressionMetrics:
@@ -20,14 +21,22 @@ class RegressionMetrics:
             targets (List[float]):
         """
 
-        # need to vectorize this
-        for idx, target in enumerate(targets):
-            self.sum_abs_diff += abs(predictions[idx] - target)
-            self.sum_diff += predictions[idx] - target
-            self.sum2_diff += (predictions[idx] - target) ** 2
-            # To add later
-            # self.nt_diff.track(predictions[idx] - target)
-            self.count += 1
+        if not is_not_stub(np.ndarray):
+            for idx, target in enumerate(targets):
+                self.sum_abs_diff += abs(predictions[idx] - target)
+                self.sum_diff += predictions[idx] - target
+                self.sum2_diff += (predictions[idx] - target) ** 2
+                self.count += 1
+            return
+
+        target_array = np.asarray(targets, dtype=float)
+        diff = np.asarray(predictions, dtype=float)[: len(target_array)] - target_array
+        # To add later
+        # self.nt_diff.track(diff)
+        self.sum_abs_diff += float(np.abs(diff).sum())
+        self.sum_diff += float(diff.sum())
+        self.sum2_diff += float(np.square(diff).sum())
+        self.count += len(diff)
 
     def mean_absolute_error(self):
         if self.count == 0:
@@ -5,6 +5,7 @@ from decimal import Decimal
 from math import isinf, isnan
 from typing import Any, Iterable, Iterator, List, Optional, Union
 
+from whylogs.core.input_resolver import _is_arrow_array
 from whylogs.core.stubs import is_not_stub, np, pd
 
 logger = logging.getLogger("whylogs.core.views")
@@ -15,6 +16,53 @@ except:  # noqa
     pass
 
 
+# Type codes assigned to each value of an object Series by PreprocessedColumn._classify()
+_INT = 0
+_FLOAT = 1
+_STR = 2
+_BOOL = 3
+_TENSOR = 4
+_OBJ = 5
+
+# pd.api.types.infer_dtype() results that map every value of a Series to a single type code
+_INFERRED_TYPE_CODES = {
+    "integer": _INT,
+    "floating": _FLOAT,
+    "decimal": _FLOAT,
+    "string": _STR,
+    "boolean": _BOOL,
+    "bytes": _OBJ,
+    "datetime64": _OBJ,
+    "datetime": _OBJ,
+    "date": _OBJ,
+    "timedelta64": _OBJ,
+    "timedelta": _OBJ,
+    "time": _OBJ,
+    "period": _OBJ,
+    "interval": _OBJ,
+}
+
+
+def _type_code(value_type: type) -> int:
+    if issubclass(value_type, (bool, np.bool_)):
+        return _BOOL
+    if issubclass(value_type, (float, np.floating, Decimal)):
+        return _FLOAT
+    if issubclass(value_type, (int, np.integer)) and not issubclass(value_type, np.timedelta64):
+        return _INT
+    if issubclass(value_type, str):
+        return _STR
+    if issubclass(value_type, (list, np.ndarray)):
+        return _TENSOR  # candidate only, each value still has to pass _is_tensorable()
+    return _OBJ
+
+
+def _is_arrow_string(arrow_type: Any) -> bool:
+    import pyarrow as pa
+
+    return pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)
+
+
 @dataclass
 class ListView:
     ints: Optional[List[int]] = None
@@ -77,6 +125,7 @@ class PreprocessedColumn:
 
     If Pandas is available, we will use Pandas to handle batch processing.
     If numpy is available, we will use ndarray for numerical values.
+    Apache Arrow arrays are split into the numpy and Pandas views, reusing the Arrow buffers where possible.
     Otherwise, we preprocess values into typed lists for downstream consumers.
     We also track the null count and ensure that processed lists/Series don't contain null values.
     """
@@ -84,7 +133,6 @@ class PreprocessedColumn:
     numpy: NumpyView
     pandas: PandasView
     list: ListView
-    # TODO: other data sources such as Apache Arrow here
 
     null_count: int = 0
     len: int = 0
@@ -117,19 +165,21 @@ class PreprocessedColumn:
         if pd.Series is None:
             return None
 
-        null_series = series[series.isnull()]
-        non_null_series = series[series.notnull()]
+        null_mask = series.isnull()
+        null_series = series[null_mask]
+        non_null_series = series[~null_mask]
 
         self.null_count = len(null_series)
         if pdc.is_numeric_dtype(series.dtype) and not pdc.is_bool_dtype(series.dtype):
-            if series.hasnans:
-                nan_mask = null_series.apply(lambda x: pdc.is_number(x))
-                self.nan_count = len(null_series[nan_mask])
+            if self.null_count > 0:
+                if pdc.is_float_dtype(series.dtype):
+                    self.nan_count = self.null_count
+                else:
+                    self.nan_count = sum(map(pdc.is_number, null_series.to_numpy()))
 
             if pdc.is_float_dtype(series.dtype):
                 floats = non_null_series.astype(float)
-                inf_mask = floats.apply(lambda x: np.isinf(x))
-                self.inf_count = len(floats[inf_mask])
+                self.inf_count = int(np.isinf(floats.to_numpy()).sum())
                 self.numpy.floats = floats
                 return
             else:
@@ -137,11 +187,8 @@ class PreprocessedColumn:
                 self.numpy.ints = ints
                 return
 
-        if series.hasnans:
-            na_number_mask = null_series.apply(lambda x: pdc.is_number(x))
-            if not null_series[na_number_mask].empty:
-                nan_floats = null_series[na_number_mask].astype(float)
-                self.nan_count = nan_floats.isna().sum()
+        if self.null_count > 0:
+            self.nan_count = sum(map(pdc.is_number, null_series.to_numpy()))
 
         # if non_null_series is empty, then early exit.
         # this fixes a bug where empty columns produce masks of types other than bool
@@ -158,30 +205,27 @@ class PreprocessedColumn:
 
         # TODO: Do we want to parse numeric strings inside of tensors?
 
-        float_mask = non_null_series.apply(lambda x: pdc.is_float(x) or pdc.is_decimal(x))
-        bool_mask = non_null_series.apply(lambda x: pdc.is_bool(x))
-        bool_mask_where_true = non_null_series.apply(lambda x: pdc.is_bool(x) and x)
-        int_mask = non_null_series.apply(lambda x: pdc.is_number(x) and pdc.is_integer(x) and not pdc.is_bool(x))
-        str_mask = non_null_series.apply(lambda x: isinstance(x, str))
-        tensor_mask = non_null_series.apply(
-            lambda x: isinstance(x, (list, np.ndarray)) and PreprocessedColumn._is_tensorable(x)
-        )
+        values = non_null_series.to_numpy()
+        codes = PreprocessedColumn._classify(values)
+        float_mask = codes == _FLOAT
+        int_mask = codes == _INT
+        bool_mask = codes == _BOOL
+        tensor_mask = codes == _TENSOR
 
         floats = non_null_series[float_mask]
         ints = non_null_series[int_mask].astype(int)
-        bool_count = non_null_series[bool_mask].count()
-        bool_count_where_true = non_null_series[bool_mask_where_true].count()
-        strings = non_null_series[str_mask]
+        bool_count = int(bool_mask.sum())
+        bool_count_where_true = int(np.count_nonzero(values[bool_mask].astype(bool))) if bool_count else 0
+        strings = non_null_series[codes == _STR]
         tensors = non_null_series[tensor_mask]
         tensors = pd.Series([x if isinstance(x, np.ndarray) else np.asarray(x) for x in tensors], dtype="object")
-        objs = non_null_series[~(float_mask | str_mask | int_mask | bool_mask | tensor_mask)]
+        objs = non_null_series[codes == _OBJ]
 
         # convert numeric types to float if they are considered
         # Fractional types e.g. decimal.Decimal only if there are values
         if not floats.empty:
             floats = floats.astype(float)
-            inf_mask = floats.apply(lambda x: np.isinf(x))
-            self.inf_count = len(floats[inf_mask])
+            self.inf_count = int(np.isinf(floats.to_numpy()).sum())
 
         self.numpy = NumpyView(floats=floats, ints=ints)
         self.pandas.strings = strings
@@ -190,6 +234,125 @@ class PreprocessedColumn:
         self.bool_count = bool_count
         self.bool_count_where_true = bool_count_where_true
 
+    def _arrow_split(self, array: Any) -> None:
+        """
+        Split an Apache Arrow Array or ChunkedArray into numpy arrays and Pandas series.
+
+        Numbers are exposed as numpy arrays over the Arrow buffers, copying only if nulls or NaNs have to be dropped.
+        Dictionary encoded strings become a categorical Pandas Series, so each distinct string is converted once.
+        Other Arrow types are converted to Pandas and split by _pandas_split().
+
+        Args:
+            array: a pyarrow.Array or pyarrow.ChunkedArray. Multiple chunks are combined into a single Array.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if isinstance(array, pa.ChunkedArray):
+            array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+
+        arrow_type = array.type
+        if pa.types.is_dictionary(arrow_type) and not _is_arrow_string(arrow_type.value_type):
+            array = array.cast(arrow_type.value_type)
+            arrow_type = array.type
+
+        is_number = pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+        is_string = _is_arrow_string(arrow_type) or pa.types.is_dictionary(arrow_type)
+        if not (is_number or is_string or pa.types.is_boolean(arrow_type)):
+            self._pandas_split(array.to_pandas())
+            return
+
+        self.null_count = array.null_count
+        if self.null_count > 0:
+            array = pc.drop_null(array)
+
+        if pa.types.is_floating(arrow_type):
+            # like Pandas, we consider NaN as a null value
+            floats = array.to_numpy()
+            nan_mask = np.isnan(floats)
+            nans = int(nan_mask.sum())
+            if nans > 0:
+                floats = floats[~nan_mask]
+            self.null_count += nans
+            self.nan_count = self.null_count
+            self.inf_count = int(np.isinf(floats).sum())
+            self.numpy.floats = floats.astype(float, copy=False)
+        elif pa.types.is_integer(arrow_type):
+            self.numpy.ints = array.to_numpy().astype(int, copy=False)
+        elif pa.types.is_boolean(arrow_type):
+            self.bool_count = len(array)
+            self.bool_count_where_true = pc.sum(array).as_py() or 0
+        else:
+            self.pandas.strings = array.to_pandas()
+
+    def _list_split(self, data: List[Any]) -> None:
+        """Split a list into typed lists, or numpy arrays for numbers if numpy is available, without using Pandas."""
+        int_list = []
+        float_list: List[Union[float, Decimal]] = []
+        string_list = []
+        tensor_list = []
+        obj_list = []
+        null_count = 0
+        for x in data:
+            if isinstance(x, (bool, np.bool_)):
+                self.bool_count += 1
+                if x:
+                    self.bool_count_where_true += 1
+            elif isinstance(x, int):
+                int_list.append(x)
+            elif isinstance(x, (float, Decimal)):
+                if isnan(x):
+                    self.nan_count += 1
+                    null_count += 1
+                    continue
+                if isinf(x):
+                    self.inf_count += 1
+                float_list.append(x)
+            elif isinstance(x, str):
+                string_list.append(x)
+            elif isinstance(x, list) and PreprocessedColumn._is_tensorable(x):
+                tensor_list.append(np.asarray(x))
+            elif isinstance(x, np.ndarray) and PreprocessedColumn._is_tensorable(x):
+                tensor_list.append(x)
+            elif x is not None:
+                obj_list.append(x)
+            else:
+                null_count += 1
+
+        self.null_count = null_count
+        if is_not_stub(np.ndarray):
+            ints = np.asarray(int_list, dtype=int)
+            floats = np.asarray(float_list, dtype=float)
+
+            self.numpy = NumpyView(ints=ints, floats=floats)
+            self.list = ListView(strings=string_list, tensors=tensor_list, objs=obj_list)
+        else:
+            self.list = ListView(
+                ints=int_list, floats=float_list, strings=string_list, tensors=tensor_list, objs=obj_list
+            )
+
+    @staticmethod
+    def _classify(values: np.ndarray) -> np.ndarray:
+        """
+        Assign a type code (int, float, string, bool, tensor or object) to each non-null value in a single pass.
+
+        Homogeneous columns are detected with pd.api.types.infer_dtype() without touching the values in Python.
+        Mixed columns are classified by the type of each value, so the type checks run once per distinct type
+        rather than once per value. Only lists and ndarrays are inspected individually to decide if they're tensors.
+        """
+        code = _INFERRED_TYPE_CODES.get(pd.api.types.infer_dtype(values, skipna=True))
+        if code is not None:
+            return np.full(len(values), code, dtype=np.int8)
+
+        value_types = list(map(type, values))
+        type_codes = {value_type: _type_code(value_type) for value_type in set(value_types)}
+        codes = np.fromiter(map(type_codes.__getitem__, value_types), dtype=np.int8, count=len(value_types))
+        if _TENSOR in type_codes.values():
+            for i in np.flatnonzero(codes == _TENSOR):
+                if not PreprocessedColumn._is_tensorable(values[i]):
+                    codes[i] = _OBJ
+        return codes
+
     def raw_iterator(self) -> Iterator[Any]:
         iterables = [
             *self.numpy.iterables(),
@@ -259,6 +422,11 @@ class PreprocessedColumn:
             result.len = len(data)
             return result
 
+        if _is_arrow_array(data):
+            result._arrow_split(data)
+            result.len = len(data)
+            return result
+
         if isinstance(data, np.ndarray):
             result.len = len(data)
             if issubclass(data.dtype.type, (np.number, np.str_)):
@@ -277,41 +445,8 @@ class PreprocessedColumn:
             if is_not_stub(pd.Series):
                 return PreprocessedColumn.apply(pd.Series(data, dtype="object"))
 
-            int_list = []
-            float_list: List[Union[float, Decimal]] = []
-            string_list = []
-            tensor_list = []
-            obj_list = []
-            null_count = 0
-            for x in data:
-                if isinstance(x, int):
-                    int_list.append(x)
-                elif isinstance(x, float):
-                    float_list.append(x)
-                elif isinstance(x, str):
-                    string_list.append(x)
-                elif isinstance(x, list) and PreprocessedColumn._is_tensorable(x):
-                    tensor_list.append(np.asarray(x))
-                elif isinstance(x, np.ndarray) and PreprocessedColumn._is_tensorable(x):
-                    tensor_list.append(x)
-                elif x is not None:
-                    obj_list.append(x)
-                else:
-                    null_count += 1
-
-            result.null_count = null_count
-            if is_not_stub(np.ndarray):
-                ints = np.asarray(int_list, dtype=int)
-                floats = np.asarray(float_list, dtype=float)
-
-                result.numpy = NumpyView(ints=ints, floats=floats)
-                result.list = ListView(strings=string_list, tensors=tensor_list, objs=obj_list)
-                return result
-            else:
-                result.list = ListView(
-                    ints=int_list, floats=float_list, strings=string_list, tensors=tensor_list, objs=obj_list
-                )
-                return result
+            result._list_split(data)
+            return result
 
         if isinstance(data, Iterable) or isinstance(data, Iterator):
             logger.warning(
@@ -325,6 +460,88 @@ class PreprocessedColumn:
         list_format = [data]
         return PreprocessedColumn.apply(list_format)
 
+    def split_groups(
+        self, codes: np.ndarray, num_groups: int, order: Optional[np.ndarray] = None
+    ) -> Iterator["PreprocessedColumn"]:
+        """
+        Yield the PreprocessedColumn of each group of values, as PreprocessedColumn.apply() of the Series of the
+        group's values would. Used to track many segments of the same column without splitting each of them.
+
+        The column must come from PreprocessedColumn.apply() of a Series with a RangeIndex. The typed Series of
+        each group are taken from the typed Series of the whole column, the original values of the groups aren't
+        taken and PreprocessedColumn.original is left empty.
+
+        Args:
+            codes: the group of each value, from 0 to num_groups - 1. Values with a negative code are skipped.
+            num_groups: number of groups.
+            order: np.argsort(codes, kind="stable"), if already computed for another column.
+        """
+        codes = np.asarray(codes)
+        group_bounds = np.arange(num_groups + 1)
+        if order is None:
+            order = np.argsort(codes, kind="stable")
+
+        if self.bool_count > 0 or (self.pandas.tensors is not None and len(self.pandas.tensors) > 0):
+            # bools are only counted and tensors are rebuilt, neither keep their positions in the column
+            bounds = np.searchsorted(codes[order], group_bounds).tolist()
+            for group in range(num_groups):
+                yield PreprocessedColumn.apply(self.original.take(order[bounds[group] : bounds[group + 1]]))
+            return
+
+        def group_counts(positions: Any) -> List[int]:
+            position_codes = codes[np.asarray(positions, dtype=np.int64)]
+            return np.bincount(position_codes[position_codes >= 0], minlength=num_groups).tolist()
+
+        null_positions = np.flatnonzero(self.original.isnull().to_numpy()) if self.null_count > 0 else []
+        if self.nan_count == self.null_count:
+            nan_positions = null_positions
+        else:
+            nulls = self.original.to_numpy()[null_positions]
+            nan_positions = null_positions[np.fromiter(map(pdc.is_number, nulls), dtype=bool, count=len(nulls))]
+        null_counts = group_counts(null_positions)
+        nan_counts = group_counts(nan_positions)
+        value_counts = np.bincount(codes[codes >= 0], minlength=num_groups).tolist()
+        inf_counts = [0] * num_groups
+        if self.inf_count > 0:
+            floats = self.numpy.floats
+            inf_counts = group_counts(floats.index.to_numpy()[np.isinf(floats.to_numpy())])
+
+        # each typed Series sorted by group, with the bounds of every group in it
+        parts = {}
+        for name, part in [
+            ("ints", self.numpy.ints),
+            ("floats", self.numpy.floats),
+            ("strings", self.pandas.strings),
+            ("tensors", self.pandas.tensors),
+            ("objs", self.pandas.objs),
+        ]:
+            if part is None:
+                continue
+            positions = part.index.to_numpy()
+            if len(positions) == len(codes):
+                part_order = order
+            else:
+                # the values of the part in the order of the whole column sorted by group
+                part_indices = np.full(len(codes), -1, dtype=np.int64)
+                part_indices[positions] = np.arange(len(positions))
+                part_order = part_indices[order]
+                part_order = part_order[part_order >= 0]
+            part_codes = codes[positions[part_order]]
+            parts[name] = (part.take(part_order), np.searchsorted(part_codes, group_bounds).tolist())
+
+        for group in range(num_groups):
+            groups = {name: part.iloc[bounds[group] : bounds[group + 1]] for name, (part, bounds) in parts.items()}
+            result = PreprocessedColumn()
+            result.len = value_counts[group]
+            result.null_count = null_counts[group]
+            result.nan_count = nan_counts[group]
+            result.inf_count = inf_counts[group]
+            result.numpy = NumpyView(ints=groups.get("ints"), floats=groups.get("floats"))
+            result.pandas = PandasView(
+                strings=groups.get("strings"), tensors=groups.get("tensors"), objs=groups.get("objs")
+            )
+            yield result
+
     @staticmethod
     def _is_tensorable(value: Union[np.ndarray, List[Any]]) -> bool:
         if not is_not_stub(np.ndarray):
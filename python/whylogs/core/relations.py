@@ -1,10 +1,15 @@
+import logging
+import operator
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Tuple, Union
 
-from whylogs.core.configs import SummaryConfig
 from whylogs.core.metrics.metrics import Metric
+from whylogs.core.stubs import is_not_stub, np, pd
+from whylogs.core.summary_cache import metric_summary
+
+logger = logging.getLogger(__name__)
 
 
 class ValueGetter(ABC):
@@ -61,6 +66,33 @@ class Relation(Enum):
 
 _TOKEN = ["", "~", "~=", "==", "<", "<=", ">", ">=", "!=", "and", "or", "not", "udf"]
 
+_COMPARISONS = {
+    Relation.equal: operator.eq,
+    Relation.less: operator.lt,
+    Relation.leq: operator.le,
+    Relation.greater: operator.gt,
+    Relation.geq: operator.ge,
+    Relation.neq: operator.ne,
+}
+
+
+def evaluate_elementwise(predicate: Callable[[Any], Any], values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Calls the predicate on each element of a one dimensional array.
+
+    Returns a boolean mask of the elements satisfying the predicate and a boolean mask of the elements
+    for which the predicate raised an exception.
+    """
+    matches = np.zeros(len(values), dtype=bool)
+    errors = np.zeros(len(values), dtype=bool)
+    for i, x in enumerate(values.tolist()):
+        try:
+            matches[i] = bool(predicate(x))
+        except Exception as e:  # noqa
+            logger.debug(e)
+            errors[i] = True
+    return matches, errors
+
 
 class Predicate:
     def __init__(
@@ -98,7 +130,7 @@ class Predicate:
                 if not self._component:
                     raise ValueError("Metric constraints require a specified component")
 
-                summary = metric.to_summary_dict(SummaryConfig())
+                summary = metric_summary(metric)
                 if self._component not in summary:
                     raise ValueError(f"{self._component} is not available in {metric.namespace} metric")
                 x = summary[self._component]
@@ -137,6 +169,84 @@ class Predicate:
 
         raise ValueError("Unknown predicate")
 
+    def evaluate_array(self, values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Evaluates the predicate on each element of a one dimensional array.
+
+        Comparisons and regular expressions are applied to the whole array with numpy and pandas string
+        operations, boolean operators combine the masks of their operands. Anything that cannot be vectorized,
+        like user defined functions or arrays mixing types, is evaluated element by element. The result is
+        the same as calling the predicate on every element: a boolean mask of the elements satisfying the
+        predicate and a boolean mask of the elements for which it raised an exception.
+        """
+        op = self._op
+        if op in {Relation._and, Relation._or} and self._left is not None and self._right is not None:
+            left, left_errors = self._left.evaluate_array(values)
+            right, right_errors = self._right.evaluate_array(values)
+            # the right operand is only evaluated where the left one doesn't decide the result
+            if op == Relation._and:
+                errors = left_errors | (left & right_errors)
+                return left & right & ~errors, errors
+            errors = left_errors | (~left & right_errors)
+            return (left | right) & ~errors, errors
+        if op == Relation._not and self._right is not None:
+            matches, errors = self._right.evaluate_array(values)
+            return ~matches & ~errors, errors
+
+        matches = self._vectorized_relation(values)
+        if matches is None:
+            return evaluate_elementwise(self, values)
+        return matches, np.zeros(len(values), dtype=bool)
+
+    def _vectorized_relation(self, values: "np.ndarray") -> Optional["np.ndarray"]:
+        """Returns the mask of a comparison or regular expression match, or None if it can't be vectorized."""
+        op = self._op
+        if op in {Relation.match, Relation.fullmatch}:
+            if values.dtype.kind in "biuf":
+                return np.zeros(len(values), dtype=bool)  # only strings can match
+            if not is_not_stub(pd.Series):
+                return None
+            codes = None
+            try:
+                # run the regular expression once per distinct value
+                codes, values = pd.factorize(values)
+            except TypeError:  # unhashable objects
+                pass
+            try:
+                strings = pd.Series(values, dtype=object).str
+            except AttributeError:  # no strings at all
+                return np.zeros(len(values) if codes is None else len(codes), dtype=bool)
+            match = strings.match if op == Relation.match else strings.fullmatch
+            try:
+                matches = match(self._re.pattern, flags=self._re.flags, na=False).to_numpy(dtype=bool)
+            except (TypeError, ValueError):
+                return None
+            if codes is None:
+                return matches
+            # missing values are coded -1 and never match
+            return np.append(matches, False)[codes]
+
+        comparison = _COMPARISONS.get(op)
+        if comparison is None:
+            return None
+        value = self._value()
+        kind = values.dtype.kind
+        if kind in "biuf":
+            if isinstance(value, str) or not isinstance(value, (int, float, np.number)):
+                return None
+        elif kind == "U":
+            if not isinstance(value, str):
+                return None
+        elif kind != "O":
+            return None
+        try:
+            result = comparison(values, value)
+            if not isinstance(result, np.ndarray) or result.shape != values.shape:
+                return None
+            return result.astype(bool)
+        except (TypeError, ValueError, OverflowError):
+            return None  # some element can't be compared, find out which one by one
+
     def _maybe_not(self, op: Relation, value: Union[str, int, float, ValueGetter]) -> "Predicate":
         pred = Predicate(op, value, component=self._component)
         if self._op == Relation._not and self._right is None:
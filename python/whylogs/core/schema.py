@@ -12,7 +12,7 @@ from whylogs.core.resolvers import (
     StandardResolver,
 )
 from whylogs.core.segmentation_partition import SegmentationPartition
-from whylogs.core.stubs import pd
+from whylogs.core.stubs import np, pd
 from whylogs.core.validators.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,21 @@ class DatasetSchema:
         resolvers: Optional. an object that defines how to map from a column name, a whylogs :class:`DataType` and a
                    schema to metrics.
 
+        max_workers: Optional. number of threads used to track the columns of a DataFrame concurrently.
+                   None or 1 tracks the columns one after another.
+
+        cache_size: Optional. number of rows buffered by a profile tracking single rows before they are
+                   converted to columns and tracked in one batch. The rows are copied but not their values,
+                   a list or array changed after it was tracked is profiled as changed. Profiles with
+                   validators or condition count metrics don't buffer rows, so their actions run and their
+                   failures are raised when the row is tracked.
+
+        cache_bytes: Optional. approximate size in bytes of the buffered row values that triggers a flush
+                   of the row buffer before cache_size rows are buffered.
+
+        cache_max_age: Optional. age in seconds of the oldest buffered row that triggers a flush of the row
+                   buffer. The age is checked whenever a row is tracked.
+
 
     Examples
     --------
@@ -76,6 +91,9 @@ class DatasetSchema:
         schema_based_automerge: bool = False,
         segments: Optional[Dict[str, SegmentationPartition]] = None,
         validators: Optional[Dict[str, List[Validator]]] = None,
+        max_workers: Optional[int] = None,
+        cache_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = None,
     ) -> None:
         self._columns = dict()
         self.types = types or dict()
@@ -86,6 +104,18 @@ class DatasetSchema:
         self.schema_based_automerge = schema_based_automerge
         self.segments = segments or dict()
         self.validators = validators or dict()
+        self.max_workers = max_workers
+        self.cache_bytes = cache_bytes
+        self.cache_max_age = cache_max_age
+
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {self.max_workers}")
+
+        if self.cache_bytes is not None and self.cache_bytes < 0:
+            raise ValueError(f"cache_bytes must not be negative, got {self.cache_bytes}")
+
+        if self.cache_max_age is not None and self.cache_max_age < 0:
+            raise ValueError(f"cache_max_age must not be negative, got {self.cache_max_age}")
 
         if self.cache_size < 0:
             logger.warning("Negative cache size value. Disabling caching")
@@ -118,10 +148,19 @@ class DatasetSchema:
         copy.segments = self.segments.copy()
         return copy
 
-    def resolve(self, *, pandas: Optional[pd.DataFrame] = None, row: Optional[Mapping[str, Any]] = None) -> bool:
+    def resolve(
+        self,
+        *,
+        pandas: Optional[pd.DataFrame] = None,
+        row: Optional[Mapping[str, Any]] = None,
+        arrow: Optional[Any] = None,
+    ) -> bool:
         if pandas is not None:
             return self._resolve_pdf(pandas)
 
+        if arrow is not None:
+            return self._resolve_arrow(arrow)
+
         if row is not None:
             for k, v in row.items():
                 if k in self._columns:
@@ -161,6 +200,37 @@ class DatasetSchema:
 
         return dirty
 
+    def _resolve_arrow(self, arrow_schema: Any) -> bool:
+        """
+        Resolve ColumnSchema from a pyarrow.Schema. Like _resolve_pdf(), only newly detected columns are resolved.
+        Arrow types are mapped to the numpy dtype Pandas would use for the column.
+        """
+        import pyarrow as pa
+
+        dirty = False
+        for arrow_field in arrow_schema:
+            if arrow_field.name in self._columns:
+                continue
+
+            arrow_type = arrow_field.type
+            if pa.types.is_dictionary(arrow_type):
+                arrow_type = arrow_type.value_type
+            try:
+                col_dtype = np.dtype(arrow_type.to_pandas_dtype())
+            except NotImplementedError:
+                col_dtype = np.dtype(object)
+
+            self._columns[arrow_field.name] = ColumnSchema(
+                dtype=col_dtype,
+                cfg=self.default_configs,
+                resolver=self.resolvers,
+                validators=self.validators,
+                type_mapper=self.type_mapper,
+            )
+            dirty = True
+
+        return dirty
+
     def get_col_names(self) -> tuple:
         return tuple(self._columns.keys())
 
@@ -221,6 +291,9 @@ class DeclarativeSchema(DatasetSchema):
         schema_based_automerge: bool = False,
         segments: Optional[Dict[str, SegmentationPartition]] = None,
         validators: Optional[Dict[str, List[Validator]]] = None,
+        max_workers: Optional[int] = None,
+        cache_bytes: Optional[int] = None,
+        cache_max_age: Optional[float] = None,
     ) -> None:
         if not resolvers:
             logger.warning("No columns specified in DeclarativeSchema")
@@ -234,4 +307,7 @@ class DeclarativeSchema(DatasetSchema):
             schema_based_automerge=schema_based_automerge,
             segments=segments,
             validators=validators,
+            max_workers=max_workers,
+            cache_bytes=cache_bytes,
+            cache_max_age=cache_max_age,
         )
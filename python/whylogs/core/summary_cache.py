@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from whylogs.core.configs import SummaryConfig
+from whylogs.core.metrics.metrics import Metric
+
+_ACTIVE_SUMMARY_CACHE: ContextVar[Optional["SummaryCache"]] = ContextVar("whylogs_summary_cache", default=None)
+
+
+class SummaryCache:
+    """
+    Memoizes the metric summaries computed while constraints are evaluated against a profile.
+
+    Summaries are keyed by (column, metric namespace, summary config). Within a profile a metric instance belongs to
+    a single column and namespace, so the instance identifies them even where the column isn't known, like in a
+    Predicate. The cache holds a reference to the metrics it summarized, it must not outlive the evaluation of
+    the profile they belong to.
+    The cached summaries are shared, they must not be modified.
+    """
+
+    def __init__(self) -> None:
+        self._summaries: Dict[Tuple[int, str, str], Tuple[Metric, Dict[str, Any]]] = dict()
+        self._selections: Dict[Hashable, List[Metric]] = dict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_summary(self, metric: Metric, cfg: Optional[SummaryConfig] = None) -> Dict[str, Any]:
+        # the default config is the common case, don't pay for its repr
+        cfg_key = "" if cfg is None else repr(cfg)
+        key = (id(metric), metric.namespace, cfg_key)
+        cached = self._summaries.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        summary = metric.to_summary_dict(cfg or SummaryConfig())
+        self._summaries[key] = (metric, summary)
+        return summary
+
+    def get_metrics(self, key: Hashable, select: Callable[[], List[Metric]]) -> List[Metric]:
+        """Returns the metrics selected for key, calling select the first time."""
+        metrics = self._selections.get(key)
+        if metrics is None:
+            metrics = select()
+            self._selections[key] = metrics
+        return metrics
+
+
+def get_summary_cache() -> Optional[SummaryCache]:
+    """Returns the cache of the evaluation in progress, if any."""
+    return _ACTIVE_SUMMARY_CACHE.get()
+
+
+@contextmanager
+def summary_cache(cache: Optional[SummaryCache] = None) -> Iterator[SummaryCache]:
+    """
+    Makes the summaries computed within the block shared through a SummaryCache. Nested blocks reuse the cache
+    of the enclosing one unless a cache is passed in.
+    """
+    active = _ACTIVE_SUMMARY_CACHE.get()
+    if cache is None and active is not None:
+        yield active
+        return
+
+    cache = cache or SummaryCache()
+    token = _ACTIVE_SUMMARY_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_SUMMARY_CACHE.reset(token)
+
+
+def metric_summary(metric: Metric, cfg: Optional[SummaryConfig] = None) -> Dict[str, Any]:
+    """Returns the summary of the metric, from the active SummaryCache if there is one."""
+    cache = _ACTIVE_SUMMARY_CACHE.get()
+    if cache is None:
+        return metric.to_summary_dict(cfg or SummaryConfig())
+    return cache.get_summary(metric, cfg)
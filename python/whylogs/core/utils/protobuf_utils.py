@@ -89,3 +89,10 @@ def write_delimited_protobuf(stream: IO[bytes], msg: T) -> None:
 
     _EncodeVarint(stream.write, msg.ByteSize())
     stream.write(msg.SerializeToString())
+
+
+def serialize_delimited_protobuf(msg: T) -> bytes:
+    """Serialize a single message with its length prefix, as written by write_delimited_protobuf."""
+    from google.protobuf.internal.encoder import _VarintBytes  # type: ignore
+
+    return _VarintBytes(msg.ByteSize()) + msg.SerializeToString()
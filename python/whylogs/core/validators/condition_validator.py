@@ -1,10 +1,13 @@
 import logging
+import random
 from dataclasses import dataclass, field
 from itertools import chain
-from typing import Any, Callable, Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
-from whylogs.core.metrics.condition_count_metric import Condition
+from whylogs.core.metrics.condition_count_metric import Condition, _as_array
 from whylogs.core.preprocessing import PreprocessedColumn
+from whylogs.core.relations import Predicate, evaluate_elementwise
+from whylogs.core.stubs import is_not_stub, np
 from whylogs.core.validators.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -12,20 +15,94 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ConditionValidator(Validator):
+    """
+    Counts the values failing each condition and calls the actions on them.
+
+    Conditions are evaluated on whole arrays of values, see Predicate.evaluate_array. Actions are called with
+    each failing value, or once per condition with the array of its failing values if batch_actions is set.
+    max_action_values caps the number of failing values of a condition passed to the actions on each call to
+    columnar_validate, the values passed are sampled from the failing ones with a random generator of the
+    validator, leaving the global random state alone. The failures are counted anyway.
+    """
+
     conditions: Dict[str, Union[Condition, Callable[[Any], bool]]]
     actions: List[Callable[[str, str, Any], None]]
     name: str
     total: int = 0
     failures: Dict[str, int] = field(default_factory=dict)
+    batch_actions: bool = False
+    max_action_values: Optional[int] = None
+    _random: random.Random = field(default_factory=random.Random, init=False, repr=False, compare=False)
+    _np_random: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        if self.max_action_values is not None and self.max_action_values < 0:
+            raise ValueError(f"max_action_values must not be negative, got {self.max_action_values}")
         for cond_name in self.conditions.keys():
             if cond_name not in self.failures:
                 self.failures[cond_name] = 0
 
     def columnar_validate(self, data: PreprocessedColumn) -> None:
+        if not is_not_stub(np.ndarray):
+            self._validate_elementwise(data)
+            return
+
+        count = 0
+        failed_values: Dict[str, List["np.ndarray"]] = dict()
+        for chunk in data.raw_iterator():
+            values = _as_array(chunk)
+            count += len(values)
+            for cond_name, condition in self.conditions.items():
+                relation = condition.relation if isinstance(condition, Condition) else condition
+                if isinstance(relation, Predicate):
+                    matches, errors = relation.evaluate_array(values)
+                else:
+                    matches, errors = evaluate_elementwise(relation, values)
+                if matches.all():
+                    continue
+
+                # values raising an exception fail the condition
+                error_count = int(np.count_nonzero(errors))
+                if error_count > 0:
+                    logger.warning(f"{error_count} values raised an exception evaluating {self.name} {cond_name}")
+                failed = values[~matches]
+                self.failures[cond_name] += len(failed)
+                failed_values.setdefault(cond_name, []).append(failed)
+
+        self.total += count
+        if not self.actions:
+            return
+        for cond_name, arrays in failed_values.items():
+            # chunks hold values of different types, keep them as objects rather than casting them to one type
+            failed = arrays[0] if len(arrays) == 1 else np.concatenate([array.astype(object) for array in arrays])
+            self._dispatch(cond_name, self._sample(cond_name, failed))
+
+    def _sample(self, cond_name: str, failed: "np.ndarray") -> "np.ndarray":
+        if self.max_action_values is None or len(failed) <= self.max_action_values:
+            return failed
+        logger.debug(
+            f"{len(failed)} values failed {self.name} {cond_name}, passing {self.max_action_values} of them to actions"
+        )
+        # the sampled values stay in the order they were logged
+        if self._np_random is None:
+            self._np_random = np.random.default_rng()
+        sample = np.sort(self._np_random.choice(len(failed), self.max_action_values, replace=False))
+        return failed[sample]
+
+    def _dispatch(self, cond_name: str, failed: Any) -> None:
+        if len(failed) == 0:
+            return
+        if self.batch_actions:
+            for action in self.actions:
+                action(self.name, cond_name, failed)
+            return
+        for x in failed.tolist() if hasattr(failed, "tolist") else failed:
+            for action in self.actions:
+                action(self.name, cond_name, x)
+
+    def _validate_elementwise(self, data: PreprocessedColumn) -> None:
         count = 0
-        count_failures = 0
+        failed_values: Dict[str, List[Any]] = dict()
         for x in list(chain.from_iterable(data.raw_iterator())):
             count += 1
             for cond_name, condition in self.conditions.items():
@@ -40,11 +117,14 @@ class ConditionValidator(Validator):
 
                 if not valid:
                     self.failures[cond_name] += 1
-                    count_failures += 1
-                    for action in self.actions:
-                        action(self.name, cond_name, x)
+                    failed_values.setdefault(cond_name, []).append(x)
 
-        self.total = count
+        self.total += count
+        for cond_name, failed in failed_values.items():
+            if self.max_action_values is not None and len(failed) > self.max_action_values:
+                sample = sorted(self._random.sample(range(len(failed)), self.max_action_values))
+                failed = [failed[i] for i in sample]
+            self._dispatch(cond_name, failed)
 
     def to_summary_dict(self) -> Dict[str, Any]:
         summary = {"total_evaluations": self.total}
@@ -1,8 +1,10 @@
 from .column_profile_view import ColumnProfileView
 from .dataset_profile_view import WHYLOGS_MAGIC_HEADER, DatasetProfileView
+from .merge import merge_views
 
 __ALL__ = [
     ColumnProfileView,
     DatasetProfileView,
     WHYLOGS_MAGIC_HEADER,
+    merge_views,
 ]
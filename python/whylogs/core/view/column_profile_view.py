@@ -1,10 +1,11 @@
 import logging
+from copy import deepcopy
 from typing import Any, Dict, List, Optional, TypeVar
 
 from whylogs.core.configs import SummaryConfig
 from whylogs.core.errors import DeserializationError, UnsupportedError
 from whylogs.core.metrics import StandardMetric
-from whylogs.core.metrics.metrics import _METRIC_DESERIALIZER_REGISTRY, Metric
+from whylogs.core.metrics.metrics import Metric, _get_registered_metric
 from whylogs.core.proto import ColumnMessage, MetricComponentMessage, MetricMessage
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,25 @@ class ColumnProfileView(object):
     def __add__(self, other: "ColumnProfileView") -> "ColumnProfileView":
         return self.merge(other)
 
+    def __iadd__(self, other: "ColumnProfileView") -> "ColumnProfileView":
+        return other.merge_into(self)
+
+    def merge_into(self, target: "ColumnProfileView") -> "ColumnProfileView":
+        """
+        Merge this column into target in place and return target. The metrics target doesn't have yet are
+        copied, so later in-place merges into target never modify this view. Target's own metrics are updated
+        even when shared with other views, e.g. by merge(); DatasetProfileView.merge_into copies such columns.
+        """
+        for name, metric in self._metrics.items():
+            target_metric = target._metrics.get(name)
+            if target_metric is None:
+                target._metrics[name] = deepcopy(metric)
+            else:
+                metric.merge_into(target_metric)
+        target._success_count += self._success_count
+        target._failure_count += self._failure_count
+        return target
+
     def __getstate__(self) -> bytes:
         return self.serialize()
 
@@ -110,11 +130,6 @@ class ColumnProfileView(object):
 
     @classmethod
     def from_protobuf(cls, msg: ColumnMessage) -> "ColumnProfileView":
-        # importing to trigger registration of non-standard metrics
-        import whylogs.experimental.extras.embedding_metric  # noqa
-        import whylogs.experimental.extras.nlp_metric  # noqa
-        import whylogs.extras.image_metric  # noqa
-
         result_metrics: Dict[str, Metric] = {}
         metric_messages: Dict[str, Dict[str, MetricComponentMessage]] = {}
         for full_path, c_msg in msg.metric_components.items():
@@ -131,9 +146,8 @@ class ColumnProfileView(object):
         for m_name, metric_components in metric_messages.items():
             m_enum = StandardMetric.__members__.get(m_name)
             if m_enum is None:
-                if m_name in _METRIC_DESERIALIZER_REGISTRY:
-                    metric_class = _METRIC_DESERIALIZER_REGISTRY[m_name]
-                else:
+                metric_class = _get_registered_metric(m_name)
+                if metric_class is None:
                     raise UnsupportedError(f"Unsupported metric: {m_name}")
             else:
                 metric_class = m_enum.value
@@ -1,9 +1,22 @@
 import io
 import logging
-import tempfile
+import mmap
+import os
+import threading
+from copy import deepcopy
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, BinaryIO, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from google.protobuf.message import DecodeError
 
@@ -26,6 +39,7 @@ from whylogs.core.utils import (
     read_delimited_protobuf,
     write_delimited_protobuf,
 )
+from whylogs.core.utils.protobuf_utils import serialize_delimited_protobuf
 from whylogs.core.utils.timestamp_calculations import to_utc_milliseconds
 from whylogs.core.view.column_profile_view import ColumnProfileView
 
@@ -36,6 +50,8 @@ WHYLOGS_MAGIC_HEADER_LEN = 4
 WHYLOGS_MAGIC_HEADER_BYTES = WHYLOGS_MAGIC_HEADER.encode("utf-8")
 _MODEL_PERFORMANCE = "model_performance_metrics"
 _TAG_PREFIX = "whylogs.tag."
+# buffer size of the files opened to write profiles
+_WRITE_BUFFER_SIZE = 1024 * 1024
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +61,102 @@ class SummaryType(str, Enum):
     DATASET = "DATASET"
 
 
+def _read_column(
+    f: BinaryIO, col_name: str, offsets: List[int], start_offset: int, indexed_metric_paths: Dict[int, str]
+) -> ColumnProfileView:
+    """Read and decode the chunks of a single column, seeking to each chunk offset."""
+    all_metric_components: Dict[str, MetricComponentMessage] = {}
+    for offset in offsets:
+        actual_offset = offset + start_offset
+        chunk_header = read_delimited_protobuf(f, proto_class_name=ChunkHeader, offset=actual_offset)
+        if chunk_header is None:
+            raise DeserializationError(
+                f"Missing or corrupt chunk header for column {col_name}. Offset: {actual_offset}"
+            )
+        if chunk_header.type != ChunkHeader.ChunkType.COLUMN:
+            raise DeserializationError(
+                f"Expecting chunk header type to be {ChunkHeader.ChunkType.COLUMN}, " f"got {chunk_header.type}"
+            )
+
+        chunk_msg = ChunkMessage()
+        buf = f.read(chunk_header.length)
+        if len(buf) != chunk_header.length:
+            raise IOError(
+                f"Invalid message for {col_name}. Expecting buffer length of {chunk_header.length}, "
+                f"got {len(buf)}. "
+                f"Offset: {actual_offset}"
+            )
+        try:
+            chunk_msg.ParseFromString(buf)
+        except DecodeError:
+            raise DeserializationError(f"Failed to parse protobuf message for column: {col_name}")
+
+        for idx, metric_component in chunk_msg.metric_components.items():
+            full_name = indexed_metric_paths.get(idx)
+            if full_name is None:
+                raise ValueError(f"Missing metric name in the header. Index: {idx}")
+            all_metric_components[full_name] = metric_component
+
+    column_msg = ColumnMessage(metric_components=all_metric_components)
+    return ColumnProfileView.from_protobuf(column_msg)
+
+
+class _LazyColumns(MutableMapping[str, ColumnProfileView]):
+    """
+    Columns of a serialized profile that are decoded on first access.
+
+    Holds the stream the profile is read from (e.g. an mmap) and the chunk offsets of each column. A column's
+    chunks are only read and decoded the first time the column is accessed, then the view is kept.
+    """
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        start_offset: int,
+        column_offsets: Dict[str, List[int]],
+        indexed_metric_paths: Dict[int, str],
+    ):
+        self._f = f
+        self._start_offset = start_offset
+        self._column_offsets = column_offsets
+        self._indexed_metric_paths = indexed_metric_paths
+        self._decoded: Dict[str, ColumnProfileView] = {}
+        # decoding seeks in the shared stream
+        self._lock = threading.Lock()
+
+    def __getitem__(self, col_name: str) -> ColumnProfileView:
+        column = self._decoded.get(col_name)
+        if column is not None:
+            return column
+        offsets = self._column_offsets[col_name]
+        with self._lock:
+            column = self._decoded.get(col_name)
+            if column is None:
+                column = _read_column(self._f, col_name, offsets, self._start_offset, self._indexed_metric_paths)
+                self._decoded[col_name] = column
+        return column
+
+    def __setitem__(self, col_name: str, column: ColumnProfileView) -> None:
+        self._decoded[col_name] = column
+        self._column_offsets.setdefault(col_name, [])
+
+    def __delitem__(self, col_name: str) -> None:
+        del self._column_offsets[col_name]
+        self._decoded.pop(col_name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._column_offsets)
+
+    def __len__(self) -> int:
+        return len(self._column_offsets)
+
+    def copy(self) -> "_LazyColumns":
+        copy = _LazyColumns(self._f, self._start_offset, self._column_offsets.copy(), self._indexed_metric_paths)
+        copy._decoded = self._decoded.copy()
+        copy._lock = self._lock
+        return copy
+
+
 class DatasetProfileView(Writable):
     _columns: Dict[str, ColumnProfileView]
 
@@ -66,6 +178,8 @@ class DatasetProfileView(Writable):
         self._creation_timestamp = creation_timestamp
         self._metrics = metrics
         self._metadata = metadata
+        # columns that are not shared with another view or profile, merge_into may update them in place
+        self._owned_columns: Set[str] = set()
 
     @property
     def dataset_timestamp(self) -> Optional[datetime]:
@@ -172,6 +286,46 @@ class DatasetProfileView(Writable):
             metadata=metadata,
         )
 
+    def __iadd__(self, other: "DatasetProfileView") -> "DatasetProfileView":
+        return other.merge_into(self)
+
+    def merge_into(self, target: "DatasetProfileView") -> "DatasetProfileView":
+        """
+        Merge this profile into target in place and return target. Columns are merged metric by metric,
+        updating target's sketches instead of allocating new ones, which is much cheaper when accumulating
+        many profiles. The columns target doesn't have yet are copied, so this view is never modified.
+
+        Target's columns may be shared with other views, e.g. the inputs of merge() or a live profile's view().
+        Such a column is copied the first time it is merged into, later merges update the copy in place.
+        Views read from a file or bytes own their columns and are never copied.
+        """
+        for col_name, column in self._columns.items():
+            target_column = target._columns.get(col_name)
+            if target_column is None:
+                target._columns[col_name] = column.merge_into(ColumnProfileView(metrics={}))
+            else:
+                if col_name not in target._owned_columns:
+                    target_column = target_column.merge_into(ColumnProfileView(metrics={}))
+                    target._columns[col_name] = target_column
+                column.merge_into(target_column)
+            target._owned_columns.add(col_name)
+
+        if self._metrics:
+            # the target gets its own dictionary and copies of the metrics it doesn't have yet, so the
+            # following merges into it never change this view's metrics
+            metrics = dict(target._metrics or {})
+            for metric_name, metric in self._metrics.items():
+                target_metric = metrics.get(metric_name)
+                metrics[metric_name] = deepcopy(metric) if target_metric is None else target_metric.merge(metric)
+            target._metrics = metrics
+        if self._metadata:
+            target._metadata = {**(target._metadata or {}), **self._metadata}
+        target._dataset_timestamp = DatasetProfileView._min_datetime(target._dataset_timestamp, self._dataset_timestamp)
+        target._creation_timestamp = DatasetProfileView._min_datetime(
+            target._creation_timestamp, self._creation_timestamp
+        )
+        return target
+
     def get_column(self, col_name: str) -> Optional[ColumnProfileView]:
         return self._columns.get(col_name)
 
@@ -186,7 +340,7 @@ class DatasetProfileView(Writable):
 
     def write(self, path: Optional[str] = None, **kwargs: Any) -> Tuple[bool, str]:
         file_to_write = kwargs.get("file")
-        path = file_to_write.name if file_to_write else path or self.get_default_path()
+        path = getattr(file_to_write, "name", "") if file_to_write else path or self.get_default_path()
         if self._metrics and _MODEL_PERFORMANCE in self._metrics:
             from whylogs.migration.converters import v1_to_dataset_profile_message_v0
 
@@ -201,7 +355,7 @@ class DatasetProfileView(Writable):
         if file_to_write:
             self._do_write(file_to_write)
         else:
-            with open(path, "w+b") as out_f:
+            with open(path, "w+b", buffering=_WRITE_BUFFER_SIZE) as out_f:
                 self._do_write(out_f)
         return True, path
 
@@ -226,7 +380,14 @@ class DatasetProfileView(Writable):
             metadata.pop(key)
         return message_tags, metadata
 
-    def _do_write(self, out_f: BinaryIO) -> Tuple[bool, str]:
+    def _column_chunks(self) -> Tuple[Dict[str, ChunkOffsets], Dict[int, str], List[Tuple[bytes, ChunkMessage]], int]:
+        """
+        Build the ChunkMessage of each column without serializing it. The chunk sizes are computed up front with
+        ByteSize() so the column offsets are known before anything is written.
+
+        Returns the column offsets, the metric path index, the (delimited chunk header, chunk message) pairs
+        and the total length of the chunks.
+        """
         all_metric_component_names = set()
         # capture the list of all metric component paths
         for col in self._columns.values():
@@ -240,82 +401,110 @@ class DatasetProfileView(Writable):
             metric_name_indices[metric_name_list[i]] = i
             metric_index_to_name[i] = metric_name_list[i]
         column_chunk_offsets: Dict[str, ChunkOffsets] = {}
-        with tempfile.TemporaryFile("w+b") as f:
-            for col_name in sorted(self._columns.keys()):
-                column_chunk_offsets[col_name] = ChunkOffsets(offsets=[f.tell()])
-
-                col = self._columns[col_name]
-
-                # for a given column, turn it into a ChunkMessage.
-                indexed_component_messages: Dict[int, MetricComponentMessage] = {}
-                metric_components = col.to_protobuf().metric_components
-                for m_name, m_component in metric_components.items():
-                    index = metric_name_indices.get(m_name)
-                    if index is None:
-                        raise ValueError(f"Missing metric from index mapping. Metric name: {m_name}")
-                    indexed_component_messages[index] = m_component
-
-                chunk_msg = ChunkMessage(metric_components=indexed_component_messages)
-                chunk_header = ChunkHeader(type=ChunkHeader.ChunkType.COLUMN, length=chunk_msg.ByteSize())
-                write_delimited_protobuf(f, chunk_header)
-                f.write(chunk_msg.SerializeToString())
-
-            total_len = f.tell()
-            f.flush()
-            tags, metadata = DatasetProfileView._split_tags_and_metadata(self._metadata)
-
-            properties = DatasetProperties(
-                dataset_timestamp=to_utc_milliseconds(self._dataset_timestamp),
-                creation_timestamp=to_utc_milliseconds(self._creation_timestamp),
-                tags=tags,
-                metadata=metadata,
-            )
-            dataset_header = DatasetProfileHeader(
-                column_offsets=column_chunk_offsets,
-                properties=properties,
-                length=total_len,
-                indexed_metric_paths=metric_index_to_name,
+        chunks: List[Tuple[bytes, ChunkMessage]] = []
+        offset = 0
+        for col_name in sorted(self._columns.keys()):
+            column_chunk_offsets[col_name] = ChunkOffsets(offsets=[offset])
+
+            col = self._columns[col_name]
+
+            # for a given column, turn it into a ChunkMessage.
+            indexed_component_messages: Dict[int, MetricComponentMessage] = {}
+            metric_components = col.to_protobuf().metric_components
+            for m_name, m_component in metric_components.items():
+                index = metric_name_indices.get(m_name)
+                if index is None:
+                    raise ValueError(f"Missing metric from index mapping. Metric name: {m_name}")
+                indexed_component_messages[index] = m_component
+
+            chunk_msg = ChunkMessage(metric_components=indexed_component_messages)
+            chunk_length = chunk_msg.ByteSize()
+            chunk_header = serialize_delimited_protobuf(
+                ChunkHeader(type=ChunkHeader.ChunkType.COLUMN, length=chunk_length)
             )
+            chunks.append((chunk_header, chunk_msg))
+            offset += len(chunk_header) + chunk_length
 
-            # single file segments
-            dataset_segment_header = DatasetSegmentHeader(
-                has_segments=False,
-            )
+        return column_chunk_offsets, metric_index_to_name, chunks, offset
+
+    @staticmethod
+    def _iter_chunks(chunks: List[Tuple[bytes, ChunkMessage]]) -> Iterator[bytes]:
+        for chunk_header, chunk_msg in chunks:
+            yield chunk_header
+            yield chunk_msg.SerializeToString()
+
+    def _serialized_parts(self) -> Iterator[bytes]:
+        """Serialize the profile piece by piece: the magic and the headers first, then each column chunk."""
+        column_chunk_offsets, metric_index_to_name, chunks, total_len = self._column_chunks()
+        tags, metadata = DatasetProfileView._split_tags_and_metadata(self._metadata)
+
+        properties = DatasetProperties(
+            dataset_timestamp=to_utc_milliseconds(self._dataset_timestamp),
+            creation_timestamp=to_utc_milliseconds(self._creation_timestamp),
+            tags=tags,
+            metadata=metadata,
+        )
+        dataset_header = DatasetProfileHeader(
+            column_offsets=column_chunk_offsets,
+            properties=properties,
+            length=total_len,
+            indexed_metric_paths=metric_index_to_name,
+        )
 
-            out_f.write(WHYLOGS_MAGIC_HEADER_BYTES)
-            write_delimited_protobuf(out_f, dataset_segment_header)
-            write_delimited_protobuf(out_f, dataset_header)
+        # single file segments
+        dataset_segment_header = DatasetSegmentHeader(
+            has_segments=False,
+        )
+
+        yield WHYLOGS_MAGIC_HEADER_BYTES
+        yield serialize_delimited_protobuf(dataset_segment_header)
+        yield serialize_delimited_protobuf(dataset_header)
+        yield from DatasetProfileView._iter_chunks(chunks)
 
-            f.seek(0)
-            while f.tell() < total_len:
-                buffer = f.read(1024)
-                out_f.write(buffer)
+    def _do_write(self, out_f: BinaryIO) -> Tuple[bool, str]:
+        for part in self._serialized_parts():
+            out_f.write(part)
         return True, "Wrote given BinaryIO:" + str(out_f)
 
     def serialize(self) -> bytes:
-        f = io.BytesIO()
-        self._do_write(f)
-        f.seek(0)
-        return f.read()
+        # join sizes the output once and copies each part into it, no intermediate stream
+        return b"".join(self._serialized_parts())
 
     @classmethod
     def zero(cls) -> "DatasetProfileView":
         return DatasetProfileView(columns=dict(), dataset_timestamp=None, creation_timestamp=None)
 
     @classmethod
-    def deserialize(cls, data: bytes) -> "DatasetProfileView":
-        f = io.BytesIO()
-        f.write(data)
-        f.seek(0)
-        return cls._do_read(f)
+    def deserialize(cls, data: bytes, columns: Optional[List[str]] = None, lazy: bool = False) -> "DatasetProfileView":
+        """
+        Deserialize a profile from bytes.
+
+        Args:
+            columns: only deserialize these columns.
+            lazy: only decode a column the first time it is accessed.
+        """
+        f = io.BytesIO(data)
+        return cls._do_read(f, columns=columns, lazy=lazy)
 
     @classmethod
-    def read(cls, path: str) -> "DatasetProfileView":
+    def read(cls, path: str, columns: Optional[List[str]] = None, lazy: bool = False) -> "DatasetProfileView":
+        """
+        Read a profile file.
+
+        Args:
+            columns: only read these columns. The other columns' chunks are skipped using the offsets in the header.
+            lazy: memory map the file and only decode a column the first time it is accessed.
+        """
         with open(path, "r+b") as f:
-            return cls._do_read(f)
+            if not lazy or os.fstat(f.fileno()).st_size == 0:
+                return cls._do_read(f, columns=columns)
+            # the mapping stays valid after the file is closed, it's released with the view's columns
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls._do_read(mapped, columns=columns, lazy=True)  # type: ignore
 
-    @classmethod
-    def _do_read(cls, f: BinaryIO) -> "DatasetProfileView":
+    @staticmethod
+    def _read_segment_header(f: BinaryIO) -> DatasetSegmentHeader:
+        """Check the magic header and read the segment header that follows it."""
         buf = f.read(WHYLOGS_MAGIC_HEADER_LEN)
         try:
             decoded_header = buf.decode("utf-8")
@@ -326,13 +515,22 @@ class DatasetProfileView(Writable):
             raise DeserializationError(
                 f"Invalid magic header. Got: {decoded_header} but expecting: {WHYLOGS_MAGIC_HEADER}"
             )
+        return read_delimited_protobuf(f, DatasetSegmentHeader)
 
-        dataset_segment_header = read_delimited_protobuf(f, DatasetSegmentHeader)
+    @classmethod
+    def _do_read(cls, f: BinaryIO, columns: Optional[List[str]] = None, lazy: bool = False) -> "DatasetProfileView":
+        dataset_segment_header = cls._read_segment_header(f)
         if dataset_segment_header.has_segments:
             logger.warning(
                 "File contains segments. Only first profile will be deserialized into this DatasetProfileView"
             )
+        return cls._read_profile(f, columns=columns, lazy=lazy)
 
+    @classmethod
+    def _read_profile(
+        cls, f: BinaryIO, columns: Optional[List[str]] = None, lazy: bool = False
+    ) -> "DatasetProfileView":
+        """Read a profile starting at its DatasetProfileHeader."""
         dataset_profile_header = read_delimited_protobuf(f, DatasetProfileHeader)
         if dataset_profile_header.ByteSize() == 0:
             raise DeserializationError("Missing valid dataset profile header")
@@ -348,46 +546,24 @@ class DatasetProfileView(Writable):
 
         start_offset = f.tell()
 
-        columns = {}
-        for col_name in sorted(dataset_profile_header.column_offsets.keys()):
-            col_offsets = dataset_profile_header.column_offsets[col_name]
-            all_metric_components: Dict[str, MetricComponentMessage] = {}
-            for offset in col_offsets.offsets:
-                actual_offset = offset + start_offset
-                chunk_header = read_delimited_protobuf(f, proto_class_name=ChunkHeader, offset=actual_offset)
-                if chunk_header is None:
-                    raise DeserializationError(
-                        f"Missing or corrupt chunk header for column {col_name}. Offset: {actual_offset}"
-                    )
-                if chunk_header.type != ChunkHeader.ChunkType.COLUMN:
-                    raise DeserializationError(
-                        f"Expecting chunk header type to be {ChunkHeader.ChunkType.COLUMN}, " f"got {chunk_header.type}"
-                    )
-
-                chunk_msg = ChunkMessage()
-                buf = f.read(chunk_header.length)
-                if len(buf) != chunk_header.length:
-                    raise IOError(
-                        f"Invalid message for {col_name}. Expecting buffer length of {chunk_header.length}, "
-                        f"got {len(buf)}. "
-                        f"Offset: {actual_offset}"
-                    )
-                try:
-                    chunk_msg.ParseFromString(buf)
-                except DecodeError:
-                    raise DeserializationError(f"Failed to parse protobuf message for column: {col_name}")
-
-                for idx, metric_component in chunk_msg.metric_components.items():
-                    full_name = indexed_metric_paths.get(idx)
-                    if full_name is None:
-                        raise ValueError(f"Missing metric name in the header. Index: {idx}")
-                    all_metric_components[full_name] = metric_component
-
-            column_msg = ColumnMessage(metric_components=all_metric_components)
-            columns[col_name] = ColumnProfileView.from_protobuf(column_msg)
-        return DatasetProfileView(
-            columns=columns, dataset_timestamp=dataset_timestamp, creation_timestamp=creation_timestamp
+        column_offsets = dataset_profile_header.column_offsets
+        if columns is None:
+            col_names = sorted(column_offsets.keys())
+        else:
+            col_names = [col_name for col_name in columns if col_name in column_offsets]
+        lazy_columns = _LazyColumns(
+            f,
+            start_offset,
+            {col_name: list(column_offsets[col_name].offsets) for col_name in col_names},
+            dict(indexed_metric_paths),
+        )
+        view = DatasetProfileView(
+            columns=lazy_columns if lazy else dict(lazy_columns.items()),  # type: ignore
+            dataset_timestamp=dataset_timestamp,
+            creation_timestamp=creation_timestamp,
         )
+        view._owned_columns = set(col_names)
+        return view
 
     def __getstate__(self) -> bytes:
         return self.serialize()
@@ -399,6 +575,7 @@ class DatasetProfileView(Writable):
         self._creation_timestamp = copy._creation_timestamp
         self._metrics = copy._metrics
         self._metadata = copy._metadata
+        self._owned_columns = copy._owned_columns
 
     def to_pandas(self, column_metric: Optional[str] = None, cfg: Optional[SummaryConfig] = None) -> pd.DataFrame:
         all_dicts = []
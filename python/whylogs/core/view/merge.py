@@ -0,0 +1,100 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, List, Optional, Set, Union
+
+from whylogs.core.view.dataset_profile_view import DatasetProfileView
+
+logger = logging.getLogger(__name__)
+
+# a view, the path of a profile file or a serialized profile
+ProfileSource = Union[DatasetProfileView, str, bytes]
+
+_DEFAULT_BATCH_SIZE = 16
+
+
+def _to_view(source: ProfileSource) -> DatasetProfileView:
+    if isinstance(source, DatasetProfileView):
+        return source
+    if isinstance(source, bytes):
+        return DatasetProfileView.deserialize(source)
+    return DatasetProfileView.read(source)
+
+
+def _merge_serial(sources: Iterable[ProfileSource]) -> DatasetProfileView:
+    result: Optional[DatasetProfileView] = None
+    for source in sources:
+        view = _to_view(source)
+        if result is None and view is not source:
+            # a freshly read profile can be used as the accumulator
+            result = view
+        else:
+            result = view.merge_into(result or DatasetProfileView.zero())
+    return result or DatasetProfileView.zero()
+
+
+def _merge_batch(sources: List[ProfileSource]) -> bytes:
+    """Merge a batch of profiles in a worker process. The result goes back to the parent serialized."""
+    return _merge_serial(sources).serialize()
+
+
+def merge_views(
+    sources: Iterable[ProfileSource], workers: Optional[int] = None, batch_size: int = _DEFAULT_BATCH_SIZE
+) -> DatasetProfileView:
+    """
+    Merge many profiles into a single DatasetProfileView.
+
+    The sources are consumed as a stream, so only a bounded number of profiles are held in memory at once.
+    Without workers they are merged one after another. With workers, batches of sources are deserialized and
+    merged in a process pool, and the partial results are merged again in batches until a single profile
+    is left, forming a reduction tree.
+
+    Args:
+        sources: DatasetProfileViews, paths of profile files or serialized profiles. Passing paths lets the
+            worker processes read and deserialize the files themselves.
+        workers: number of processes used to merge. None or 1 merges in the calling process.
+        batch_size: number of profiles merged by a single task.
+
+    Dataset-level metrics such as model performance metrics are not part of the serialized profile, so views
+    carrying them are merged in the calling process.
+    """
+    if batch_size < 2:
+        raise ValueError(f"batch_size must be at least 2, got {batch_size}")
+    if workers is None or workers <= 1:
+        return _merge_serial(sources)
+
+    local_result: Optional[DatasetProfileView] = None
+    partials: List[bytes] = []
+    pending: Set[Future] = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def collect(max_pending: int) -> None:
+            # wait for tasks to complete until at most max_pending are running, then batch up their results
+            nonlocal pending
+            while len(pending) > max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                partials.extend(future.result() for future in done)
+            while len(partials) >= batch_size or (not pending and len(partials) > 1):
+                pending.add(executor.submit(_merge_batch, partials[:batch_size]))
+                del partials[:batch_size]
+
+        batch: List[ProfileSource] = []
+        for source in sources:
+            if isinstance(source, DatasetProfileView) and source._metrics:
+                local_result = source.merge_into(local_result or DatasetProfileView.zero())
+                continue
+            batch.append(source)
+            if len(batch) == batch_size:
+                pending.add(executor.submit(_merge_batch, batch))
+                batch = []
+                collect(2 * workers)
+        if batch:
+            pending.add(executor.submit(_merge_batch, batch))
+
+        while pending:
+            collect(0)
+
+    result = DatasetProfileView.deserialize(partials[0]) if partials else None
+    if local_result is not None:
+        result = local_result if result is None else local_result.merge(result)
+    return result or DatasetProfileView.zero()
@@ -1,35 +1,45 @@
-import tempfile
+import os
+import struct
 from datetime import datetime
 from logging import getLogger
-from typing import IO, Any, Dict, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from whylogs.api.writer.writer import Writable
+from whylogs.core.errors import DeserializationError
 from whylogs.core.proto import (
-    ChunkHeader,
-    ChunkMessage,
-    ChunkOffsets,
     DatasetProfileHeader,
     DatasetProperties,
     DatasetSegmentHeader,
-    MetricComponentMessage,
 )
 from whylogs.core.proto import Segment as SegmentMessage
 from whylogs.core.segment import Segment
 from whylogs.core.segmentation_partition import SegmentationPartition
 from whylogs.core.utils import write_delimited_protobuf
+from whylogs.core.utils.protobuf_utils import (
+    read_delimited_protobuf,
+    serialize_delimited_protobuf,
+)
 from whylogs.core.utils.timestamp_calculations import to_utc_milliseconds
 from whylogs.core.view.dataset_profile_view import (
+    _WRITE_BUFFER_SIZE,
     WHYLOGS_MAGIC_HEADER_BYTES,
     DatasetProfileView,
 )
 from whylogs.migration.converters import (
+    PARTITION_ID,
     _generate_segment_tags_metadata,
     v1_to_dataset_profile_message_v0,
 )
 
 logger = getLogger(__name__)
 
-_BUFFER_CHUNK = 1024
+# DatasetSegmentHeader.layout_version: single segment files hold their profile right after the header, the
+# container layout has an index of the segments and their offsets at the end of the file
+_SINGLE_PROFILE_LAYOUT = 0
+_CONTAINER_LAYOUT = 1
+# the container ends with the size of its index
+_INDEX_SIZE_FORMAT = "<Q"
+_INDEX_SIZE_BYTES = struct.calcsize(_INDEX_SIZE_FORMAT)
 
 
 class SegmentedDatasetProfileView(Writable):
@@ -77,7 +87,7 @@ class SegmentedDatasetProfileView(Writable):
     def _write_as_v0_message(self, path: Optional[str] = None, **kwargs: Any) -> Tuple[bool, str]:
         message_v0 = v1_to_dataset_profile_message_v0(self.profile_view, self.segment, self.partition)
         file_to_write = kwargs.get("file")
-        path = file_to_write.name if file_to_write else path or self.get_default_path()
+        path = getattr(file_to_write, "name", "") if file_to_write else path or self.get_default_path()
         if file_to_write:
             write_delimited_protobuf(file_to_write, message_v0)
         else:
@@ -85,125 +95,55 @@ class SegmentedDatasetProfileView(Writable):
                 write_delimited_protobuf(out_f, message_v0)
         return True, path
 
-    def _copy_write(
-        self,
-        source_profile_file: IO[bytes],
-        output_file: IO[bytes],
-        total_len: int,
-        dataset_segment_header: DatasetSegmentHeader,
-        dataset_header: DatasetProfileHeader,
-    ):
-        output_file.write(WHYLOGS_MAGIC_HEADER_BYTES)
-        write_delimited_protobuf(output_file, dataset_segment_header)
-        logger.debug(
-            f"Writing segmented profile file: whylogs file and segment headers wrote {output_file.tell()} bytes"
-        )
-        write_delimited_protobuf(output_file, dataset_header)
-        logger.debug(
-            f"Writing segmented profile file: and with dataset header wrote a total of {output_file.tell()} bytes before writing the chunks."
+    def _segment_message(self, with_partition_id: bool = True) -> SegmentMessage:
+        # calculate segment tags based on columnar segments
+        _, segment_tags, _ = _generate_segment_tags_metadata(self.segment, self.partition)
+        if not segment_tags:
+            raise NotImplementedError(
+                f"Serialization of segments requires segment tags but none calculated for partition: {self.partition} and segments: {self.segment}"
+            )
+        segment_message = SegmentMessage(partition_id=self.partition.id) if with_partition_id else SegmentMessage()
+        segment_message.tags.extend(segment_tags)
+        return segment_message
+
+    def _serialized_profile_parts(self) -> Iterator[bytes]:
+        """Serialize the segment's profile from its DatasetProfileHeader on, the part a segment offset points to."""
+        column_chunk_offsets, metric_index_to_name, chunks, total_len = self.profile_view._column_chunks()
+        segment_message_tags, _, segment_metadata = _generate_segment_tags_metadata(self.segment, self.partition)
+
+        properties = DatasetProperties(
+            dataset_timestamp=to_utc_milliseconds(self.profile_view._dataset_timestamp),
+            creation_timestamp=to_utc_milliseconds(self.profile_view._creation_timestamp),
+            metadata=segment_metadata,
+            tags=segment_message_tags,
         )
 
-        source_profile_file.seek(0)
-        while source_profile_file.tell() < total_len:
-            buffer = source_profile_file.read(_BUFFER_CHUNK)
-            output_file.write(buffer)
-        logger.debug(f"Writing segmented profile file: complete! total of {output_file.tell()} bytes written.")
+        logger.debug(f"constructed DatasetProperties for segmented profile file: {properties}")
+
+        dataset_header = DatasetProfileHeader(
+            column_offsets=column_chunk_offsets,
+            properties=properties,
+            length=total_len,
+            indexed_metric_paths=metric_index_to_name,
+        )
+        yield serialize_delimited_protobuf(dataset_header)
+        yield from DatasetProfileView._iter_chunks(chunks)
 
     def _write_v1(self, path: Optional[str] = None, **kwargs: Any) -> Tuple[bool, str]:
-        all_metric_component_names = set()
         file_to_write = kwargs.get("file")
-        path = file_to_write.name if file_to_write else path or self.get_default_path()
-
-        # capture the list of all metric component paths
-        for col in self.profile_view._columns.values():
-            all_metric_component_names.update(col.get_metric_component_paths())
-        metric_name_list = list(all_metric_component_names)
-        metric_name_list.sort()
-        metric_name_indices: Dict[str, int] = {}
-        metric_index_to_name: Dict[int, str] = {}
-        for i in range(0, len(metric_name_list)):
-            metric_name_indices[metric_name_list[i]] = i
-            metric_index_to_name[i] = metric_name_list[i]
-
-        column_chunk_offsets: Dict[str, ChunkOffsets] = {}
-
-        with tempfile.TemporaryFile("w+b") as f:
-            for col_name in sorted(self.profile_view._columns.keys()):
-                column_chunk_offsets[col_name] = ChunkOffsets(offsets=[f.tell()])
-
-                col = self.profile_view._columns[col_name]
-
-                # for a given column, turn it into a ChunkMessage.
-                indexed_component_messages: Dict[int, MetricComponentMessage] = {}
-                metric_components = col.to_protobuf().metric_components
-                for m_name, m_component in metric_components.items():
-                    index = metric_name_indices.get(m_name)
-                    if index is None:
-                        raise ValueError(f"Missing metric from index mapping. Metric name: {m_name}")
-                    indexed_component_messages[index] = m_component
-
-                chunk_msg = ChunkMessage(metric_components=indexed_component_messages)
-                chunk_header = ChunkHeader(type=ChunkHeader.ChunkType.COLUMN, length=chunk_msg.ByteSize())
-                write_delimited_protobuf(f, chunk_header)
-                f.write(chunk_msg.SerializeToString())
-
-            total_len = f.tell()
-            f.flush()
-
-            # calculate segment tags based on columnar segments
-            segment_message_tags, segment_tags, segment_metadata = _generate_segment_tags_metadata(
-                self.segment, self.partition
-            )
-
-            if not segment_tags:
-                raise NotImplementedError(
-                    f"Serialization of segments requires segment tags but none calculated for partition: {self.partition} and segments: {self.segment}"
-                )
+        path = getattr(file_to_write, "name", "") if file_to_write else path or self.get_default_path()
 
-            segment_message = SegmentMessage()
-            segment_message.tags.extend(segment_tags)
-            segments_message_field = [segment_message]
-
-            properties = DatasetProperties(
-                dataset_timestamp=to_utc_milliseconds(self.profile_view._dataset_timestamp),
-                creation_timestamp=to_utc_milliseconds(self.profile_view._creation_timestamp),
-                metadata=segment_metadata,
-                tags=segment_message_tags,
-            )
-
-            logger.warn(f"constructed DatasetProperties for segmented profile file: {properties}")
-
-            dataset_header = DatasetProfileHeader(
-                column_offsets=column_chunk_offsets,
-                properties=properties,
-                length=total_len,
-                indexed_metric_paths=metric_index_to_name,
-            )
+        # single segment files keep their original layout: the profile right after the header, and an offset
+        # measured on the header before the segment was added
+        dataset_segment_header = DatasetSegmentHeader(has_segments=True, offsets={0: 0})
+        dataset_segment_header.offsets[0] = len(serialize_delimited_protobuf(dataset_segment_header))
+        dataset_segment_header.segments.append(self._segment_message(with_partition_id=False))
 
-            # TODO: multi segment file format requires multiple offset calculations.
-            #  Single segment file only supported initially.
-            #  This creates the offsets dictionary with correct keys but 0 offset values, later update offsets
-            #  based on file position offset in the temp file written, similarly to how Chunk
-            segment_offsets: Dict[int, int] = {
-                n: 0 for n in range(len(segments_message_field))
-            }  # update this after writing
-
-            # single file segments.
-            dataset_segment_header = DatasetSegmentHeader(has_segments=True, offsets=segment_offsets)
-
-            # TODO: calculate other segments offsets when we support multiple segments per file
-            write_delimited_protobuf(f, dataset_segment_header)
-            first_segment_offset = f.tell() - total_len
-            dataset_segment_header.offsets[0] = first_segment_offset
-
-            # only single segment files at first.
-            dataset_segment_header.segments.extend(segments_message_field)
-
-            if file_to_write:
-                self._copy_write(f, file_to_write, total_len, dataset_segment_header, dataset_header)
-            else:
-                with open(path, "w+b") as out_f:
-                    self._copy_write(f, out_f, total_len, dataset_segment_header, dataset_header)
+        if file_to_write:
+            _write_segments(file_to_write, dataset_segment_header, self._serialized_profile_parts())
+        else:
+            with open(path, "w+b", buffering=_WRITE_BUFFER_SIZE) as out_f:
+                _write_segments(out_f, dataset_segment_header, self._serialized_profile_parts())
         return True, path
 
     def write(self, path: Optional[str] = None, **kwargs: Any) -> Tuple[bool, str]:
@@ -211,3 +151,172 @@ class SegmentedDatasetProfileView(Writable):
             return self._write_as_v0_message(path, **kwargs)
         else:
             return self._write_v1(path, **kwargs)
+
+
+def _write_segments(
+    output_file: IO[bytes], dataset_segment_header: DatasetSegmentHeader, profiles: Iterable[bytes]
+) -> None:
+    output_file.write(WHYLOGS_MAGIC_HEADER_BYTES)
+    write_delimited_protobuf(output_file, dataset_segment_header)
+    logger.debug("Writing segmented profile file: wrote the whylogs file and segment headers.")
+    for part in profiles:
+        output_file.write(part)
+    logger.debug("Writing segmented profile file: complete!")
+
+
+class SegmentContainerWriter(object):
+    """
+    Writes the profiles of many segments into a single file.
+
+    The file starts with a DatasetSegmentHeader with the container layout_version. The profiles follow it in
+    the order they were written, each one laid out like the profile of an unsegmented file: a
+    DatasetProfileHeader followed by its column chunks. The profiles are streamed to the destination as they
+    are written, and close appends the index: a second DatasetSegmentHeader listing the segments with the
+    offset of each segment's profile from the end of the first header, then the size of the index as an
+    8 byte little-endian integer.
+
+    Use SegmentContainerReader to read a single segment back without reading the others.
+    """
+
+    def __init__(self, dest: Union[str, IO[bytes]]) -> None:
+        if isinstance(dest, str):
+            self._file: IO[bytes] = open(dest, "w+b", buffering=_WRITE_BUFFER_SIZE)
+            self._owns_file = True
+        else:
+            self._file = dest
+            self._owns_file = False
+        self._index = DatasetSegmentHeader(has_segments=True, layout_version=_CONTAINER_LAYOUT)
+        self._size = 0
+        self._closed = False
+        self._file.write(WHYLOGS_MAGIC_HEADER_BYTES)
+        write_delimited_protobuf(self._file, DatasetSegmentHeader(has_segments=True, layout_version=_CONTAINER_LAYOUT))
+
+    def write(self, view: SegmentedDatasetProfileView) -> None:
+        if self._closed:
+            raise ValueError("Cannot write to a closed SegmentContainerWriter")
+        segment_message = view._segment_message()
+        self._index.offsets[len(self._index.segments)] = self._size
+        self._index.segments.append(segment_message)
+        for part in view._serialized_profile_parts():
+            self._file.write(part)
+            self._size += len(part)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            index = serialize_delimited_protobuf(self._index)
+            self._file.write(index)
+            self._file.write(struct.pack(_INDEX_SIZE_FORMAT, len(index)))
+            logger.debug(f"Wrote {len(self._index.segments)} segments to the container")
+        finally:
+            if self._owns_file:
+                self._file.close()
+
+    def __enter__(self) -> "SegmentContainerWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # the file is left without an index, readers reject it
+            self._closed = True
+            if self._owns_file:
+                self._file.close()
+
+
+class SegmentContainerReader(object):
+    """
+    Reads the profiles of a segmented profile file, such as one written by SegmentContainerWriter.
+
+    Only the headers and the index of the segments are read when the reader is created. Reading a segment seeks
+    to its profile using the offsets in the index, so the other segments' profiles are never read.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._segments, offsets = self._read_segments(path)
+        except Exception:
+            self._file.close()
+            raise
+        self._offsets: Dict[Segment, int] = dict(zip(self._segments, offsets))
+        self._segments_by_key: Dict[Tuple[str, ...], List[Segment]] = dict()
+        for segment in self._segments:
+            self._segments_by_key.setdefault(segment.key, []).append(segment)
+
+    def _read_segments(self, path: str) -> Tuple[List[Segment], List[int]]:
+        """Read the segments of the file and the offsets of their profiles from the end of the first header."""
+        header = DatasetProfileView._read_segment_header(self._file)  # type: ignore
+        if not header.has_segments:
+            raise DeserializationError(f"{path} is not a segmented profile file")
+        self._start_offset = self._file.tell()
+
+        if header.layout_version == _CONTAINER_LAYOUT:
+            self._file.seek(-_INDEX_SIZE_BYTES, os.SEEK_END)
+            index_size = struct.unpack(_INDEX_SIZE_FORMAT, self._file.read(_INDEX_SIZE_BYTES))[0]
+            self._file.seek(-_INDEX_SIZE_BYTES - index_size, os.SEEK_END)
+            index = read_delimited_protobuf(self._file, DatasetSegmentHeader)
+            segments = [
+                Segment(key=tuple(tag.value for tag in message.tags), parent_id=message.partition_id)
+                for message in index.segments
+            ]
+            return segments, [index.offsets[i] for i in range(len(segments))]
+
+        if header.layout_version == _SINGLE_PROFILE_LAYOUT and len(header.segments) == 1:
+            # the partition of a single segment file is in the metadata of its profile, which follows the header
+            message = header.segments[0]
+            properties = read_delimited_protobuf(self._file, DatasetProfileHeader).properties
+            parent_id = message.partition_id or properties.metadata.get(PARTITION_ID, "")
+            return [Segment(key=tuple(tag.value for tag in message.tags), parent_id=parent_id)], [0]
+
+        raise DeserializationError(
+            f"Unsupported layout {header.layout_version} for {len(header.segments)} segments in {path}"
+        )
+
+    @property
+    def segments(self) -> List[Segment]:
+        return list(self._segments)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __contains__(self, segment: Union[Segment, Tuple[str, ...]]) -> bool:
+        return segment in self._offsets or segment in self._segments_by_key
+
+    def read(self, segment: Union[Segment, Tuple[str, ...]], columns: Optional[List[str]] = None) -> DatasetProfileView:
+        """
+        Read the profile of a segment.
+
+        Args:
+            segment: the Segment, or the tuple of its segment column values when no other partition has a
+                segment with the same values.
+            columns: only read these columns.
+        """
+        if not isinstance(segment, Segment):
+            matches = self._segments_by_key.get(tuple(segment), [])
+            if len(matches) > 1:
+                raise ValueError(f"Several partitions have a segment {segment}, please pass the Segment instead")
+            if not matches:
+                raise KeyError(f"No segment {segment} in the file")
+            segment = matches[0]
+        offset = self._offsets.get(segment)
+        if offset is None:
+            raise KeyError(f"No segment {segment} in the file")
+        self._file.seek(self._start_offset + offset)
+        return DatasetProfileView._read_profile(self._file, columns=columns)  # type: ignore
+
+    def __iter__(self) -> Iterator[Tuple[Segment, DatasetProfileView]]:
+        for segment in self._segments:
+            yield segment, self.read(segment)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SegmentContainerReader":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
@@ -11,11 +11,21 @@ from whylogs.core.metrics.metrics import MetricConfig, OperationResult, register
 from whylogs.core.metrics.multimetric import MultiMetric
 from whylogs.core.preprocessing import PreprocessedColumn
 from whylogs.core.proto import MetricMessage
-from whylogs.core.stubs import np
+from whylogs.core.stubs import is_not_stub, np, pd
 from whylogs.experimental.extras.matrix_component import MatrixComponent
 
 logger = logging.getLogger(__name__)
 
+# upper bound on the size in bytes of the distance matrix computed at once
+_DISTANCE_BATCH_BYTES = 1 << 26
+
+
+def _distance_column(distances: np.ndarray) -> PreprocessedColumn:
+    # as a Series the distribution's m2 is exact for batches, a bare ndarray would get the population variance
+    if is_not_stub(pd.Series):
+        return PreprocessedColumn.apply(pd.Series(distances))
+    return PreprocessedColumn.apply(distances)
+
 
 class DistanceFunction(Enum):
     euclidean = euclidean_distances
@@ -135,11 +145,15 @@ class EmbeddingMetric(MultiMetric):
             self.submetrics[submetric][key].columnar_update(data)
 
     def columnar_update(self, data: PreprocessedColumn) -> OperationResult:
+        """
+        All the valid tensors are stacked into a single matrix, and the distances to the reference vectors
+        are computed for batches of its rows. Each batch updates the submetrics once.
+        """
         reference_dim = self.references.value.shape[1]  # number of columns in reference matrix
-        successes = 0
         failures = 0
+        matrices: List[np.ndarray] = []
         pandas_tensors = data.pandas.tensors if data.pandas.tensors is not None else []
-        for matrix in chain(data.list.tensors or [], pandas_tensors):  # TODO: stack these
+        for matrix in chain(data.list.tensors or [], pandas_tensors):
             if len(matrix.shape) == 1:
                 matrix = matrix.reshape((1, matrix.shape[0]))
             if len(matrix.shape) != 2 or matrix.shape[1] != reference_dim:
@@ -148,19 +162,24 @@ class EmbeddingMetric(MultiMetric):
                 )
                 failures += 1
                 continue
-
-            ref_dists = self.distance_fn(matrix, self.references.value)  # type: ignore
-            ref_closest = np.argmin(ref_dists, axis=1)
-
-            # TODO: reshape into a vector?
-            for i in range(ref_dists.shape[1]):
-                self._update_submetrics(f"{self.labels[i]}_distance", PreprocessedColumn.apply(ref_dists[:, i]))
-
-            closest = [self.labels[i] for i in ref_closest]
-            self._update_submetrics("closest", PreprocessedColumn.apply(np.asarray(closest)))
-            successes += 1
-
-        return OperationResult(failures, successes)
+            matrices.append(matrix)
+
+        if not matrices:
+            return OperationResult(failures, 0)
+
+        vectors = np.concatenate(matrices) if len(matrices) > 1 else matrices[0]
+        references = self.references.value
+        labels = np.asarray(self.labels)
+        batch_rows = max(1, _DISTANCE_BATCH_BYTES // (references.shape[0] * 8))
+        for start in range(0, vectors.shape[0], batch_rows):
+            ref_dists = self.distance_fn(vectors[start : start + batch_rows], references)  # type: ignore
+            for i, label in enumerate(self.labels):
+                self._update_submetrics(f"{label}_distance", _distance_column(ref_dists[:, i]))
+            # a list of str, the submetrics don't track numpy string arrays
+            closest = labels[np.argmin(ref_dists, axis=1)].tolist()
+            self._update_submetrics("closest", PreprocessedColumn.apply(closest))
+
+        return OperationResult(failures, len(matrices))
 
     @classmethod
     def from_protobuf(cls, msg: MetricMessage) -> "EmbeddingMetric":
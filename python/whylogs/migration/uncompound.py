@@ -1,4 +1,5 @@
 import logging
+import sys
 from dataclasses import dataclass
 from typing import Dict, Optional
 
@@ -10,17 +11,13 @@ from whylogs.core.metrics.condition_count_metric import ConditionCountMetric
 from whylogs.core.metrics.metric_components import IntegralComponent
 from whylogs.core.metrics.multimetric import MultiMetric
 
-try:
-    from PIL.Image import Image as ImageType  # noqa trigger ImportError if unavailable
-
-    from whylogs.extras.image_metric import ImageMetric
-except ImportError:
-    # dummy ImageMetric class so nothing will be an instance of it
-    class ImageMetric:  # type: ignore[no-redef]
-        pass
+logger = logging.getLogger(__name__)
 
 
-logger = logging.getLogger(__name__)
+def _is_image_metric(metric: Metric) -> bool:
+    # an ImageMetric only exists once its module was imported, so there is no need to import PIL to find out
+    image_metric = sys.modules.get("whylogs.extras.image_metric")
+    return image_metric is not None and isinstance(metric, image_metric.ImageMetric)
 
 
 @dataclass
@@ -77,7 +74,7 @@ def _condition_count_magic_string() -> str:
 
 
 def _uncompounded_column_name(column_name: str, metric_name: str, submetric_name: str, metric: Metric) -> str:
-    if isinstance(metric, ImageMetric) and _v0_compatible_image_feature_flag():
+    if _is_image_metric(metric) and _v0_compatible_image_feature_flag():
         return submetric_name
     return f"{column_name}.{metric_name}.{submetric_name}"
 
@@ -94,7 +91,7 @@ def _uncompound_metric(col_name: str, metric_name: str, metric: CompoundMetric)
 
 
 def _uncompounded_multimetric_column_name(column_name: str, submetric_name: str, metric: Metric) -> str:
-    if isinstance(metric, ImageMetric) and _v0_compatible_image_feature_flag():
+    if _is_image_metric(metric) and _v0_compatible_image_feature_flag():
         return submetric_name
     return f"{column_name}.{submetric_name}"
 
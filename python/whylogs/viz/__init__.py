@@ -1,10 +1,34 @@
-import IPython  # type: ignore  # noqa  # import ipython to make
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from whylogs.viz.extensions.reports.summary_drift import (  # noqa: F401
+        SummaryDriftReport,
+    )
+    from whylogs.viz.notebook_profile_viz import NotebookProfileVisualizer  # noqa: F401
+
+# the visualizers need IPython, they are only imported when they are first used
+_LAZY_ATTRIBUTES = {
+    "NotebookProfileVisualizer": "whylogs.viz.notebook_profile_viz",
+    "SummaryDriftReport": "whylogs.viz.extensions.reports.summary_drift",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
 
-from whylogs.viz.extensions.reports.summary_drift import SummaryDriftReport
-from whylogs.viz.notebook_profile_viz import NotebookProfileVisualizer
 
 __ALL__ = [
     # column
-    NotebookProfileVisualizer,
-    SummaryDriftReport,
+    "NotebookProfileVisualizer",
+    "SummaryDriftReport",
 ]
@@ -10,7 +10,6 @@ from whylogs.core.metrics import CardinalityMetric
 from whylogs.core.utils import deprecated, get_distribution_metrics
 from whylogs.core.view.column_profile_view import ColumnProfileView
 from whylogs.core.view.dataset_profile_view import DatasetProfileView
-from whylogs.extras.image_metric import ImageMetric
 from whylogs.viz.utils import (
     DescriptiveStatistics,
     QuantileStats,
@@ -151,9 +150,12 @@ def generate_profile_summary(
 
 
 def is_image_compound_metric(col_view: ColumnProfileView) -> bool:
-    if isinstance(col_view.get_metric("image"), ImageMetric):
-        return True
-    return False
+    image_metric = col_view.get_metric("image")
+    if image_metric is None:
+        return False
+    from whylogs.extras.image_metric import ImageMetric
+
+    return isinstance(image_metric, ImageMetric)
 
 
 def generate_summaries_with_drift_score(